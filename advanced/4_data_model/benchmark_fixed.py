@@ -0,0 +1,90 @@
+"""
+Per-operation speed of `Vector2`/`Vector3` compared to the general `Vector`.
+
+For d=2 and d=3 every operation is timed with `timeit` on the general
+`Vector` and on the specialized class from `vector_fixed.py`. For d=2 the
+`Vector2D` class from 2_oop_intro, which indexes a `components` tuple,
+is timed as well where it offers the operation.
+
+Run with:
+    python benchmark_fixed.py
+"""
+import importlib.util
+import timeit
+from pathlib import Path
+
+from vector import Vector
+from vector_fixed import Vector2, Vector3
+
+OOP_INTRO = Path(__file__).resolve().parent.parent / "2_oop_intro" / "vector_oop.py"
+
+OPERATIONS = {
+    "a + b": "a + b",
+    "a - b": "a - b",
+    "a * 2.5": "a * 2.5",
+    "a @ b": "a @ b",
+    "abs(a)": "abs(a)",
+    "a == b": "a == b",
+    "a.distance_to(b)": "a.distance_to(b)",
+    "a.angle_to(b)": "a.angle_to(b)",
+    "a.normalize()": "a.normalize()",
+}
+
+# The names of the same operations on Vector2D, if it has them.
+VECTOR2D_OPERATIONS = {
+    "a + b": "a + b",
+    "a - b": "a - b",
+    "a * 2.5": "a * 2.5",
+    "a @ b": "a.dot_product(b)",
+    "abs(a)": "abs(a)",
+    "a.angle_to(b)": "a.angle_with(b)",
+    "a.normalize()": "a.normalize()",
+}
+
+
+def load_vector2d() -> type:
+    """Import `Vector2D` from 2_oop_intro by file path."""
+    spec = importlib.util.spec_from_file_location("vector_oop", OOP_INTRO)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Vector2D
+
+
+def nanoseconds(statement: str, a: object, b: object, number: int = 200_000) -> float:
+    """Return the best time of one execution of the statement in ns."""
+    timer = timeit.Timer(statement, globals={"a": a, "b": b})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e9
+
+
+def main() -> None:
+    vector2d = load_vector2d()
+    for fixed_class, components_a, components_b in (
+        (Vector2, [1.5, -2.0], [0.5, 3.0]),
+        (Vector3, [1.5, -2.0, 4.0], [0.5, 3.0, -1.0]),
+    ):
+        name = fixed_class.__name__
+        columns = ["Vector", name, "speedup"]
+        if fixed_class is Vector2:
+            columns.append("Vector2D")
+        print(f"\nd={len(components_a)}, ns per operation")
+        print(f"{'operation':<20}" + "".join(f"{title:>10}" for title in columns))
+        for title, statement in OPERATIONS.items():
+            general = nanoseconds(
+                statement, Vector(components_a), Vector(components_b)
+            )
+            fixed = nanoseconds(
+                statement, fixed_class(components_a), fixed_class(components_b)
+            )
+            row = f"{title:<20}{general:>10.0f}{fixed:>10.0f}{general / fixed:>9.1f}x"
+            if fixed_class is Vector2:
+                oop_statement = VECTOR2D_OPERATIONS.get(title)
+                if oop_statement is None:
+                    row += f"{'-':>10}"
+                else:
+                    a, b = vector2d(*components_a), vector2d(*components_b)
+                    row += f"{nanoseconds(oop_statement, a, b):>10.0f}"
+            print(row)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Crossover benchmark: KD-tree (`VectorIndex`) versus brute force.
+
+For every dimension the script builds an index over random vectors and
+times nearest-neighbour queries with
+    - `min(vectors, key=q.distance_to)` (brute force over Vector objects),
+    - a NumPy brute force scan over all vectors at once,
+    - `VectorIndex.nearest`.
+In low dimensions the tree wins clearly. With growing dimension it has
+to visit more and more cells, and the NumPy scan overtakes it.
+
+Run with:
+    python benchmark_index.py [number of vectors]
+"""
+import random
+import sys
+import time
+
+import numpy as np
+
+from vector import Vector
+from vector_index import VectorIndex
+
+
+def time_queries(function, queries) -> float:
+    """Return the mean time per query in microseconds."""
+    start = time.perf_counter()
+    for query in queries:
+        function(query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main(count: int = 20_000, query_count: int = 50) -> None:
+    random.seed(42)
+    print(f"{count} vectors, mean time per nearest() query in microseconds")
+    header = ["build [s]", "min()", "numpy scan", "KD-tree"]
+    print(f"{'dim':>5}" + "".join(f"{title:>12}" for title in header) + "  winner")
+    for dim in (2, 3, 5, 8, 16, 32, 64):
+        def random_vector():
+            return Vector([random.random() for _ in range(dim)])
+
+        vectors = [random_vector() for _ in range(count)]
+        queries = [random_vector() for _ in range(query_count)]
+
+        start = time.perf_counter()
+        index = VectorIndex(vectors)
+        build_time = time.perf_counter() - start
+
+        points = np.array(vectors)
+
+        def numpy_scan(query):
+            difference = points - np.asarray(query)
+            squared = np.einsum("ij,ij->i", difference, difference)
+            return vectors[int(np.argmin(squared))]
+
+        def brute_force_min(query):
+            return min(vectors, key=query.distance_to)
+
+        brute_force = time_queries(brute_force_min, queries[:5])
+        scan = time_queries(numpy_scan, queries)
+        tree = time_queries(index.nearest, queries)
+        winner = "KD-tree" if tree < scan else "numpy scan"
+        timings = f"{brute_force:>12.0f}{scan:>12.0f}{tree:>12.0f}"
+        print(f"{dim:>5}{build_time:>12.3f}{timings}  {winner}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
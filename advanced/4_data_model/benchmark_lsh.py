@@ -0,0 +1,85 @@
+"""
+Recall versus latency of `AngularLSHIndex` compared to exhaustive search.
+
+The data set consists of random directions with a few noisy copies each,
+like embeddings of near-duplicate documents. For every LSH setting the
+script reports the recall@k (share of the true k nearest neighbours by
+angle that were found) and the mean time per query, next to an exhaustive
+`angle_to` scan and an exhaustive NumPy scan.
+
+Run with:
+    python benchmark_lsh.py [number of vectors] [dimension]
+"""
+import sys
+import time
+
+import numpy as np
+
+from vector import Vector
+from vector_lsh import AngularLSHIndex, exhaustive_angle_search
+
+SETTINGS = [
+    # (tables, bits, probes)
+    (4, 16, 0),
+    (8, 14, 0),
+    (8, 14, 2),
+    (16, 12, 0),
+    (16, 12, 2),
+    (32, 10, 2),
+]
+
+
+def make_data(count: int, dim: int, k: int, rng) -> tuple[list, list]:
+    """Return clustered data vectors and queries close to some of them."""
+    centers = rng.standard_normal((count // k, dim))
+    points = np.repeat(centers, k, axis=0)
+    points += 0.5 * rng.standard_normal(points.shape)
+    queries = centers[:50] + 0.5 * rng.standard_normal((50, dim))
+    vectors = [Vector.from_numpy(p) for p in points]
+    return vectors, [Vector.from_numpy(q) for q in queries]
+
+
+def main(count: int = 20_000, dim: int = 64, k: int = 10) -> None:
+    rng = np.random.default_rng(42)
+    vectors, queries = make_data(count, dim, k, rng)
+    points = np.array(vectors)
+    unit_points = points / np.linalg.norm(points, axis=1)[:, np.newaxis]
+
+    def numpy_scan(query):
+        return np.argpartition(-(unit_points @ np.asarray(query)), k)[:k]
+
+    truth = [set(numpy_scan(q).tolist()) for q in queries]
+
+    start = time.perf_counter()
+    for query in queries[:3]:
+        exhaustive_angle_search(vectors, query, k)
+    angle_time = (time.perf_counter() - start) / 3 * 1e3
+
+    start = time.perf_counter()
+    for query in queries:
+        numpy_scan(query)
+    scan_time = (time.perf_counter() - start) / len(queries) * 1e3
+
+    print(f"{count} vectors, d={dim}, recall@{k}, mean time per query")
+    print(f"{'method':<34}{'recall':>8}{'ms/query':>10}")
+    print(f"{'exhaustive angle_to':<34}{1.0:>8.2f}{angle_time:>10.2f}")
+    print(f"{'exhaustive numpy scan':<34}{1.0:>8.2f}{scan_time:>10.2f}")
+
+    row_of = {id(v): row for row, v in enumerate(vectors)}
+    for tables, bits, probes in SETTINGS:
+        index = AngularLSHIndex(
+            vectors, tables=tables, bits=bits, probes=probes, seed=0
+        )
+        found = 0
+        start = time.perf_counter()
+        results = [index.query(query, k) for query in queries]
+        lsh_time = (time.perf_counter() - start) / len(queries) * 1e3
+        for result, expected in zip(results, truth):
+            found += len({row_of[id(v)] for _, v in result} & expected)
+        recall = found / (k * len(queries))
+        name = f"LSH tables={tables} bits={bits} probes={probes}"
+        print(f"{name:<34}{recall:>8.2f}{lsh_time:>10.2f}")
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
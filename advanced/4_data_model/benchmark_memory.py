@@ -0,0 +1,65 @@
+"""
+Memory footprint of the different Vector implementations.
+
+Compares the compact `array('d')` Vector from this folder with the
+tuple-based versions from 5_inheritance (tuple subclass) and 7_testing
+(`_components` tuple plus instance `__dict__`).
+
+Run with:
+    python benchmark_memory.py
+"""
+import importlib.util
+import random
+import tracemalloc
+from pathlib import Path
+
+ADVANCED = Path(__file__).resolve().parent.parent
+
+IMPLEMENTATIONS = {
+    "4_data_model (array + __slots__)": ADVANCED / "4_data_model" / "vector.py",
+    "5_inheritance (tuple subclass)": ADVANCED / "5_inheritance" / "vector.py",
+    "7_testing (tuple + __dict__)": ADVANCED / "7_testing" / "vector.py",
+}
+
+
+def load_vector_class(path: Path) -> type:
+    """Import the Vector class from a file without clashing module names."""
+    module_name = f"vector_{path.parent.name}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.Vector
+
+
+def bytes_per_vector(vector_class: type, dim: int, count: int = 1000) -> float:
+    """
+    Measure the average memory held by one vector of the given dimension.
+
+    Fresh floats are created for every vector, so no component objects
+    are shared with the input data.
+    """
+    tracemalloc.start()
+    vectors = [vector_class([random.random() for _ in range(dim)]) for _ in range(count)]
+    allocated, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del vectors
+    return allocated / count
+
+
+def main() -> None:
+    classes = {name: load_vector_class(path) for name, path in IMPLEMENTATIONS.items()}
+    dims = [3, 128, 1024]
+    baseline = "4_data_model (array + __slots__)"
+
+    print(f"{'implementation':<36}" + "".join(f"{f'd={d}':>18}" for d in dims))
+    results = {name: [bytes_per_vector(cls, d) for d in dims] for name, cls in classes.items()}
+    for name, sizes in results.items():
+        cells = "".join(
+            f"{size:>10.0f} B {size / results[baseline][i]:>4.1f}x"
+            for i, size in enumerate(sizes)
+        )
+        print(f"{name:<36}{cells}")
+
+
+if __name__ == "__main__":
+    main()
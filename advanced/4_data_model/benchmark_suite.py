@@ -0,0 +1,271 @@
+"""
+Speed and memory of the three Vector implementations across dimensions.
+
+Times every public operation of the `Vector` classes from 4_data_model
+(`array('d')` + `__slots__`), 5_inheritance (tuple subclass) and
+7_testing (`_components` tuple + `__dict__`) for dimensions 2 to 10^5,
+and measures the memory of one instance with `tracemalloc`.
+
+Every statement is run with `timeit`; the number of loops grows until
+one measurement takes at least `--min-time` seconds, and the best of
+`--repeat` measurements is reported as operations per second. Sorting
+is timed on a list of vectors whose length shrinks with the dimension
+(see `sort_count`), so one "op" is a whole `sorted()` call.
+
+Notes:
+    - The Vector of 4_data_model caches its hash, so `hash(a)` measures
+      the cache hit after the first call; the tuple-based versions hash
+      all components every time.
+    - Operations an implementation does not offer (checked with
+      `REQUIRED_ATTRIBUTES`) are recorded as null. Any error raised
+      while timing is a bug and stops the run.
+
+The results are written to a JSON file together with the git commit,
+so runs on different commits can be compared:
+
+    python benchmark_suite.py --output before.json
+    git checkout other-branch
+    python benchmark_suite.py --output after.json --compare before.json
+
+Run with:
+    python benchmark_suite.py [--dims 2 100 10000] [--repeat 3] [--min-time 0.05]
+"""
+import argparse
+import json
+import platform
+import random
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Union
+
+from benchmark_memory import IMPLEMENTATIONS, bytes_per_vector, load_vector_class
+
+DIMS = [2, 10, 100, 1_000, 10_000, 100_000]
+
+# Statements timed for every implementation. Available names: `Vector`,
+# `components` (a list of floats), `a`, `b` (vectors) and `vectors`.
+OPERATIONS = {
+    "construct": "Vector(components)",
+    "len(a)": "len(a)",
+    "a[0]": "a[0]",
+    "list(a)": "list(a)",
+    "a.components": "a.components",
+    "repr(a)": "repr(a)",
+    "a + b": "a + b",
+    "a - b": "a - b",
+    "-a": "-a",
+    "a * 2.5": "a * 2.5",
+    "a / 2.5": "a / 2.5",
+    "a @ b": "a @ b",
+    "abs(a)": "abs(a)",
+    "a == b": "a == b",
+    "a < b": "a < b",
+    "hash(a)": "hash(a)",
+    "a.normalize()": "a.normalize()",
+    "a.distance_to(b)": "a.distance_to(b)",
+    "a.angle_to(b)": "a.angle_to(b)",
+    "sorted(vectors)": "sorted(vectors)",
+}
+
+# The class attribute an operation needs beyond the basic sequence
+# protocol. An implementation without it does not offer the operation.
+REQUIRED_ATTRIBUTES = {
+    "a.components": "components",
+    "-a": "__neg__",
+    "a / 2.5": "__truediv__",
+    "a @ b": "__matmul__",
+    "abs(a)": "__abs__",
+    "hash(a)": "__hash__",
+    "a.normalize()": "normalize",
+    "a.distance_to(b)": "distance_to",
+    "a.angle_to(b)": "angle_to",
+}
+
+
+def sort_count(dim: int) -> int:
+    """Number of vectors in the list for `sorted()`, about 10^5 floats."""
+    return max(10, min(1000, 100_000 // dim))
+
+
+def memory_count(dim: int) -> int:
+    """Number of vectors created to measure the memory of one instance."""
+    return max(10, min(1000, 1_000_000 // dim))
+
+
+def supports(vector_class: type, operation: str) -> bool:
+    """
+    Return True if the class offers the operation.
+
+    >>> supports(tuple, "a @ b"), supports(tuple, "a + b")
+    (False, True)
+    """
+    attribute = REQUIRED_ATTRIBUTES.get(operation)
+    return attribute is None or getattr(vector_class, attribute, None) is not None
+
+
+def ops_per_second(
+    statement: str, namespace: dict, repeat: int, min_time: float
+) -> float:
+    """Return the best rate of the statement in operations per second."""
+    timer = timeit.Timer(statement, globals=namespace)
+    number = 1
+    while (elapsed := timer.timeit(number)) < min_time:
+        number *= max(2, min(10, int(min_time / max(elapsed, 1e-9)) + 1))
+    best = min([elapsed, *timer.repeat(repeat=repeat - 1, number=number)])
+    return number / best
+
+
+def benchmark(vector_class: type, dim: int, repeat: int, min_time: float) -> dict:
+    """Time all operations and measure the memory for one class and dimension."""
+    rng = random.Random(dim)
+
+    def random_components() -> list[float]:
+        return [rng.uniform(-1.0, 1.0) for _ in range(dim)]
+
+    namespace = {
+        "Vector": vector_class,
+        "components": random_components(),
+        "a": vector_class(random_components()),
+        "b": vector_class(random_components()),
+        "vectors": [
+            vector_class(random_components()) for _ in range(sort_count(dim))
+        ],
+    }
+    return {
+        "memory_bytes": bytes_per_vector(vector_class, dim, memory_count(dim)),
+        "sort_count": sort_count(dim),
+        "ops_per_sec": {
+            name: (
+                ops_per_second(statement, namespace, repeat, min_time)
+                if supports(vector_class, name)
+                else None
+            )
+            for name, statement in OPERATIONS.items()
+        },
+    }
+
+
+def git_commit() -> Union[str, None]:
+    """Return the current commit hash, None outside of a git checkout."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip()
+
+
+def run(dims: list[int], repeat: int, min_time: float) -> dict:
+    """Benchmark all implementations and return the JSON-ready results."""
+    results = {
+        "metadata": {
+            "commit": git_commit(),
+            "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "repeat": repeat,
+            "min_time": min_time,
+        },
+        "results": {},
+    }
+    for name, path in IMPLEMENTATIONS.items():
+        vector_class = load_vector_class(path)
+        results["results"][name] = per_dim = {}
+        for dim in dims:
+            print(f"{name}, d={dim} ...", file=sys.stderr)
+            per_dim[str(dim)] = benchmark(vector_class, dim, repeat, min_time)
+    return results
+
+
+def format_rate(rate: Union[float, None]) -> str:
+    """Format operations per second with an SI prefix, e.g. '1.2M'."""
+    if rate is None:
+        return "-"
+    for factor, prefix in ((1e9, "G"), (1e6, "M"), (1e3, "k")):
+        if rate >= factor:
+            return f"{rate / factor:.1f}{prefix}"
+    return f"{rate:.1f}"
+
+
+def print_report(results: dict) -> None:
+    """Print one table of ops/sec per dimension, implementations as columns."""
+    implementations = list(results["results"])
+    dims = list(results["results"][implementations[0]])
+    columns = [name.split(" ")[0] for name in implementations]
+    for dim in dims:
+        print(f"\nd={dim}, operations per second")
+        print(f"{'operation':<20}" + "".join(f"{title:>16}" for title in columns))
+        for operation in OPERATIONS:
+            rates = [
+                results["results"][name][dim]["ops_per_sec"].get(operation)
+                for name in implementations
+            ]
+            print(f"{operation:<20}" + "".join(f"{format_rate(r):>16}" for r in rates))
+        memory = [
+            results["results"][name][dim]["memory_bytes"] for name in implementations
+        ]
+        print(f"{'bytes per vector':<20}" + "".join(f"{m:>16.0f}" for m in memory))
+
+
+def compare(results: dict, baseline: dict, threshold: float = 0.9) -> list[str]:
+    """
+    Return the operations that got slower than `threshold` times the baseline.
+
+    >>> old = {"results": {"x": {"2": {"ops_per_sec": {"a + b": 100.0}}}}}
+    >>> new = {"results": {"x": {"2": {"ops_per_sec": {"a + b": 50.0}}}}}
+    >>> compare(new, old)
+    ['x, d=2, a + b: 0.50x']
+    >>> compare(old, new)
+    []
+    """
+    regressions = []
+    for name, per_dim in results["results"].items():
+        for dim, entry in per_dim.items():
+            old_entry = baseline["results"].get(name, {}).get(dim)
+            if old_entry is None:
+                continue
+            for operation, rate in entry["ops_per_sec"].items():
+                old_rate = old_entry["ops_per_sec"].get(operation)
+                if rate is None or not old_rate:
+                    continue
+                if rate / old_rate < threshold:
+                    regressions.append(
+                        f"{name}, d={dim}, {operation}: {rate / old_rate:.2f}x"
+                    )
+    return regressions
+
+
+def main(argv: Any = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--dims", type=int, nargs="+", default=DIMS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--min-time", type=float, default=0.05)
+    parser.add_argument("--output", type=Path, default=Path("benchmark_results.json"))
+    parser.add_argument(
+        "--compare", type=Path, help="earlier JSON results to check for regressions"
+    )
+    args = parser.parse_args(argv)
+
+    results = run(args.dims, args.repeat, args.min_time)
+    print_report(results)
+    args.output.write_text(json.dumps(results, indent=2))
+    print(f"\nResults written to {args.output}")
+
+    if args.compare is not None:
+        baseline = json.loads(args.compare.read_text())
+        regressions = compare(results, baseline)
+        print(f"\nCompared with commit {baseline['metadata'].get('commit')}:")
+        for line in regressions or ["no operation got more than 10% slower"]:
+            print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Gemeinsame Hilfen für die Tests in 4_data_model
+Die Module werden über den Dateipfad geladen, da 7_testing ebenfalls ein
+Modul namens `vector` enthält.
+"""
+import importlib.util
+import sys
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+
+
+def load_module(filename):
+    """
+    Lade ein Modul dieses Ordners unter einem eindeutigen Namen.
+
+    Jedes Modul wird nur einmal geladen, damit alle Tests dieselbe Klasse
+    `Vector` sehen. Module wie vector_matrix.py importieren `vector` über
+    den Namen, daher wird vector.py dieses Ordners nur für diesen Import
+    eingetragen.
+    """
+    name = f"{Path(filename).stem}_4_data_model"
+    if name in sys.modules:
+        return sys.modules[name]
+    vector_module = None if filename == "vector.py" else load_module("vector.py")
+    spec = importlib.util.spec_from_file_location(name, HERE / filename)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module  # für pickle
+    previous = sys.modules.get("vector")
+    if vector_module is not None:
+        sys.modules["vector"] = vector_module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[name]
+        raise
+    finally:
+        if previous is None:
+            sys.modules.pop("vector", None)
+        else:
+            sys.modules["vector"] = previous
+    return module
@@ -0,0 +1,232 @@
+"""
+Konformitäts-Tests für die Vector-Backends
+Alle Backends müssen dieselben Ergebnisse liefern wie das pure-Python-Backend.
+"""
+import math
+import os
+import random
+import subprocess
+import sys
+from array import array
+
+import pytest
+
+import vector_backends
+from conftest import HERE, load_module
+from vector_backends import BACKENDS, PureBackend
+
+Vector = load_module("vector.py").Vector
+Matrix = load_module("vector_matrix.py").Matrix
+
+
+@pytest.fixture(params=list(BACKENDS))
+def backend(request):
+    return BACKENDS[request.param]()
+
+
+@pytest.fixture(params=list(BACKENDS))
+def active_backend(request):
+    previous = vector_backends.get_backend().name
+    vector_backends.set_backend(request.param)
+    yield request.param
+    vector_backends.set_backend(previous)
+
+
+def random_components(dim, seed):
+    rng = random.Random(seed)
+    return array("d", (rng.uniform(-1e3, 1e3) for _ in range(dim)))
+
+
+class TestBackendConformance:
+    """Alle Kernels stimmen innerhalb der Toleranz mit der Referenz überein"""
+
+    @pytest.mark.parametrize("dim", [0, 1, 2, 3, 17, 1000])
+    def test_dot(self, backend, dim):
+        a, b = random_components(dim, 1), random_components(dim, 2)
+        expected = PureBackend.dot(a, b)
+        assert backend.dot(a, b) == pytest.approx(expected, rel=1e-9, abs=1e-6)
+
+    @pytest.mark.parametrize("dim", [0, 1, 2, 3, 17, 1000])
+    def test_squared_norm(self, backend, dim):
+        a = random_components(dim, 3)
+        expected = PureBackend.squared_norm(a)
+        assert backend.squared_norm(a) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("dim", [0, 1, 2, 3, 17, 1000])
+    def test_distance(self, backend, dim):
+        a, b = random_components(dim, 4), random_components(dim, 5)
+        expected = PureBackend.distance(a, b)
+        assert backend.distance(a, b) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("dim", [0, 1, 2, 3, 17, 1000])
+    def test_squared_distance(self, backend, dim):
+        a, b = random_components(dim, 7), random_components(dim, 8)
+        expected = PureBackend.squared_distance(a, b)
+        assert backend.squared_distance(a, b) == pytest.approx(expected, rel=1e-12)
+
+    @pytest.mark.parametrize("dim", [0, 1, 2, 3, 17, 1000])
+    def test_dot_and_norms(self, backend, dim):
+        a, b = random_components(dim, 9), random_components(dim, 10)
+        dot, norm2_a, norm2_b = backend.dot_and_norms(a, b)
+        assert dot == pytest.approx(PureBackend.dot(a, b), rel=1e-9, abs=1e-6)
+        assert norm2_a == pytest.approx(PureBackend.squared_norm(a), rel=1e-12)
+        assert norm2_b == pytest.approx(PureBackend.squared_norm(b), rel=1e-12)
+
+    def test_exact_small_values(self, backend):
+        assert backend.dot(array("d", [1, 2, 3]), array("d", [4, 5, 6])) == 32.0
+        assert backend.squared_norm(array("d", [3, 4])) == 25.0
+        assert backend.distance(array("d", [0, 0]), array("d", [3, 4])) == 5.0
+        zeros = array("d", [0, 0, 0])
+        assert backend.squared_distance(zeros[:2], array("d", [1, 1])) == 2.0
+        assert backend.squared_distance(zeros, array("d", [1, 1, 1])) == 3.0
+
+    def test_results_are_floats(self, backend):
+        a = random_components(5, 6)
+        assert isinstance(backend.dot(a, a), float)
+        assert isinstance(backend.distance(a, a), float)
+        assert math.isfinite(backend.squared_norm(a))
+
+    # Unter NUMPY_MATMUL_THRESHOLD (z. B. 2, 2, 2) rechnet auch das
+    # numpy-Backend mit math.sumprod, darüber mit NumPy
+    @pytest.mark.parametrize(
+        "rows, inner, cols",
+        [
+            (0, 3, 2),
+            (2, 0, 2),
+            (2, 2, 2),
+            (1, 5, 1),
+            (3, 4, 1),
+            (7, 5, 3),
+            (16, 16, 16),
+        ],
+    )
+    def test_matmul(self, backend, rows, inner, cols):
+        a = random_components(rows * inner, 11)
+        b = random_components(inner * cols, 12)
+        expected = PureBackend.matmul(a, b, rows, inner, cols)
+        result = backend.matmul(a, b, rows, inner, cols)
+        assert isinstance(result, array) and result.typecode == "d"
+        assert list(result) == pytest.approx(list(expected), rel=1e-9, abs=1e-6)
+
+    def test_matmul_exact_small_values(self, backend):
+        a = array("d", [1, 2, 3, 4, 5, 6])
+        b = array("d", [1, 0, 0, 1, 1, 1])
+        result = backend.matmul(a, b, 2, 3, 2)
+        assert list(result) == [4.0, 5.0, 10.0, 11.0]
+
+
+class TestVectorWithBackend:
+    """Die Methoden von Vector und Matrix liefern mit jedem Backend dasselbe"""
+
+    def test_vector_methods(self, active_backend):
+        a, b = random_components(50, 13), random_components(50, 14)
+        v, w = Vector(a), Vector(b)
+        dot = PureBackend.dot(a, b)
+        norm_a = math.sqrt(PureBackend.squared_norm(a))
+        norm_b = math.sqrt(PureBackend.squared_norm(b))
+        cosine = dot / (norm_a * norm_b)
+        assert vector_backends.get_backend().name == active_backend
+        assert abs(v) == pytest.approx(norm_a, rel=1e-12)
+        assert v @ w == pytest.approx(dot, rel=1e-9, abs=1e-6)
+        assert v.distance_to(w) == pytest.approx(PureBackend.distance(a, b))
+        assert v.squared_distance_to(w) == pytest.approx(
+            PureBackend.squared_distance(a, b), rel=1e-12
+        )
+        assert v.cosine_similarity(w) == pytest.approx(cosine, rel=1e-9)
+        assert v.angle_to(w) == pytest.approx(math.acos(cosine), rel=1e-9)
+
+    @pytest.mark.parametrize("dim", [2, 16])
+    def test_matrix_products(self, active_backend, dim):
+        entries = random_components(dim * dim, 15)
+        rows = [entries[i * dim : (i + 1) * dim] for i in range(dim)]
+        matrix, v = Matrix(rows), Vector(random_components(dim, 16))
+        expected = [PureBackend.dot(row, v.components) for row in rows]
+        assert list(matrix @ v) == pytest.approx(expected, rel=1e-9, abs=1e-6)
+        squared = matrix @ matrix
+        expected = PureBackend.matmul(entries, entries, dim, dim, dim)
+        assert [x for row in squared for x in row] == pytest.approx(
+            list(expected), rel=1e-9, abs=1e-6
+        )
+
+
+class CountingBackend(PureBackend):
+    """Zählt die Aufrufe der Kernels, die cosine_similarity verwendet"""
+
+    def __init__(self):
+        self.calls = []
+
+    def dot(self, a, b):
+        self.calls.append("dot")
+        return PureBackend.dot(a, b)
+
+    def squared_norm(self, a):
+        self.calls.append("squared_norm")
+        return PureBackend.squared_norm(a)
+
+    def dot_and_norms(self, a, b):
+        self.calls.append("dot_and_norms")
+        return PureBackend.dot_and_norms(a, b)
+
+
+class TestCosineSimilarityPasses:
+    """cosine_similarity berechnet nur, was noch nicht zwischengespeichert ist"""
+
+    @pytest.fixture
+    def counting(self, monkeypatch):
+        backend = CountingBackend()
+        monkeypatch.setattr(vector_backends, "active", backend)
+        return backend.calls
+
+    def test_no_cached_norm(self, counting):
+        Vector([1, 2]).cosine_similarity(Vector([3, 4]))
+        assert counting == ["dot_and_norms"]
+
+    @pytest.mark.parametrize("cached", ["self", "other"])
+    def test_one_cached_norm(self, counting, cached):
+        v, w = Vector([1, 2]), Vector([3, 4])
+        (v if cached == "self" else w)._squared_norm()
+        counting.clear()
+        assert v.cosine_similarity(w) == pytest.approx(11 / math.sqrt(125))
+        assert counting == ["dot", "squared_norm"]
+
+    def test_both_cached_norms(self, counting):
+        v, w = Vector([1, 2]), Vector([3, 4])
+        abs(v), abs(w)
+        counting.clear()
+        v.cosine_similarity(w)
+        assert counting == ["dot"]
+
+
+class TestBackendSelection:
+    """Tests für die Auswahl des Backends"""
+
+    def test_set_backend(self):
+        previous = vector_backends.get_backend().name
+        try:
+            for name in BACKENDS:
+                vector_backends.set_backend(name)
+                assert vector_backends.get_backend().name == name
+        finally:
+            vector_backends.set_backend(previous)
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            vector_backends.set_backend("unknown")
+
+    def test_unknown_backend_in_environment_falls_back(self):
+        code = "import vector; print(abs(vector.Vector([3, 4])))"
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            cwd=HERE,
+            env={**os.environ, "VECTOR_BACKEND": "unknown"},
+            text=True,
+        )
+        assert result.returncode == 0
+        assert result.stdout == "5.0\n"
+        assert "VECTOR_BACKEND='unknown'" in result.stderr
+
+
+# Führe Tests aus
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
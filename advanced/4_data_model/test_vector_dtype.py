@@ -0,0 +1,161 @@
+"""
+Tests für die float32-Speicheroption von Vector
+Die Genauigkeit von float32 wird gegenüber float64 festgeschrieben:
+gespeichert wird mit einfacher, gerechnet mit doppelter Genauigkeit.
+"""
+import math
+import pickle
+import random
+
+import pytest
+
+from conftest import load_module
+
+vector_module = load_module("vector.py")
+Vector = vector_module.Vector
+Matrix = load_module("vector_matrix.py").Matrix
+
+# Relativer Rundungsfehler von float32 (halber Abstand zur nächsten Zahl)
+FLOAT32_EPS = 2.0**-24
+
+
+def random_components(dim, seed):
+    rng = random.Random(seed)
+    return [rng.uniform(-1e3, 1e3) for _ in range(dim)]
+
+
+class TestStorage:
+    """float32 halbiert den Speicher und rundet jede Komponente einmal"""
+
+    def test_default_is_float64(self):
+        assert Vector([1, 2]).dtype == "float64"
+
+    def test_itemsize_is_halved(self):
+        components = random_components(100, 1)
+        single = Vector(components, dtype="float32")
+        double = Vector(components)
+        assert len(bytes(single)) * 2 == len(bytes(double))
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_relative_error_per_component(self, seed):
+        components = random_components(1000, seed)
+        single = Vector(components, dtype="float32")
+        for exact, stored in zip(components, single):
+            assert abs(stored - exact) <= FLOAT32_EPS * abs(exact)
+
+    def test_precision_loss_is_real(self):
+        single = Vector([0.1], dtype="float32")
+        assert single[0] != 0.1
+        assert single[0] == 0.10000000149011612
+
+    def test_exact_values_survive(self):
+        components = [0.0, 1.0, -2.5, 0.5, 1024.0]
+        stored = Vector(components, dtype="float32").components
+        assert tuple(stored) == tuple(components)
+
+    @pytest.mark.parametrize("dtype", ["int8", "float16", "complex"])
+    def test_unsupported_dtype(self, dtype):
+        with pytest.raises(ValueError, match="Unsupported dtype"):
+            Vector([1, 2], dtype=dtype)
+
+
+class TestArithmetic:
+    """Gerechnet wird in float64, gespeichert im dtype der Operanden"""
+
+    def test_result_dtype_float32_only_if_all_operands_are(self):
+        a = Vector([1, 2], dtype="float32")
+        b = Vector([3, 4], dtype="float32")
+        c = Vector([3, 4])
+        assert (a + b).dtype == "float32"
+        assert (a - b).dtype == "float32"
+        assert (a * 2).dtype == "float32"
+        assert (a / 2).dtype == "float32"
+        assert (-a).dtype == "float32"
+        assert a.normalize().dtype == "float32"
+        assert (a + c).dtype == "float64"
+        assert (c - a).dtype == "float64"
+
+    def test_scalar_results_are_float64(self):
+        a = Vector([0.1, 0.2, 0.3], dtype="float32")
+        expected = sum(x * x for x in a.components)
+        assert a @ a == expected
+        assert abs(a) == math.sqrt(expected)
+
+    def test_dot_has_float64_accuracy_on_stored_values(self):
+        components = random_components(1000, 7)
+        single = Vector(components, dtype="float32")
+        exact = math.fsum(x * x for x in single.components)
+        assert single @ single == pytest.approx(exact, rel=1e-12)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_error_relative_to_float64(self, seed):
+        a_components = random_components(100, seed)
+        b_components = random_components(100, seed + 100)
+        a64, b64 = Vector(a_components), Vector(b_components)
+        a32 = Vector(a_components, dtype="float32")
+        b32 = Vector(b_components, dtype="float32")
+        # Eine Rundung beim Speichern der Summe, eine je Summand
+        for exact, stored in zip(a64 + b64, a32 + b32):
+            assert stored == pytest.approx(exact, rel=3 * FLOAT32_EPS, abs=1e-3)
+        assert abs(a32) == pytest.approx(abs(a64), rel=FLOAT32_EPS)
+        assert a32.distance_to(b32) == pytest.approx(
+            a64.distance_to(b64), rel=1e-6
+        )
+
+
+class TestMatrix:
+    """Matrix-Produkte akzeptieren float32-Vektoren wie float64-Vektoren"""
+
+    @pytest.mark.parametrize("seed", range(3))
+    def test_apply_matches_matmul(self, seed):
+        matrix = Matrix([random_components(4, seed + i) for i in range(3)])
+        vectors = [
+            Vector(random_components(4, seed + 10 + i), dtype="float32")
+            for i in range(5)
+        ]
+        results = matrix.apply(vectors)
+        for vector, result in zip(vectors, results):
+            expected = matrix @ vector
+            assert list(result) == pytest.approx(list(expected), rel=1e-12)
+            assert list(result) == pytest.approx(
+                list(matrix @ Vector(vector)), rel=1e-12
+            )
+
+    def test_apply_accepts_views(self):
+        vector = Vector([1, 2, 3, 4], dtype="float32")
+        (result,) = Matrix([[1, 1]]).apply([vector[1:3]])
+        assert result.components.tolist() == [5.0]
+
+
+class TestConversion:
+    """dtype bleibt bei Serialisierung und Konvertierung erhalten"""
+
+    def test_pickle_keeps_dtype(self):
+        single = Vector([0.1, 0.2], dtype="float32")
+        restored = pickle.loads(pickle.dumps(single))
+        assert restored.dtype == "float32"
+        assert restored.components == single.components
+
+    def test_frombuffer_keeps_precision(self):
+        single = Vector([0.1, 0.2], dtype="float32")
+        assert Vector.frombuffer(single).dtype == "float32"
+        assert Vector.frombuffer(single, dtype="float64").dtype == "float64"
+
+    def test_numpy_roundtrip(self):
+        np = pytest.importorskip("numpy")
+        single = Vector([0.1, 0.2], dtype="float32")
+        values = np.asarray(single)
+        assert values.dtype == np.float32
+        assert Vector.from_numpy(values, dtype="float32").components == (
+            single.components
+        )
+
+    def test_numpy_conversion_without_copy(self):
+        np = pytest.importorskip("numpy")
+        VectorArray = load_module("vector_array.py").VectorArray
+        batch = VectorArray([[0.1, 0.2]], dtype="float32")
+        assert np.shares_memory(batch.__array__(np.float32, copy=False), batch)
+        assert batch.__array__(np.float64).dtype == np.float64
+        for value in (Vector([0.1, 0.2], dtype="float32"), batch):
+            with pytest.raises(ValueError, match="needs a copy"):
+                value.__array__(np.float64, copy=False)
@@ -0,0 +1,102 @@
+"""
+Tests für Vector2 und Vector3
+Die von Vector geerbten Konstruktoren prüfen Länge und dtype, und der
+Rückfall auf die Methoden von Vector baut das Array nur einmal.
+"""
+import pytest
+
+from conftest import load_module
+
+Vector = load_module("vector.py").Vector
+fixed_module = load_module("vector_fixed.py")
+Vector2 = fixed_module.Vector2
+Vector3 = fixed_module.Vector3
+
+
+@pytest.fixture(params=[(Vector2, 2), (Vector3, 3)], ids=["Vector2", "Vector3"])
+def fixed(request):
+    return request.param
+
+
+class TestConstructors:
+    """frombuffer, from_floats und from_numpy liefern die feste Klasse"""
+
+    def test_frombuffer(self, fixed):
+        cls, dim = fixed
+        v = cls.frombuffer(Vector(range(dim)))
+        assert type(v) is cls
+        assert list(v) == [float(i) for i in range(dim)]
+
+    def test_frombuffer_wrong_length(self, fixed):
+        cls, dim = fixed
+        with pytest.raises(ValueError, match=f"exactly {dim} components"):
+            cls.frombuffer(Vector(range(dim + 1)))
+
+    def test_frombuffer_float32(self, fixed):
+        cls, dim = fixed
+        single = Vector(range(dim), dtype="float32")
+        with pytest.raises(ValueError, match="float64"):
+            cls.frombuffer(single)
+        v = cls.frombuffer(single, dtype="float64")
+        assert type(v) is cls and v.dtype == "float64"
+
+    def test_from_floats(self, fixed):
+        cls, dim = fixed
+        assert type(cls.from_floats([1.5] * dim)) is cls
+        with pytest.raises(ValueError):
+            cls.from_floats([1.5] * (dim - 1))
+        with pytest.raises(ValueError):
+            cls.from_floats([1.5] * dim, dtype="float32")
+
+    def test_from_numpy(self, fixed):
+        np = pytest.importorskip("numpy")
+        cls, dim = fixed
+        v = cls.from_numpy(np.arange(dim))
+        assert type(v) is cls
+        assert list(v) == [float(i) for i in range(dim)]
+        with pytest.raises(ValueError):
+            cls.from_numpy(np.arange(dim + 1))
+
+
+class TestInterface:
+    """Vector2 und Vector3 verhalten sich wie Vector"""
+
+    def test_pos_returns_self(self, fixed):
+        cls, dim = fixed
+        v = cls(range(dim))
+        assert +v is v
+
+    def test_components_built_once(self, fixed):
+        cls, dim = fixed
+        v = cls(range(dim))
+        assert v._components is v._components
+        assert v.components.obj is v._components
+        assert v[1:].base is v
+
+    def test_fallback_matches_vector(self, fixed):
+        cls, dim = fixed
+        v, w = cls(range(1, dim + 1)), Vector(range(dim, 0, -1))
+        general = Vector(range(1, dim + 1))
+        assert (v + w).components.tolist() == (general + w).components.tolist()
+        assert v @ w == general @ w
+        assert v.cosine_similarity(w) == general.cosine_similarity(w)
+        assert hash(v) == hash(general)
+
+
+class TestProfile:
+    """Das Profiling zählt die Vektoren aus _new und stellt _new wieder her"""
+
+    def test_new_is_counted_and_restored(self):
+        profile = load_module("vector_profile.py").profile
+        new = Vector2._new
+        with profile(Vector, Vector2) as stats:
+            Vector2([1, 2]) * 2
+        assert stats["Vector2.__mul__"].allocations == 1
+        assert stats["Vector2._new"].calls == 1
+        assert Vector2._new is new
+        assert new.__globals__["_new"] is new
+
+
+# Führe Tests aus
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
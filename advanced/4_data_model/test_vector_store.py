@@ -0,0 +1,130 @@
+"""
+Tests für VectorStore
+Vektoren werden ohne Kopie als Sichten auf die gemappte Datei gelesen.
+"""
+import gc
+import warnings
+
+import pytest
+
+from conftest import load_module
+
+vector_module = load_module("vector.py")
+store_module = load_module("vector_store.py")
+Vector = vector_module.Vector
+VectorView = vector_module.VectorView
+VectorStore = store_module.VectorStore
+StoreSlice = store_module.StoreSlice
+write_vectors = store_module.write_vectors
+
+
+@pytest.fixture
+def path(tmp_path):
+    path = tmp_path / "vectors.vecs"
+    write_vectors(path, [Vector([i, -i, 2 * i]) for i in range(10)])
+    return path
+
+
+class TestZeroCopy:
+    """Indizes und Slices lesen die Datei, ohne Komponenten zu kopieren"""
+
+    def test_item_is_view_on_mapping(self, path):
+        np = pytest.importorskip("numpy")
+        store = VectorStore(path)
+        vector = store[3]
+        assert isinstance(vector, VectorView)
+        assert vector.base is store
+        assert vector.components.tolist() == [3.0, -3.0, 6.0]
+        assert np.shares_memory(np.asarray(vector), store.to_numpy())
+        del vector
+        store.close()
+
+    def test_slice_is_lazy(self, path):
+        with VectorStore(path) as store:
+            part = store[1::3]
+            assert isinstance(part, StoreSlice)
+            assert len(part) == 3
+            assert len(store[: 10**12]) == 10
+            assert [v[0] for v in part] == [1.0, 4.0, 7.0]
+            assert [v[0] for v in part[::-1]] == [7.0, 4.0, 1.0]
+            with pytest.raises(IndexError):
+                part[3]
+            del part
+
+    def test_float32_views(self, tmp_path):
+        path = tmp_path / "single.vecs"
+        write_vectors(path, [Vector([0.1, 0.2])], dtype="float32")
+        with VectorStore(path) as store:
+            vector = store[0]
+            assert vector.dtype == "float32"
+            assert vector.components.tolist() == (
+                Vector([0.1, 0.2], dtype="float32").components.tolist()
+            )
+            del vector
+
+
+class TestRoundTrip:
+    """Sichten und Vektoren beider dtypes lassen sich schreiben und lesen"""
+
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_views_round_trip(self, tmp_path, dtype):
+        path = tmp_path / "views.vecs"
+        source = Vector([1, 2, 3, 4], dtype=dtype)
+        assert write_vectors(path, [source[0:2], source[2:4]], dtype=dtype) == 2
+        with VectorStore(path) as store:
+            assert [v.components.tolist() for v in store] == [[1.0, 2.0], [3.0, 4.0]]
+
+    def test_views_of_store_round_trip(self, path, tmp_path):
+        copy = tmp_path / "copy.vecs"
+        with VectorStore(path) as store:
+            write_vectors(copy, store[::2])
+            write_vectors(tmp_path / "single.vecs", store[1:3], dtype="float32")
+        with VectorStore(copy) as store:
+            assert [v[0] for v in store] == [0.0, 2.0, 4.0, 6.0, 8.0]
+        with VectorStore(tmp_path / "single.vecs") as store:
+            assert store.dtype == "float32"
+            assert store[1].components.tolist() == [2.0, -2.0, 4.0]
+
+    def test_mixed_dtypes_are_converted(self, tmp_path):
+        path = tmp_path / "mixed.vecs"
+        vectors = [Vector([0.5, 1], dtype="float32")[0:2], Vector([2, 4])[0:2]]
+        write_vectors(path, vectors)
+        with VectorStore(path) as store:
+            assert [v.components.tolist() for v in store] == [[0.5, 1.0], [2.0, 4.0]]
+
+    def test_view_with_wrong_dim_is_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            write_vectors(tmp_path / "bad.vecs", [Vector([1, 2, 3])[0:2]], dim=3)
+
+
+class TestLifetime:
+    """Sichten halten die Abbildung am Leben, close() meldet das"""
+
+    def test_close_without_views_is_silent(self, path):
+        store = VectorStore(path)
+        store[0].copy()
+        gc.collect()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            store.close()
+
+    def test_close_with_views_warns(self, path):
+        store = VectorStore(path)
+        vector = store[2]
+        with pytest.warns(ResourceWarning, match="still use its mapping"):
+            store.close()
+        assert vector.components.tolist() == [2.0, -2.0, 4.0]
+
+    def test_views_survive_extend(self, path):
+        with VectorStore(path, mode="r+") as store:
+            vector = store[9]
+            store.extend([Vector([1, 1, 1])] * 100)
+            assert len(store) == 110
+            assert vector.components.tolist() == [9.0, -9.0, 18.0]
+            assert store[109] == Vector([1, 1, 1])
+            del vector
+
+
+# Führe Tests aus
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,107 @@
+"""
+Tests für VectorView und die Property components
+Slices und components teilen sich den Speicher mit dem Vektor, statt
+die Komponenten zu kopieren.
+"""
+import pickle
+
+import pytest
+
+import vector_backends
+from conftest import load_module
+
+vector_module = load_module("vector.py")
+Vector = vector_module.Vector
+VectorView = vector_module.VectorView
+
+
+@pytest.fixture(params=list(vector_backends.BACKENDS))
+def backend(request):
+    previous = vector_backends.get_backend().name
+    vector_backends.set_backend(request.param)
+    yield request.param
+    vector_backends.set_backend(previous)
+
+
+class TestNoCopy:
+    """Weder Slices noch components kopieren die Komponenten"""
+
+    def test_components_shares_storage(self):
+        v = Vector(range(5))
+        assert v.components.obj is v._components
+        assert v.components.readonly
+
+    def test_components_is_not_a_tuple(self):
+        # Inkompatibel zu früher: components war ein Tupel
+        v = Vector([1, 2])
+        assert isinstance(v.components, memoryview)
+        assert v.components != (1.0, 2.0)
+        assert tuple(v.components) == (1.0, 2.0)
+        x, y = v.components
+        assert (x, y) == (1.0, 2.0)
+        with pytest.raises(TypeError):
+            v.components + (3.0,)
+
+    def test_slice_is_view(self):
+        v = Vector(range(10))
+        window = v[2:8]
+        assert isinstance(window, VectorView)
+        assert window.base is v
+        assert window.components.obj is v._components
+
+    def test_view_of_view_keeps_root(self):
+        v = Vector(range(10))
+        inner = v[2:8][1:3]
+        assert inner.base is v
+        assert inner.components.tolist() == [3.0, 4.0]
+
+    def test_shares_memory_with_numpy(self):
+        np = pytest.importorskip("numpy")
+        v = Vector(range(10))
+        assert np.shares_memory(np.asarray(v[3:7]), np.asarray(v))
+
+    @pytest.mark.parametrize("index", [slice(None, None, 2), slice(None, None, -1)])
+    def test_step_slice_is_copy(self, index):
+        v = Vector(range(6))
+        result = v[index]
+        assert type(result) is Vector
+        assert result.components.tolist() == list(range(6))[index]
+
+    def test_views_cannot_be_created_directly(self):
+        with pytest.raises(TypeError):
+            VectorView([1, 2])
+
+
+class TestViewBehavior:
+    """Ein VectorView verhält sich wie ein Vector mit denselben Komponenten"""
+
+    @pytest.mark.parametrize("dtype", ["float64", "float32"])
+    def test_operations_match_copy(self, backend, dtype):
+        v = Vector([0.5, 1, 2, 3, 4, 5, 6], dtype=dtype)
+        w = Vector([6, 5, 4, 3, 2, 1, 0.5], dtype=dtype)
+        view, other = v[1:6], w[1:6]
+        copy, other_copy = view.copy(), other.copy()
+        assert view.dtype == copy.dtype == dtype
+        assert (view + other).components.tolist() == (
+            (copy + other_copy).components.tolist()
+        )
+        assert (view * 2).components.tolist() == (copy * 2).components.tolist()
+        assert view @ other == copy @ other_copy
+        assert abs(view) == abs(copy)
+        assert view.distance_to(other) == copy.distance_to(other_copy)
+
+    def test_hash_and_equality_match_copy(self):
+        view = Vector(range(10))[2:5]
+        assert view == Vector([2, 3, 4])
+        assert hash(view) == hash(Vector([2, 3, 4]))
+
+    def test_pickle_returns_vector(self):
+        view = Vector(range(10))[2:5]
+        restored = pickle.loads(pickle.dumps(view))
+        assert type(restored) is Vector
+        assert restored.components.tolist() == [2.0, 3.0, 4.0]
+
+
+# Führe Tests aus
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -1,8 +1,77 @@
 import math
 import numbers
+import os
+import sys
+import weakref
+from array import array
 from functools import total_ordering
+from itertools import batched
 from typing import Any, Iterator, Union, Iterable
 
+import vector_backends
+
+# Storage types of the components: dtype name -> `array` typecode. Arithmetic
+# always runs on Python floats (float64); only the stored values are rounded.
+DTYPES = {"float64": "d", "float32": "f"}
+_DTYPE_NAMES = {typecode: name for name, typecode in DTYPES.items()}
+
+# `math.isclose` on the magnitudes (default rel_tol=1e-9) is the same test
+# as `math.isclose` on the squared magnitudes with this tolerance, which
+# needs no square root.
+NORM2_REL_TOL = 1 - (1 - 1e-9) ** 2
+
+# Canonical instances handed out by `Vector.intern`, keyed by the typecode and
+# the raw bytes of the components. Entries disappear once no vector references
+# them anymore.
+_intern_pool: "weakref.WeakValueDictionary[bytes, Vector]" = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _typecode(dtype: Any) -> str:
+    """
+    Return the `array` typecode for a dtype name, `float` or a NumPy dtype.
+
+    >>> _typecode("float32"), _typecode(float)
+    ('f', 'd')
+    >>> _typecode("int8")
+    Traceback (most recent call last):
+    ValueError: Unsupported dtype 'int8'. Choose from: float64, float32.
+    """
+    name = getattr(dtype, "__name__", None) or str(dtype)
+    if name == "float":
+        name = "float64"
+    try:
+        return DTYPES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unsupported dtype {dtype!r}. Choose from: {', '.join(DTYPES)}."
+        ) from None
+
+
+def _storage_typecode(components: Any) -> str:
+    """Return the typecode of an `array` or the format of a memoryview."""
+    try:
+        return components.typecode
+    except AttributeError:
+        return components.format
+
+
+def _sparse_operand(other: Any) -> bool:
+    """
+    Return True for a `SparseVector` from vector_sparse.py.
+
+    The check goes through `sys.modules`: a sparse vector can only exist
+    once its module is imported, and importing it here would be circular.
+    """
+    module = sys.modules.get("vector_sparse")
+    return module is not None and isinstance(other, module.SparseVector)
+
+
+def _result_typecode(a: array, b: array) -> str:
+    """Store results as float32 only if both operands are float32."""
+    return "f" if _storage_typecode(a) == _storage_typecode(b) == "f" else "d"
+
 
 @total_ordering  # This decorator will automatically provide the __le__ and __gt__ methods based on __lt__ and __eq__
 class Vector:
@@ -19,7 +88,10 @@ class Vector:
     automatically completed using the `functools.total_ordering` decorator.
 
     Attributes:
-        _components (tuple): The components of the vector stored as an immutable tuple.
+        _components (array): The components of the vector stored as a packed
+            array of C doubles (or C floats for dtype float32). It is never
+            exposed writable, so the vector stays immutable. For a
+            `VectorView` it is a read-only memoryview on another vector.
 
     Example usage:
         >>> v1 = Vector([1, 2, 3])
@@ -49,7 +121,7 @@ class Vector:
             Return the nicely printable string representation.
 
         __eq__(other):
-            Return True if the vectors have the same components.
+            Return True if the vectors have the same magnitude.
 
         __lt__(other):
             Compare vectors based on their magnitude.
@@ -67,9 +139,17 @@ class Vector:
         __abs__():
             Return the Euclidean norm (magnitude) of the vector.
 
-        __array__(dtype=None):
+        __array__(dtype=None, copy=None):
             Convert the vector to a NumPy ndarray.
 
+        __buffer__(flags):
+            Expose the components as a read-only memoryview of doubles
+            (format 'd'), so NumPy, `array.array` and `struct` can read
+            them without copying.
+
+        frombuffer(buffer):
+            Create a vector from any object supporting the buffer protocol.
+
     Notes:
         - The class assumes immutable vectors; modification of components
           after creation is not supported.
@@ -77,15 +157,42 @@ class Vector:
             * `vector * scalar` performs scalar multiplication.
             * `vector * vector` performs element-wise multiplication.
             * `vector @ vector` computes the dot product, following NumPy convention.
+        - Each component takes 8 bytes in the packed array instead of a
+          boxed 24-byte Python float plus an 8-byte tuple slot, and
+          `__slots__` removes the per-instance `__dict__`
+          (see `benchmark_memory.py`).
+        - `abs()`, `@`, `distance_to` and `angle_to` run on the kernels of
+          the backend selected in `vector_backends` (pure Python, the C
+          functions of the `math` module, or NumPy).
+        - The squared magnitude is computed on first use and cached, so
+          sorting or comparing vectors by magnitude costs O(d) per vector
+          once and O(1) per comparison, without any square root.
+        - The hash is cached in the same way, so repeated dict and set
+          lookups with the same vector cost O(1) instead of O(d).
+        - `intern()` returns one shared instance for all vectors with the
+          same components, so recurring vectors are stored only once.
+        - `v[a:b]` returns a `VectorView` that shares the storage of `v`,
+          and `components` is a read-only memoryview on the storage, so
+          neither copies any component.
+        - With `dtype="float32"` the components are stored in single
+          precision, which halves memory and bandwidth. All arithmetic is
+          still done in float64; results are stored as float32 only if
+          every vector operand is float32. Reductions (`Vector.sum`,
+          `Vector.mean`) return float64.
 
     """
 
-    def __init__(self, components: Iterable[numbers.Real] = ()) -> None:
+    __slots__ = ("_components", "_norm2", "_hash", "__weakref__")
+
+    def __init__(
+        self, components: Iterable[numbers.Real] = (), dtype: Any = "float64"
+    ) -> None:
         """
         Initialize a vector with given components.
         Accepts any iterable of real numbers.
 
         If no components are provided, an empty vector is created.
+        The dtype is "float64" (default) or "float32".
 
         >>> Vector([1, 2.5, 3.0])
         Vector([1.0, 2.5, 3.0])
@@ -93,11 +200,216 @@ class Vector:
         Vector([0.0, 1.0, 2.0])
         >>> Vector()  # Empty vector
         Vector([])
+        >>> Vector([0.1, 0.5], dtype="float32")
+        Vector([0.10000000149011612, 0.5])
         """
         components_list = list(components)
         if any(not isinstance(c, numbers.Real) for c in components_list):
             raise TypeError("All components must be real numbers (int or float).")
-        self._components = tuple(float(c) for c in components_list)
+        self._components = array(_typecode(dtype), map(float, components_list))
+
+    @classmethod
+    def frombuffer(cls, buffer: Any, dtype: Any = None) -> "Vector":
+        """
+        Create a vector from an object supporting the buffer protocol.
+
+        The buffer must be one-dimensional and contain doubles (format 'd')
+        or floats (format 'f'), like a NumPy array, an `array('d')` or
+        another vector. Without a dtype the vector keeps the precision of
+        the buffer. Raw bytes are interpreted as packed native values of
+        the dtype, float64 by default. The data is copied once at C speed
+        without creating a Python float per component.
+
+        >>> import numpy as np
+        >>> Vector.frombuffer(np.array([1.0, 2.0, 3.0]))
+        Vector([1.0, 2.0, 3.0])
+        >>> v = Vector([1.5, -2.0])
+        >>> Vector.frombuffer(bytes(v)) == v
+        True
+        >>> Vector.frombuffer(np.array([1, 2], dtype=np.float32)).dtype
+        'float32'
+        >>> Vector.frombuffer(np.array([1, 2], dtype=np.int32))
+        Traceback (most recent call last):
+        TypeError: Buffer must contain doubles or floats (format 'd' or 'f'), got 'i'.
+        >>> Vector.frombuffer(b"abc")
+        Traceback (most recent call last):
+        ValueError: Buffer size must be a multiple of 8 bytes.
+        """
+        view = memoryview(buffer)
+        if view.ndim > 1:
+            raise ValueError("Buffer must be one-dimensional.")
+        typecode = None if dtype is None else _typecode(dtype)
+        if view.format in ("B", "b", "c"):
+            source = typecode or "d"
+            itemsize = array(source).itemsize
+            if view.nbytes % itemsize:
+                raise ValueError(
+                    f"Buffer size must be a multiple of {itemsize} bytes."
+                )
+        elif view.format.lstrip("@") in ("d", "f"):
+            source = view.format.lstrip("@")
+        else:
+            raise TypeError(
+                "Buffer must contain doubles or floats (format 'd' or 'f'), "
+                f"got {view.format!r}."
+            )
+        components = array(source)
+        components.frombytes(view.cast("B") if view.c_contiguous else view.tobytes())
+        if typecode is not None and typecode != source:
+            components = array(typecode, components)
+        return cls._from_array(components)
+
+    @classmethod
+    def from_floats(
+        cls, components: Iterable[float], dtype: Any = "float64"
+    ) -> "Vector":
+        """
+        Create a vector from an iterable of floats without per-element checks.
+
+        The values are converted by `array('d')` in C, which rejects
+        anything that is not a real number, so no `numbers.Real` check
+        and no `float()` call is needed per component.
+
+        >>> Vector.from_floats([1.0, 2.5, 3])
+        Vector([1.0, 2.5, 3.0])
+        >>> Vector.from_floats([1.0, "a"])
+        Traceback (most recent call last):
+        TypeError: All components must be real numbers (int or float).
+        """
+        typecode = _typecode(dtype)
+        try:
+            return cls._from_array(array(typecode, components))
+        except TypeError:
+            raise TypeError(
+                "All components must be real numbers (int or float)."
+            ) from None
+
+    @classmethod
+    def from_numpy(cls, values: Any, dtype: Any = "float64") -> "Vector":
+        """
+        Create a vector from a one-dimensional NumPy array.
+
+        The dtype is validated once for the whole array instead of every
+        component. Integer, unsigned and boolean arrays are converted to
+        the requested dtype, arrays that already have it are copied
+        directly from their buffer.
+
+        >>> import numpy as np
+        >>> Vector.from_numpy(np.array([1, 2, 3]))
+        Vector([1.0, 2.0, 3.0])
+        >>> Vector.from_numpy(np.arange(6.0)[::2])
+        Vector([0.0, 2.0, 4.0])
+        >>> Vector.from_numpy(np.array([1j]))
+        Traceback (most recent call last):
+        TypeError: All components must be real numbers (int or float).
+        >>> Vector.from_numpy(np.ones((2, 2)))
+        Traceback (most recent call last):
+        ValueError: NumPy array must be one-dimensional.
+        """
+        if values.dtype.kind not in "biuf":
+            raise TypeError("All components must be real numbers (int or float).")
+        if values.ndim != 1:
+            raise ValueError("NumPy array must be one-dimensional.")
+        dtype = _DTYPE_NAMES[_typecode(dtype)]
+        return cls.frombuffer(values.astype(dtype, copy=False))
+
+    @classmethod
+    def _from_array(cls, components: array) -> "Vector":
+        """
+        Wrap an `array('d')` or `array('f')` as a vector without validating
+        or copying it.
+
+        Only for internal use with arrays that no one else holds a
+        reference to, like the results of arithmetic operations.
+        """
+        vector = cls.__new__(cls)
+        vector._components = components
+        return vector
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """
+        Expose the components through the buffer protocol without copying.
+
+        The returned memoryview is read-only, which keeps the vector immutable.
+        This method is used by `memoryview()`, `bytes()`, `struct` and NumPy.
+
+        >>> v = Vector([1.0, 2.0, 3.0])
+        >>> view = memoryview(v)
+        >>> view.format, view.readonly, view.tolist()
+        ('d', True, [1.0, 2.0, 3.0])
+        >>> import struct
+        >>> struct.unpack("3d", v)
+        (1.0, 2.0, 3.0)
+        >>> from array import array
+        >>> floats = array("d")
+        >>> floats.frombytes(view.cast("B"))
+        >>> floats
+        array('d', [1.0, 2.0, 3.0])
+        >>> import numpy as np
+        >>> np.shares_memory(np.asarray(v), np.asarray(v))
+        True
+        """
+        return memoryview(self._components).toreadonly()
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Convert the vector to a NumPy ndarray.
+
+        Without a dtype or copy request the array is a read-only view on
+        the vector's storage, with the dtype of the vector. A different
+        dtype needs a copy, so it raises a ValueError with `copy=False`.
+
+        >>> import numpy as np
+        >>> v = Vector([1.0, 2.0, 3.0])
+        >>> np.array(v, copy=False)
+        array([1., 2., 3.])
+        >>> np.array(v, dtype=np.float32)
+        array([1., 2., 3.], dtype=float32)
+        >>> np.asarray(v).flags.writeable
+        False
+        >>> v.__array__(np.float32, copy=False)
+        Traceback (most recent call last):
+        ValueError: Converting a float64 Vector to float32 needs a copy.
+        """
+        import numpy as np
+
+        result = np.frombuffer(self, dtype=_storage_typecode(self._components))
+        if dtype is not None and np.dtype(dtype) != result.dtype:
+            if copy is False:
+                raise ValueError(
+                    f"Converting a {result.dtype} Vector to {np.dtype(dtype)} "
+                    "needs a copy."
+                )
+            return result.astype(dtype)
+        return result.copy() if copy else result
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the vector as a single bytes blob of packed doubles.
+
+        The cached norm and hash are not pickled; they are recomputed on
+        demand. The blob uses the native byte order of the machine and is
+        stored together with the typecode of the dtype.
+
+        >>> import pickle
+        >>> v = Vector([1.0, 2.0, 3.0])
+        >>> pickle.loads(pickle.dumps(v))
+        Vector([1.0, 2.0, 3.0])
+        >>> pickle.loads(pickle.dumps(Vector()))
+        Vector([])
+        """
+        components = self._components
+        return type(self)._from_bytes, (
+            components.tobytes(),
+            _storage_typecode(components),
+        )
+
+    @classmethod
+    def _from_bytes(cls, data: bytes, typecode: str = "d") -> "Vector":
+        """Rebuild a pickled vector from its packed values without checks."""
+        components = array(typecode)
+        components.frombytes(data)
+        return cls._from_array(components)
 
     def __repr__(self) -> str:
         """
@@ -127,17 +439,28 @@ class Vector:
         return f"<{', '.join(str(c) for c in self)}>"
 
     @property
-    def components(self) -> tuple:
+    def components(self) -> memoryview:
         """
-        Return the components of the vector as an immutable tuple.
+        Return the components as a read-only memoryview on the storage.
+
+        Nothing is copied, so the property costs O(1) for any dimension.
+        The memoryview supports `len()`, indexing, slicing, iteration and
+        unpacking. Unlike the tuple returned by earlier versions, it is
+        never equal to a tuple and cannot be concatenated with `+`; use
+        `tuple()` or `.tolist()` for that.
 
         >>> v = Vector([1.0, 2.0, 3.0])
-        >>> v.components
-        (1.0, 2.0, 3.0)
-        >>> type(v.components)
-        <class 'tuple'>
+        >>> v.components.tolist(), v.components[1:].tolist()
+        ([1.0, 2.0, 3.0], [2.0, 3.0])
+        >>> v.components == (1.0, 2.0, 3.0), tuple(v.components) == (1.0, 2.0, 3.0)
+        (False, True)
+        >>> v.components.readonly
+        True
+        >>> v.components[0] = 5.0
+        Traceback (most recent call last):
+        TypeError: cannot modify read-only memory
         """
-        return self._components
+        return memoryview(self._components).toreadonly()
 
     @components.setter
     def components(self, value: Iterable[numbers.Real]) -> None:
@@ -152,6 +475,16 @@ class Vector:
         """
         raise TypeError("Vector objects are immutable and cannot be modified.")
 
+    @property
+    def dtype(self) -> str:
+        """
+        Return the storage type of the components, "float64" or "float32".
+
+        >>> Vector([1, 2]).dtype, Vector([1, 2], dtype="float32").dtype
+        ('float64', 'float32')
+        """
+        return _DTYPE_NAMES[_storage_typecode(self._components)]
+
     # container protocol methods
     def __len__(self) -> int:
         """
@@ -168,7 +501,11 @@ class Vector:
 
     def __getitem__(self, index: Union[int, slice]) -> Union[float, "Vector"]:
         """
-        Return component at index, or a new Vector for a slice.
+        Return component at index, or a `VectorView` for a slice.
+
+        A slice with step 1 shares the storage of the vector and costs
+        O(1). Slices with another step are copied into a new `Vector`,
+        because a view must be contiguous for NumPy and `struct`.
 
         >>> v = Vector([1.0, 2.0, 3.0])
         >>> v[0]
@@ -178,12 +515,19 @@ class Vector:
         >>> v[-1]
         3.0
         >>> v[1:3]
-        (2.0, 3.0)
-        >>> v[:2]
-        (1.0, 2.0)
-        >>> v[1:1]
-        ()
+        Vector([2.0, 3.0])
+        >>> type(v[:2]).__name__
+        'VectorView'
+        >>> v[::2], v[1:1]
+        (Vector([1.0, 3.0]), Vector([]))
         """
+        if isinstance(index, slice):
+            if index.step is None or index.step == 1:
+                return VectorView._from_slice(self, index)
+            components = self._components
+            return Vector._from_array(
+                array(_storage_typecode(components), components[index])
+            )
         return self._components[index]
 
     def __setitem__(self, index: int, value: float) -> None:
@@ -232,7 +576,10 @@ class Vector:
     def __eq__(self, other: Any) -> bool:
         """
         Check if two vectors are equal.
-        Two vectors are considered equal if they have the same components.
+        Two vectors are considered equal if their magnitudes are equal
+        within the tolerance of `math.isclose`, consistent with the
+        ordering by magnitude. The cached squared magnitudes are compared,
+        so no square root is taken.
 
         >>> v1 = Vector([1.0, 2.0, 3.0])
         >>> v2 = Vector([1.0, 2.0, 3.0])
@@ -241,10 +588,34 @@ class Vector:
         >>> v3 = Vector([1.0, 2.0, 4.0])
         >>> v1 == v3
         False
+        >>> Vector([3.0, 4.0]) == Vector([0.0, 5.0])
+        True
         """
+        if self is other:
+            return True
         if not isinstance(other, Vector):
             return NotImplemented
-        return math.isclose(abs(self), abs(other))
+        return math.isclose(
+            self._squared_norm(), other._squared_norm(), rel_tol=NORM2_REL_TOL
+        )
+
+    def _squared_norm(self) -> float:
+        """
+        Return the squared magnitude, computed once and then cached.
+
+        Vectors are immutable, so the cached value can never become stale.
+
+        >>> v = Vector([3.0, 4.0])
+        >>> v._squared_norm()
+        25.0
+        >>> v._norm2
+        25.0
+        """
+        try:
+            return self._norm2
+        except AttributeError:
+            self._norm2 = vector_backends.active.squared_norm(self._components)
+            return self._norm2
 
     def __lt__(self, other: "Vector") -> bool:
         """
@@ -256,21 +627,58 @@ class Vector:
         True
         >>> v2 < v1
         False
+        >>> sorted([Vector([3.0, 4.0]), Vector([1.0]), Vector([0.0, 2.0])])
+        [Vector([1.0]), Vector([0.0, 2.0]), Vector([3.0, 4.0])]
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return abs(self) < abs(other)
+        return self._squared_norm() < other._squared_norm()
 
     def __hash__(self) -> int:
         """
         Return a hash value for the vector.
         This allows vectors to be used as keys in dictionaries or sets.
 
+        The hash is computed on first use and cached, because the
+        components never change.
+
         >>> v1 = Vector([1.0, 2.0, 3.0])
         >>> type(hash(v1))
         <class 'int'>
+        >>> hash(v1) == hash(Vector([1, 2, 3])) == v1._hash
+        True
+        """
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(tuple(self._components))
+            return self._hash
+
+    def intern(self) -> "Vector":
+        """
+        Return the shared instance for vectors with exactly these components.
+
+        Like `sys.intern` for strings: the first vector interned with given
+        components becomes the canonical instance and is returned for every
+        later vector with the same components, as long as it is referenced
+        somewhere. The pool holds only weak references, so it never keeps
+        vectors alive. Interned duplicates share memory and compare equal
+        by identity without computing any magnitude.
+
+        >>> a = Vector([1.0, 2.0]).intern()
+        >>> b = Vector([1, 2]).intern()
+        >>> a is b
+        True
+        >>> Vector([2.0, 1.0]).intern() is a
+        False
         """
-        return hash(self._components)
+        components = self._components
+        key = _storage_typecode(components).encode() + components.tobytes()
+        try:
+            return _intern_pool[key]
+        except KeyError:
+            _intern_pool[key] = self
+            return self
 
     def __neg__(self) -> "Vector":
         """
@@ -280,7 +688,10 @@ class Vector:
         >>> -v1
         Vector([-1.0, -2.0, -3.0])
         """
-        return Vector([-c for c in self])
+        components = self._components
+        return Vector._from_array(
+            array(_storage_typecode(components), [-c for c in components])
+        )
 
     def __pos__(self) -> "Vector":
         """
@@ -301,7 +712,7 @@ class Vector:
         >>> abs(Vector([1.0, 2.0, 2.0]))
         3.0
         """
-        return math.sqrt(sum(c**2 for c in self))
+        return math.sqrt(self._squared_norm())
 
     def __add__(self, other: "Vector") -> "Vector":
         """
@@ -316,7 +727,12 @@ class Vector:
             return NotImplemented
         if len(self) != len(other):
             raise ValueError("Vectors must have the same dimensionality for addition.")
-        return Vector([a + b for a, b in zip(self, other)])
+        return Vector._from_array(
+            array(
+                _result_typecode(self._components, other._components),
+                [a + b for a, b in zip(self._components, other._components)],
+            )
+        )
 
     def __sub__(self, other: "Vector") -> "Vector":
         """
@@ -333,7 +749,12 @@ class Vector:
             raise ValueError(
                 "Vectors must have the same dimensionality for subtraction."
             )
-        return self + (-other)
+        return Vector._from_array(
+            array(
+                _result_typecode(self._components, other._components),
+                [a - b for a, b in zip(self._components, other._components)],
+            )
+        )
 
     def __mul__(self, other: Union[numbers.Real, "Vector"]) -> Union["Vector", float]:
         """
@@ -347,13 +768,22 @@ class Vector:
         Vector([4.0, 10.0, 18.0])
         """
         if isinstance(other, numbers.Real):
-            return Vector([c * other for c in self])
+            other = float(other)
+            components = self._components
+            return Vector._from_array(
+                array(_storage_typecode(components), [c * other for c in components])
+            )
         elif isinstance(other, Vector):
             if len(self) != len(other):
                 raise ValueError(
                     "Vectors must have the same dimensionality for element-wise multiplication."
                 )
-            return Vector([a * b for a, b in zip(self, other)])
+            return Vector._from_array(
+                array(
+                    _result_typecode(self._components, other._components),
+                    [a * b for a, b in zip(self._components, other._components)],
+                )
+            )
         else:
             return NotImplemented
 
@@ -383,7 +813,7 @@ class Vector:
             raise ValueError(
                 "Vectors must have the same dimensionality for dot product."
             )
-        return sum(a * b for a, b in zip(self, other))
+        return vector_backends.active.dot(self._components, other._components)
 
     def __truediv__(self, scalar: numbers.Real) -> "Vector":
         """
@@ -397,7 +827,11 @@ class Vector:
             return NotImplemented
         if scalar == 0:
             raise ValueError("Division by zero is not allowed.")
-        return Vector([c / scalar for c in self])
+        scalar = float(scalar)
+        components = self._components
+        return Vector._from_array(
+            array(_storage_typecode(components), [c / scalar for c in components])
+        )
 
     def __bool__(self) -> bool:
         """
@@ -410,6 +844,62 @@ class Vector:
         """
         return any(c != 0 for c in self)
 
+    # Reductions over many vectors
+
+    @classmethod
+    def sum(cls, vectors: Iterable["Vector"]) -> "Vector":
+        """
+        Add up all vectors of an iterable in a single pass.
+
+        Unlike `functools.reduce(operator.add, vectors)`, no intermediate
+        vectors are created: the vectors are consumed in chunks, the
+        components of each chunk are summed column by column and added
+        to one `MutableVector`. Memory stays constant in the length of
+        the iterable, so generators of any size can be summed.
+
+        >>> Vector.sum([Vector([1, 2]), Vector([3, 4]), Vector([5, 6])])
+        Vector([9.0, 12.0])
+        >>> Vector.sum(Vector([i, 1]) for i in range(5))
+        Vector([10.0, 5.0])
+        >>> Vector.sum([])
+        Traceback (most recent call last):
+        ValueError: Cannot sum an empty iterable of vectors.
+        """
+        return cls._sum_and_count(vectors)[0].freeze()
+
+    @classmethod
+    def mean(cls, vectors: Iterable["Vector"]) -> "Vector":
+        """
+        Return the component-wise mean (centroid) of all vectors.
+
+        >>> Vector.mean([Vector([1, 2]), Vector([3, 4])])
+        Vector([2.0, 3.0])
+        """
+        total, count = cls._sum_and_count(vectors)
+        total /= count
+        return total.freeze()
+
+    @classmethod
+    def _sum_and_count(cls, vectors: Iterable["Vector"]) -> tuple["MutableVector", int]:
+        """Sum the vectors chunk by chunk into one accumulator."""
+        total, count = None, 0
+        for chunk in batched(vectors, 1024):
+            if not all(isinstance(v, Vector) for v in chunk):
+                raise TypeError("Vector.sum() expects an iterable of vectors.")
+            if total is None:
+                total = MutableVector.zeros(len(chunk[0]))
+            if any(len(v) != len(total) for v in chunk):
+                raise ValueError(
+                    "Vectors must have the same dimensionality for addition."
+                )
+            total += MutableVector.from_array(
+                array("d", map(sum, zip(*[v._components for v in chunk])))
+            )
+            count += len(chunk)
+        if total is None:
+            raise ValueError("Cannot sum an empty iterable of vectors.")
+        return total, count
+
     # Additional methods for advanced functionality
 
     def normalize(self) -> "Vector":
@@ -423,7 +913,10 @@ class Vector:
         magnitude = abs(self)
         if magnitude == 0:
             raise ValueError("Cannot normalize a zero vector.")
-        return self / magnitude
+        components = self._components
+        return Vector._from_array(
+            array(_storage_typecode(components), [c / magnitude for c in components])
+        )
 
     def distance_to(self, other: "Vector") -> float:
         """
@@ -435,12 +928,81 @@ class Vector:
         5.196152422706632
         """
         if not isinstance(other, Vector):
+            if _sparse_operand(other):
+                return other.distance_to(self)
             return NotImplemented
         if len(self) != len(other):
             raise ValueError(
                 "Vectors must have the same dimensionality for distance calculation."
             )
-        return abs(self - other)
+        return vector_backends.active.distance(self._components, other._components)
+
+    def squared_distance_to(self, other: "Vector") -> float:
+        """
+        Calculate the squared Euclidean distance to another vector.
+
+        Cheaper than `distance_to` and sufficient to find the closest of
+        several vectors, because the square root does not change the order.
+
+        >>> v1 = Vector([1.0, 2.0, 3.0])
+        >>> v2 = Vector([4.0, 5.0, 6.0])
+        >>> v1.squared_distance_to(v2)
+        27.0
+        """
+        if not isinstance(other, Vector):
+            if _sparse_operand(other):
+                return other.squared_distance_to(self)
+            return NotImplemented
+        if len(self) != len(other):
+            raise ValueError(
+                "Vectors must have the same dimensionality for distance calculation."
+            )
+        return vector_backends.active.squared_distance(
+            self._components, other._components
+        )
+
+    def cosine_similarity(self, other: "Vector") -> float:
+        """
+        Calculate the cosine of the angle between this vector and another vector.
+
+        If neither magnitude is cached yet, the dot product and both squared
+        magnitudes are computed in one pass over the components. Otherwise
+        the cached magnitudes are reused and only a missing one is computed
+        next to the dot product. The result is clamped to [-1, 1] and skips
+        the `acos` of `angle_to`, so it is enough for ranking vectors by
+        similarity.
+
+        >>> Vector([1.0, 0.0]).cosine_similarity(Vector([1.0, 1.0]))
+        0.7071067811865475
+        >>> Vector([1.0, 0.0]).cosine_similarity(Vector([0.0, 0.0]))
+        Traceback (most recent call last):
+        ValueError: Cannot calculate angle with a zero vector.
+        """
+        if not isinstance(other, Vector):
+            if _sparse_operand(other):
+                return other.cosine_similarity(self)
+            return NotImplemented
+        if len(self) != len(other):
+            raise ValueError(
+                "Vectors must have the same dimensionality for angle calculation."
+            )
+        backend = vector_backends.active
+        if hasattr(self, "_norm2") or hasattr(other, "_norm2"):
+            dot_product = backend.dot(self._components, other._components)
+            norm2_product = self._squared_norm() * other._squared_norm()
+        else:
+            dot_product, self._norm2, other._norm2 = backend.dot_and_norms(
+                self._components, other._components
+            )
+            norm2_product = self._norm2 * other._norm2
+
+        if norm2_product == 0:
+            raise ValueError("Cannot calculate angle with a zero vector.")
+
+        cos_theta = dot_product / math.sqrt(norm2_product)
+
+        # Clamp the value to avoid floating point errors
+        return max(-1.0, min(1.0, cos_theta))
 
     def angle_to(self, other: "Vector") -> float:
         """
@@ -451,26 +1013,312 @@ class Vector:
         >>> v1.angle_to(v2)
         1.5707963267948966
         """
-        if not isinstance(other, Vector):
+        cos_theta = self.cosine_similarity(other)
+        if cos_theta is NotImplemented:
             return NotImplemented
-        if len(self) != len(other):
+        return math.acos(cos_theta)
+
+
+class VectorView(Vector):
+    """
+    A read-only slice of a vector that shares the storage of its parent.
+
+    `v[a:b]` returns a `VectorView` in O(1): its `_components` is a
+    memoryview on the parent's storage, so no component is copied, and
+    slicing a view again gives another view on the same storage. A view
+    is a `Vector` and supports its whole read-only API; arithmetic returns
+    new plain vectors. This makes windowed computations over very long
+    vectors cost O(window) instead of O(d) per window.
+
+    The view keeps the storage of its parent alive. Call `copy()` to get
+    an independent `Vector`, e.g. before storing a small slice of a huge
+    vector for a long time. `VectorStore` hands out views as well, on the
+    memory-mapped file instead of a parent vector.
+
+    Attributes:
+        base (Vector | VectorStore): The object that owns the shared storage.
+
+    Example usage:
+        >>> v = Vector(range(10))
+        >>> window = v[2:5]
+        >>> window, window @ window, window @ Vector([1, 1, 1])
+        (Vector([2.0, 3.0, 4.0]), 29.0, 9.0)
+        >>> window[1:].base is v
+        True
+        >>> [float(v[i : i + 3] @ Vector([1, 1, 1])) for i in range(0, 8, 3)]
+        [3.0, 12.0, 21.0]
+    """
+
+    __slots__ = ("base",)
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """
+        Views are created by slicing a vector, not directly.
+
+        >>> VectorView([1, 2])
+        Traceback (most recent call last):
+        TypeError: VectorView objects are created by slicing a Vector.
+        """
+        raise TypeError("VectorView objects are created by slicing a Vector.")
+
+    @classmethod
+    def _from_slice(cls, parent: Vector, index: slice) -> "VectorView":
+        """Return a view on a contiguous slice of the parent's storage."""
+        base = parent.base if isinstance(parent, VectorView) else parent
+        return cls._from_buffer(memoryview(parent._components)[index], base)
+
+    @classmethod
+    def _from_buffer(cls, components: memoryview, base: Any) -> "VectorView":
+        """Wrap a memoryview of format 'd' or 'f' owned by `base`, read-only."""
+        view = cls.__new__(cls)
+        view._components = components.toreadonly()
+        view.base = base
+        return view
+
+    def copy(self) -> Vector:
+        """
+        Return a `Vector` with its own copy of the components.
+
+        >>> v = Vector([1, 2, 3])
+        >>> c = v[1:].copy()
+        >>> type(c).__name__, c
+        ('Vector', Vector([2.0, 3.0]))
+        """
+        components = self._components
+        return Vector._from_array(array(_storage_typecode(components), components))
+
+    def __reduce__(self) -> tuple:
+        """
+        Pickle the view as an independent `Vector`.
+
+        >>> import pickle
+        >>> restored = pickle.loads(pickle.dumps(Vector([1, 2, 3])[1:]))
+        >>> type(restored).__name__, restored
+        ('Vector', Vector([2.0, 3.0]))
+        """
+        return self.copy().__reduce__()
+
+
+class MutableVector:
+    """
+    A mutable vector used as an accumulator.
+
+    `Vector` is immutable, so `total = total + v` allocates a new vector
+    every time. A `MutableVector` keeps one buffer and updates it in
+    place with `+=`, `-=`, `*=` and `/=`. When the computation is done,
+    `freeze()` turns it into an immutable `Vector`.
+
+    Attributes:
+        _components (array): The components stored as a packed array of C
+            doubles (or C floats for dtype float32).
+
+    Example usage:
+        >>> total = MutableVector.zeros(2)
+        >>> for v in [Vector([1, 2]), Vector([3, 4])]:
+        ...     total += v
+        >>> total
+        MutableVector([4.0, 6.0])
+        >>> total *= 0.5
+        >>> total.freeze()
+        Vector([2.0, 3.0])
+
+    Notes:
+        - A `MutableVector` is not hashable and does not support the
+          comparison operators of `Vector`.
+        - The in-place operators write every component back into the
+          existing buffer, so `+=` allocates no temporary list or array.
+          With dtype float32 every result is rounded to float32 on store.
+    """
+
+    __slots__ = ("_components",)
+
+    def __init__(
+        self, components: Iterable[numbers.Real] = (), dtype: Any = "float64"
+    ) -> None:
+        """
+        Initialize the accumulator with a copy of the given components.
+        The dtype is "float64" (default) or "float32".
+
+        >>> MutableVector(Vector([1, 2]))
+        MutableVector([1.0, 2.0])
+        >>> MutableVector([0.5], dtype="float32").dtype
+        'float32'
+        >>> MutableVector(["a"])
+        Traceback (most recent call last):
+        TypeError: All components must be real numbers (int or float).
+        """
+        self._components = Vector(components, dtype=dtype)._components
+
+    @classmethod
+    def zeros(cls, dim: int, dtype: Any = "float64") -> "MutableVector":
+        """
+        Create an accumulator of the given dimension filled with zeros.
+
+        >>> MutableVector.zeros(3)
+        MutableVector([0.0, 0.0, 0.0])
+        """
+        typecode = _typecode(dtype)
+        return cls.from_array(array(typecode, bytes(array(typecode).itemsize * dim)))
+
+    @classmethod
+    def from_array(cls, components: array) -> "MutableVector":
+        """Wrap an `array('d')` or `array('f')` without copying it."""
+        vector = cls.__new__(cls)
+        vector._components = components
+        return vector
+
+    def freeze(self) -> Vector:
+        """
+        Return an immutable copy of the current state as a `Vector`.
+
+        >>> accumulator = MutableVector([1, 2])
+        >>> frozen = accumulator.freeze()
+        >>> accumulator += Vector([1, 1])
+        >>> frozen, accumulator
+        (Vector([1.0, 2.0]), MutableVector([2.0, 3.0]))
+        >>> MutableVector([1, 2], dtype="float32").freeze().dtype
+        'float32'
+        """
+        components = self._components
+        return Vector._from_array(array(components.typecode, components))
+
+    @property
+    def dtype(self) -> str:
+        """
+        Return the storage type of the components, "float64" or "float32".
+
+        >>> MutableVector.zeros(2).dtype
+        'float64'
+        """
+        return _DTYPE_NAMES[self._components.typecode]
+
+    def __repr__(self) -> str:
+        return f"MutableVector([{', '.join(str(c) for c in self)}])"
+
+    def __len__(self) -> int:
+        return len(self._components)
+
+    def __iter__(self) -> Iterator[float]:
+        return iter(self._components)
+
+    def __getitem__(self, index: int) -> float:
+        return self._components[index]
+
+    def __setitem__(self, index: int, value: numbers.Real) -> None:
+        """
+        Set a single component.
+
+        >>> v = MutableVector([1, 2])
+        >>> v[0] = 5
+        >>> v
+        MutableVector([5.0, 2.0])
+        """
+        if not isinstance(value, numbers.Real):
+            raise TypeError("All components must be real numbers (int or float).")
+        self._components[index] = float(value)
+
+    __hash__ = None
+
+    def _operand(self, other: Any, operation: str) -> Union[array, None]:
+        """Return the components of `other` after checking the dimension."""
+        if not isinstance(other, (Vector, MutableVector)):
+            return None
+        if len(other) != len(self):
             raise ValueError(
-                "Vectors must have the same dimensionality for angle calculation."
+                f"Vectors must have the same dimensionality for {operation}."
             )
+        return other._components
 
-        dot_product = self @ other
-        magnitude_self = abs(self)
-        magnitude_other = abs(other)
+    def __iadd__(self, other: Union[Vector, "MutableVector"]) -> "MutableVector":
+        """
+        Add a vector in place.
 
-        if magnitude_self == 0 or magnitude_other == 0:
-            raise ValueError("Cannot calculate angle with a zero vector.")
+        >>> v = MutableVector([1, 2])
+        >>> v += Vector([1, 1])
+        >>> v
+        MutableVector([2.0, 3.0])
+        >>> v += Vector([1])
+        Traceback (most recent call last):
+        ValueError: Vectors must have the same dimensionality for addition.
+        """
+        components = self._operand(other, "addition")
+        if components is None:
+            return NotImplemented
+        data = self._components
+        for i, value in enumerate(components):
+            data[i] += value
+        return self
+
+    def __isub__(self, other: Union[Vector, "MutableVector"]) -> "MutableVector":
+        """
+        Subtract a vector in place.
 
-        cos_theta = dot_product / (magnitude_self * magnitude_other)
+        >>> v = MutableVector([1, 2])
+        >>> v -= Vector([1, 1])
+        >>> v
+        MutableVector([0.0, 1.0])
+        """
+        components = self._operand(other, "subtraction")
+        if components is None:
+            return NotImplemented
+        data = self._components
+        for i, value in enumerate(components):
+            data[i] -= value
+        return self
 
-        # Clamp the value to avoid floating point errors
-        cos_theta = max(-1.0, min(1.0, cos_theta))
+    def __imul__(
+        self, other: Union[numbers.Real, Vector, "MutableVector"]
+    ) -> "MutableVector":
+        """
+        Multiply in place by a scalar or element-wise by a vector.
 
-        return math.acos(cos_theta)
+        >>> v = MutableVector([1, 2])
+        >>> v *= 3
+        >>> v *= Vector([1, 0.5])
+        >>> v
+        MutableVector([3.0, 3.0])
+        """
+        data = self._components
+        if isinstance(other, numbers.Real):
+            other = float(other)
+            for i in range(len(data)):
+                data[i] *= other
+            return self
+        components = self._operand(other, "element-wise multiplication")
+        if components is None:
+            return NotImplemented
+        for i, value in enumerate(components):
+            data[i] *= value
+        return self
+
+    def __itruediv__(self, scalar: numbers.Real) -> "MutableVector":
+        """
+        Divide in place by a scalar.
+
+        >>> v = MutableVector([2, 4])
+        >>> v /= 2
+        >>> v
+        MutableVector([1.0, 2.0])
+        >>> v /= 0
+        Traceback (most recent call last):
+        ValueError: Division by zero is not allowed.
+        """
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        if scalar == 0:
+            raise ValueError("Division by zero is not allowed.")
+        scalar = float(scalar)
+        data = self._components
+        for i in range(len(data)):
+            data[i] /= scalar
+        return self
+
+
+# Opt-in profiling of all vector methods, see vector_profile.py.
+if os.environ.get("VECTOR_PROFILE"):
+    import vector_profile
+
+    vector_profile.enable_from_environment(Vector, VectorView, MutableVector)
 
 
 # Demonstration of the Vector class
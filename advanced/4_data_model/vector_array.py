@@ -0,0 +1,467 @@
+import numbers
+from typing import Any, Iterable, Iterator, Union
+
+import numpy as np
+
+from vector import _DTYPE_NAMES, NORM2_REL_TOL, Vector, _typecode
+
+
+class VectorArray:
+    """
+    A batch of vectors of the same dimension stored in one NumPy array.
+
+    Instead of holding many separate `Vector` objects in a list, a
+    `VectorArray` keeps N vectors of dimension d in a single contiguous
+    2-D float64 array of shape (N, d). All operators work on the whole
+    batch at once, so the per-object overhead of a Python loop disappears.
+
+    Operators follow the semantics of `Vector`:
+        * `batch + other`, `batch - other`: component-wise, row by row.
+        * `batch * scalar`: scalar multiplication of every vector.
+        * `batch * other`: element-wise multiplication.
+        * `batch @ other`: dot product of every row, returns a 1-D array.
+        * `abs(batch)`: magnitudes of every row, returns a 1-D array.
+
+    `other` may be another `VectorArray` of the same shape or a single
+    `Vector`, which is broadcast against every row.
+
+    With `dtype="float32"` the components are stored in single precision,
+    half the memory of float64. Like for `Vector`, all arithmetic is done
+    in float64 and results are stored as float32 only if the batch and
+    the other operand are float32.
+
+    Attributes:
+        _data (np.ndarray): The components as a C-contiguous (N, d) float64
+            (or float32) array.
+
+    Example usage:
+        >>> batch = VectorArray.from_vectors([Vector([1, 2]), Vector([3, 4])])
+        >>> batch
+        VectorArray([Vector([1.0, 2.0]), Vector([3.0, 4.0])])
+        >>> batch + Vector([1, 1])
+        VectorArray([Vector([2.0, 3.0]), Vector([4.0, 5.0])])
+        >>> abs(batch)
+        array([2.23606798, 5.        ])
+        >>> batch[1]
+        Vector([3.0, 4.0])
+
+    Notes:
+        - Like `Vector`, a `VectorArray` is immutable; every operation
+          returns a new batch.
+        - `==` follows `Vector`: batches of the same shape are equal if
+          the magnitudes of corresponding rows are close. Use
+          `np.array_equal(np.asarray(a), np.asarray(b))` to compare the
+          components exactly.
+        - Indexing with an integer returns a plain `Vector`, slicing
+          returns a new `VectorArray`.
+    """
+
+    def __init__(
+        self, data: Any = (), dim: Union[int, None] = None, dtype: Any = "float64"
+    ) -> None:
+        """
+        Initialize a batch from a 2-D array-like of real numbers.
+
+        An empty batch needs the dimension to be given explicitly.
+        The dtype is "float64" (default) or "float32".
+
+        >>> VectorArray([[1, 2], [3, 4]]).shape
+        (2, 2)
+        >>> VectorArray(dim=3).shape
+        (0, 3)
+        >>> VectorArray([[0.1, 0.2]], dtype="float32").dtype
+        'float32'
+        >>> VectorArray([1, 2, 3])
+        Traceback (most recent call last):
+        ValueError: VectorArray data must be two-dimensional.
+        """
+        dtype = _DTYPE_NAMES[_typecode(dtype)]
+        array = np.array(data, dtype=dtype)
+        if array.size == 0:
+            array = array.reshape(0, dim if dim is not None else 0)
+        if array.ndim != 2:
+            raise ValueError("VectorArray data must be two-dimensional.")
+        array.flags.writeable = False
+        self._data = array
+
+    @classmethod
+    def from_vectors(
+        cls, vectors: Iterable[Vector], dtype: Any = None
+    ) -> "VectorArray":
+        """
+        Build a batch from an iterable of vectors of the same dimension.
+
+        Without a dtype the batch is float32 only if all vectors are.
+
+        >>> VectorArray.from_vectors([Vector([1, 2]), Vector([3, 4])]).shape
+        (2, 2)
+        >>> VectorArray.from_vectors([Vector([1, 2]), Vector([3])])
+        Traceback (most recent call last):
+        ValueError: All vectors must have the same dimensionality.
+        """
+        rows = list(vectors)
+        if len({len(row) for row in rows}) > 1:
+            raise ValueError("All vectors must have the same dimensionality.")
+        if dtype is None:
+            single = rows and all(v.dtype == "float32" for v in rows)
+            dtype = "float32" if single else "float64"
+        return cls(rows, dtype=dtype)
+
+    def to_vectors(self) -> list[Vector]:
+        """
+        Export the batch as a list of `Vector` objects.
+
+        >>> VectorArray([[1, 2], [3, 4]]).to_vectors()
+        [Vector([1.0, 2.0]), Vector([3.0, 4.0])]
+        """
+        return [Vector.frombuffer(row) for row in self._data]
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """
+        Return the shape (number of vectors, dimension) of the batch.
+
+        >>> VectorArray([[1, 2, 3]]).shape
+        (1, 3)
+        """
+        return self._data.shape
+
+    @property
+    def dtype(self) -> str:
+        """
+        Return the storage type of the components, "float64" or "float32".
+
+        >>> VectorArray([[1, 2]]).dtype
+        'float64'
+        """
+        return self._data.dtype.name
+
+    @property
+    def dim(self) -> int:
+        """
+        Return the dimension of the vectors in the batch.
+
+        >>> VectorArray([[1, 2, 3]]).dim
+        3
+        """
+        return self._data.shape[1]
+
+    def __array__(self, dtype=None, copy=None) -> np.ndarray:
+        """
+        Return the underlying (read-only) NumPy array.
+
+        As for `Vector`, a different dtype needs a copy, so it raises a
+        ValueError with `copy=False`.
+
+        >>> np.asarray(VectorArray([[1, 2]]))
+        array([[1., 2.]])
+        >>> VectorArray([[1, 2]]).__array__(np.float32, copy=False)
+        Traceback (most recent call last):
+        ValueError: Converting a float64 VectorArray to float32 needs a copy.
+        """
+        if dtype is not None and np.dtype(dtype) != self._data.dtype:
+            if copy is False:
+                raise ValueError(
+                    f"Converting a {self._data.dtype} VectorArray to "
+                    f"{np.dtype(dtype)} needs a copy."
+                )
+            return self._data.astype(dtype)
+        return self._data.copy() if copy else self._data
+
+    def __repr__(self) -> str:
+        """
+        Unambiguous string representation for debugging.
+
+        >>> VectorArray([[1, 2]])
+        VectorArray([Vector([1.0, 2.0])])
+        """
+        return f"VectorArray([{', '.join(repr(v) for v in self)}])"
+
+    # container protocol methods
+    def __len__(self) -> int:
+        """
+        Return the number of vectors in the batch.
+
+        >>> len(VectorArray([[1, 2], [3, 4], [5, 6]]))
+        3
+        """
+        return self._data.shape[0]
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vector, "VectorArray"]:
+        """
+        Return a plain `Vector` for an integer, a new batch for a slice.
+
+        >>> batch = VectorArray([[1, 2], [3, 4], [5, 6]])
+        >>> batch[-1]
+        Vector([5.0, 6.0])
+        >>> batch[:2]
+        VectorArray([Vector([1.0, 2.0]), Vector([3.0, 4.0])])
+        """
+        if isinstance(index, slice):
+            return self._wrap(self._data[index])
+        return Vector.frombuffer(self._data[index])
+
+    def __iter__(self) -> Iterator[Vector]:
+        """
+        Return an iterator over the vectors in the batch.
+
+        Each `Vector` is created when its row is reached, so iterating
+        does not build a list of the whole batch first.
+
+        >>> [abs(v) for v in VectorArray([[3, 4], [6, 8]])]
+        [5.0, 10.0]
+        """
+        for row in self._data:
+            yield Vector.frombuffer(row)
+
+    # Equality
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Two batches are equal if they have the same shape and every row
+        equals the row of the other batch by the rules of `Vector.__eq__`:
+        the magnitudes agree within the tolerance of `math.isclose`.
+
+        >>> VectorArray([[1, 2]]) == VectorArray([[1.0, 2.0]])
+        True
+        >>> VectorArray([[3, 4]]) == VectorArray([[0, 5]])
+        True
+        >>> VectorArray([[1, 2]]) == VectorArray([[1, 3]])
+        False
+        >>> VectorArray([[1, 2]]) == VectorArray([[1, 2], [1, 2]])
+        False
+        """
+        if not isinstance(other, VectorArray):
+            return NotImplemented
+        if self.shape != other.shape:
+            return False
+        norms2, other_norms2 = self._squared_norms(), other._squared_norms()
+        tolerance = NORM2_REL_TOL * np.maximum(norms2, other_norms2)
+        return bool(np.all(np.abs(norms2 - other_norms2) <= tolerance))
+
+    __hash__ = None
+
+    # Arithmetic
+
+    @classmethod
+    def _wrap(cls, array: np.ndarray) -> "VectorArray":
+        """Wrap an already validated float64 or float32 array without copying it."""
+        batch = cls.__new__(cls)
+        array.flags.writeable = False
+        batch._data = array
+        return batch
+
+    @property
+    def _data64(self) -> np.ndarray:
+        """The components as float64, without a copy for float64 storage."""
+        return self._data.astype(np.float64, copy=False)
+
+    def _result(self, values: np.ndarray, operand: Any = None) -> "VectorArray":
+        """Wrap a float64 result, stored as float32 if all inputs were float32."""
+        if self._data.dtype == np.float32 and (
+            operand is None or operand.dtype == np.float32
+        ):
+            values = values.astype(np.float32)
+        return self._wrap(values)
+
+    def _operand(self, other: Any, operation: str) -> Union[np.ndarray, None]:
+        """
+        Return the array to combine with `self._data` for a binary operation.
+
+        A `Vector` is broadcast against every row, a `VectorArray` must have
+        exactly the same shape. Returns None for unsupported types.
+        """
+        if isinstance(other, VectorArray):
+            if other.shape != self.shape:
+                raise ValueError(
+                    f"VectorArrays must have the same shape for {operation}."
+                )
+            return other._data
+        if isinstance(other, Vector):
+            if len(other) != self.dim:
+                raise ValueError(
+                    f"Vectors must have the same dimensionality for {operation}."
+                )
+            return np.asarray(other)
+        return None
+
+    def __neg__(self) -> "VectorArray":
+        """
+        Negate every vector in the batch.
+
+        >>> -VectorArray([[1, -2]])
+        VectorArray([Vector([-1.0, 2.0])])
+        """
+        return self._wrap(-self._data)
+
+    def __pos__(self) -> "VectorArray":
+        """
+        Return the batch unchanged (identity operation).
+
+        >>> +VectorArray([[1, 2]])
+        VectorArray([Vector([1.0, 2.0])])
+        """
+        return self
+
+    def __abs__(self) -> np.ndarray:
+        """
+        Return the magnitude of every vector in the batch.
+
+        >>> abs(VectorArray([[3, 4], [1, 2]]))
+        array([5.        , 2.23606798])
+        """
+        return np.sqrt(self._squared_norms())
+
+    def _squared_norms(self) -> np.ndarray:
+        """Return the squared magnitude of every vector as a float64 array."""
+        data = self._data64
+        return np.einsum("ij,ij->i", data, data)
+
+    def __add__(self, other: Union[Vector, "VectorArray"]) -> "VectorArray":
+        """
+        Add a vector or a batch of vectors component-wise.
+
+        >>> batch = VectorArray([[1, 2], [3, 4]])
+        >>> batch + batch
+        VectorArray([Vector([2.0, 4.0]), Vector([6.0, 8.0])])
+        >>> Vector([1, 1]) + batch
+        VectorArray([Vector([2.0, 3.0]), Vector([4.0, 5.0])])
+        >>> batch + Vector([1, 2, 3])
+        Traceback (most recent call last):
+        ValueError: Vectors must have the same dimensionality for addition.
+        """
+        operand = self._operand(other, "addition")
+        if operand is None:
+            return NotImplemented
+        return self._result(self._data64 + operand, operand)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Vector, "VectorArray"]) -> "VectorArray":
+        """
+        Subtract a vector or a batch of vectors component-wise.
+
+        >>> VectorArray([[4, 5], [6, 7]]) - Vector([1, 2])
+        VectorArray([Vector([3.0, 3.0]), Vector([5.0, 5.0])])
+        """
+        operand = self._operand(other, "subtraction")
+        if operand is None:
+            return NotImplemented
+        return self._result(self._data64 - operand, operand)
+
+    def __rsub__(self, other: Vector) -> "VectorArray":
+        """
+        Subtract every vector in the batch from a single vector.
+
+        >>> Vector([5, 5]) - VectorArray([[1, 2], [3, 4]])
+        VectorArray([Vector([4.0, 3.0]), Vector([2.0, 1.0])])
+        """
+        operand = self._operand(other, "subtraction")
+        if operand is None:
+            return NotImplemented
+        return self._result(operand - self._data64, operand)
+
+    def __mul__(self, other: Union[numbers.Real, Vector, "VectorArray"]) -> "VectorArray":
+        """
+        Multiply by a scalar or element-wise by a vector or batch.
+
+        >>> batch = VectorArray([[1, 2], [3, 4]])
+        >>> batch * 2
+        VectorArray([Vector([2.0, 4.0]), Vector([6.0, 8.0])])
+        >>> 2 * batch == batch * 2
+        True
+        >>> batch * Vector([0, 1])
+        VectorArray([Vector([0.0, 2.0]), Vector([0.0, 4.0])])
+        """
+        if isinstance(other, numbers.Real):
+            return self._result(self._data64 * float(other))
+        operand = self._operand(other, "element-wise multiplication")
+        if operand is None:
+            return NotImplemented
+        return self._result(self._data64 * operand, operand)
+
+    __rmul__ = __mul__
+
+    def __matmul__(self, other: Union[Vector, "VectorArray"]) -> np.ndarray:
+        """
+        Calculate the dot product of every vector with a vector or batch.
+
+        >>> VectorArray([[1, 2], [3, 4]]) @ Vector([1, 1])
+        array([3., 7.])
+        >>> VectorArray([[1, 2], [3, 4]]) @ VectorArray([[1, 0], [0, 1]])
+        array([1., 4.])
+        """
+        operand = self._operand(other, "dot product")
+        if operand is None:
+            return NotImplemented
+        operand = operand.astype(np.float64, copy=False)
+        if operand.ndim == 1:
+            return self._data64 @ operand
+        return np.einsum("ij,ij->i", self._data64, operand)
+
+    __rmatmul__ = __matmul__
+
+    def __truediv__(self, scalar: numbers.Real) -> "VectorArray":
+        """
+        Divide every vector by a scalar.
+
+        >>> VectorArray([[2, 4]]) / 2
+        VectorArray([Vector([1.0, 2.0])])
+        """
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        if scalar == 0:
+            raise ValueError("Division by zero is not allowed.")
+        return self._result(self._data64 / float(scalar))
+
+    # Additional methods for advanced functionality
+
+    def normalize(self) -> "VectorArray":
+        """
+        Normalize every vector in the batch (make them unit vectors).
+
+        >>> VectorArray([[3, 4], [0, 2]]).normalize()
+        VectorArray([Vector([0.6, 0.8]), Vector([0.0, 1.0])])
+        >>> VectorArray([[3, 4], [0, 0]]).normalize()
+        Traceback (most recent call last):
+        ValueError: Cannot normalize a zero vector.
+        """
+        magnitudes = abs(self)
+        if np.any(magnitudes == 0):
+            raise ValueError("Cannot normalize a zero vector.")
+        return self._result(self._data64 / magnitudes[:, np.newaxis])
+
+    def distance_to(self, other: Union[Vector, "VectorArray"]) -> np.ndarray:
+        """
+        Calculate the Euclidean distance of every vector to a vector or batch.
+
+        >>> VectorArray([[0, 0], [3, 4]]).distance_to(Vector([0, 0]))
+        array([0., 5.])
+        """
+        operand = self._operand(other, "distance calculation")
+        if operand is None:
+            raise TypeError("distance_to expects a Vector or a VectorArray.")
+        difference = self._data64 - operand
+        return np.sqrt(np.einsum("ij,ij->i", difference, difference))
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    random.seed(42)
+    vectors = [Vector([random.random() for _ in range(3)]) for _ in range(100_000)]
+    offset = Vector([1, 2, 3])
+
+    start = time.perf_counter()
+    looped = [(v + offset).normalize() for v in vectors]
+    loop_time = time.perf_counter() - start
+
+    batch = VectorArray.from_vectors(vectors)
+    start = time.perf_counter()
+    batched = (batch + offset).normalize()
+    batch_time = time.perf_counter() - start
+
+    print(f"Loop over {len(vectors)} Vectors: {loop_time:.3f} s")
+    print(f"VectorArray:                 {batch_time:.3f} s")
+    print(f"Same result: {looped[-1] == batched[-1]}")
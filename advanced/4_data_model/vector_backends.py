@@ -0,0 +1,364 @@
+"""
+Compute backends for the hot loops of the Vector class.
+
+`Vector.__abs__`, `__matmul__`, `distance_to`, `squared_distance_to`,
+`cosine_similarity` and `angle_to` do not loop over their components
+themselves, and neither do the products of `Matrix`. They call the
+kernels of the active backend:
+
+    pure    Reference implementation with generator expressions over `zip`.
+    stdlib  C implementations from the `math` module (`math.sumprod`,
+            `math.dist`). This is the default.
+    numpy   NumPy kernels working on zero-copy views of the components,
+            the fastest choice for large dimensions and matrices.
+
+The backend is selected once per process with the environment variable
+`VECTOR_BACKEND` or at runtime with `set_backend()`. An unknown or
+unavailable backend in `VECTOR_BACKEND` only warns and falls back to
+stdlib, so a typo does not break every module importing `vector`:
+
+    >>> set_backend("pure")
+    >>> get_backend().name
+    'pure'
+    >>> set_backend("fortran")
+    Traceback (most recent call last):
+    ValueError: Unknown backend 'fortran'. Choose from: pure, stdlib, numpy.
+    >>> set_backend("stdlib")
+
+All kernels receive the packed `array('d')` storage of the vectors and
+must return the same results within floating point tolerance
+(see `test_vector_backends.py`).
+"""
+import math
+import operator
+import os
+import warnings
+from array import array
+from typing import Sequence
+
+# Below this many multiply-adds, `NumpyBackend.matmul` computes a matrix
+# product with `math.sumprod` instead: measured, NumPy is only faster from
+# about a 4 x 4 matrix times a 4 x 4 matrix on, including the conversions.
+NUMPY_MATMUL_THRESHOLD = 64
+
+
+class PureBackend:
+    """Reference kernels written in plain Python."""
+
+    name = "pure"
+
+    @staticmethod
+    def dot(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the dot product of two sequences of equal length.
+
+        >>> PureBackend.dot([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+        32.0
+        """
+        return sum(x * y for x, y in zip(a, b))
+
+    @staticmethod
+    def squared_norm(a: Sequence[float]) -> float:
+        """
+        Return the sum of the squared components.
+
+        >>> PureBackend.squared_norm([3.0, 4.0])
+        25.0
+        """
+        return sum(x * x for x in a)
+
+    @staticmethod
+    def distance(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the Euclidean distance between two sequences of equal length.
+
+        >>> PureBackend.distance([0.0, 0.0], [3.0, 4.0])
+        5.0
+        """
+        return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+
+    @staticmethod
+    def squared_distance(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the squared Euclidean distance without taking a square root.
+
+        >>> PureBackend.squared_distance([0.0, 0.0], [3.0, 4.0])
+        25.0
+        """
+        return sum((x - y) ** 2 for x, y in zip(a, b))
+
+    @staticmethod
+    def dot_and_norms(
+        a: Sequence[float], b: Sequence[float]
+    ) -> tuple[float, float, float]:
+        """
+        Return `a @ b`, `a @ a` and `b @ b`, computed in a single loop.
+
+        >>> PureBackend.dot_and_norms([1.0, 2.0], [3.0, 4.0])
+        (11.0, 5.0, 25.0)
+        """
+        dot = norm2_a = norm2_b = 0.0
+        for x, y in zip(a, b):
+            dot += x * y
+            norm2_a += x * x
+            norm2_b += y * y
+        return dot, norm2_a, norm2_b
+
+    @staticmethod
+    def matmul(
+        a: Sequence[float], b: Sequence[float], rows: int, inner: int, cols: int
+    ) -> array:
+        """
+        Return the product of a (rows x inner) and b (inner x cols).
+
+        All matrices are stored row by row in flat sequences.
+
+        >>> PureBackend.matmul([1.0, 2.0, 3.0, 4.0], [5.0, 6.0], 2, 2, 1)
+        array('d', [17.0, 39.0])
+        """
+        return array(
+            "d",
+            [
+                sum(a[i * inner + k] * b[k * cols + j] for k in range(inner))
+                for i in range(rows)
+                for j in range(cols)
+            ],
+        )
+
+
+class StdlibBackend:
+    """Kernels implemented in C by the `math` module (Python 3.12+)."""
+
+    name = "stdlib"
+
+    @staticmethod
+    def dot(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the dot product of two sequences of equal length.
+
+        >>> StdlibBackend.dot([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+        32.0
+        """
+        return math.sumprod(a, b)
+
+    @staticmethod
+    def squared_norm(a: Sequence[float]) -> float:
+        """
+        Return the sum of the squared components.
+
+        >>> StdlibBackend.squared_norm([3.0, 4.0])
+        25.0
+        """
+        return math.sumprod(a, a)
+
+    @staticmethod
+    def distance(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the Euclidean distance between two sequences of equal length.
+
+        >>> StdlibBackend.distance([0.0, 0.0], [3.0, 4.0])
+        5.0
+        """
+        return math.dist(a, b)
+
+    @staticmethod
+    def squared_distance(a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the squared Euclidean distance without taking a square root.
+
+        The differences are formed in C by `map(operator.sub, ...)` and
+        summed by `math.sumprod`, so the result is exact where the pure
+        and NumPy kernels are (squaring `math.dist` is not).
+
+        >>> StdlibBackend.squared_distance([0.0, 0.0], [3.0, 4.0])
+        25.0
+        >>> StdlibBackend.squared_distance([0.0, 0.0], [1.0, 1.0])
+        2.0
+        """
+        difference = list(map(operator.sub, a, b))
+        return math.sumprod(difference, difference)
+
+    @staticmethod
+    def dot_and_norms(
+        a: Sequence[float], b: Sequence[float]
+    ) -> tuple[float, float, float]:
+        """
+        Return `a @ b`, `a @ a` and `b @ b` using three C-level passes.
+
+        >>> StdlibBackend.dot_and_norms([1.0, 2.0], [3.0, 4.0])
+        (11.0, 5.0, 25.0)
+        """
+        return math.sumprod(a, b), math.sumprod(a, a), math.sumprod(b, b)
+
+    @staticmethod
+    def matmul(
+        a: Sequence[float], b: Sequence[float], rows: int, inner: int, cols: int
+    ) -> array:
+        """
+        Return the product of a (rows x inner) and b (inner x cols).
+
+        Every entry is one `math.sumprod` of a row of a and a column of b.
+        The operands are converted to lists first, which `sumprod` reads
+        about twice as fast as arrays. Splitting the loops into cache
+        blocks does not pay off here: the interpreter overhead per entry
+        dwarfs the memory traffic.
+
+        >>> StdlibBackend.matmul([1.0, 2.0, 3.0, 4.0], [5.0, 6.0], 2, 2, 1)
+        array('d', [17.0, 39.0])
+        """
+        a, b = list(a), list(b)
+        columns = [b[j::cols] for j in range(cols)]
+        return array(
+            "d",
+            [
+                math.sumprod(a[i * inner : (i + 1) * inner], column)
+                for i in range(rows)
+                for column in columns
+            ],
+        )
+
+
+class NumpyBackend:
+    """Kernels running in NumPy on zero-copy views of the components."""
+
+    name = "numpy"
+
+    def __init__(self) -> None:
+        import numpy as np
+
+        self._np = np
+
+    def _view(self, a: Sequence[float]):
+        """
+        Return a float64 array sharing memory with `a` if possible.
+
+        float32 storage (`array('f')` or a memoryview of format 'f' from
+        a `VectorView`) is converted to float64, so the kernels always
+        compute in double precision.
+        """
+        typecode = getattr(a, "typecode", None) or getattr(a, "format", "d")
+        if typecode != "d":
+            return self._np.asarray(a, dtype=self._np.float64)
+        try:
+            return self._np.frombuffer(a, dtype=self._np.float64)
+        except TypeError:
+            return self._np.asarray(a, dtype=self._np.float64)
+
+    def dot(self, a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the dot product of two sequences of equal length.
+
+        >>> NumpyBackend().dot([1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+        32.0
+        """
+        return float(self._np.dot(self._view(a), self._view(b)))
+
+    def squared_norm(self, a: Sequence[float]) -> float:
+        """
+        Return the sum of the squared components.
+
+        >>> NumpyBackend().squared_norm([3.0, 4.0])
+        25.0
+        """
+        view = self._view(a)
+        return float(self._np.dot(view, view))
+
+    def distance(self, a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the Euclidean distance between two sequences of equal length.
+
+        >>> NumpyBackend().distance([0.0, 0.0], [3.0, 4.0])
+        5.0
+        """
+        return float(self._np.linalg.norm(self._view(a) - self._view(b)))
+
+    def squared_distance(self, a: Sequence[float], b: Sequence[float]) -> float:
+        """
+        Return the squared Euclidean distance without taking a square root.
+
+        >>> NumpyBackend().squared_distance([0.0, 0.0], [3.0, 4.0])
+        25.0
+        """
+        difference = self._view(a) - self._view(b)
+        return float(self._np.dot(difference, difference))
+
+    def dot_and_norms(
+        self, a: Sequence[float], b: Sequence[float]
+    ) -> tuple[float, float, float]:
+        """
+        Return `a @ b`, `a @ a` and `b @ b` with one stacked matrix product.
+
+        >>> NumpyBackend().dot_and_norms([1.0, 2.0], [3.0, 4.0])
+        (11.0, 5.0, 25.0)
+        """
+        stacked = self._np.stack((self._view(a), self._view(b)))
+        gram = stacked @ stacked.T
+        return float(gram[0, 1]), float(gram[0, 0]), float(gram[1, 1])
+
+    def matmul(
+        self, a: Sequence[float], b: Sequence[float], rows: int, inner: int, cols: int
+    ) -> array:
+        """
+        Return the product of a (rows x inner) and b (inner x cols).
+
+        Products below `NUMPY_MATMUL_THRESHOLD` multiply-adds are left to
+        `StdlibBackend.matmul`, for which the conversions cost less.
+
+        >>> NumpyBackend().matmul([1.0, 2.0, 3.0, 4.0], [5.0, 6.0], 2, 2, 1)
+        array('d', [17.0, 39.0])
+        """
+        if rows * inner * cols < NUMPY_MATMUL_THRESHOLD:
+            return StdlibBackend.matmul(a, b, rows, inner, cols)
+        product = self._view(a).reshape(rows, inner) @ self._view(b).reshape(
+            inner, cols
+        )
+        return array("d", product.tobytes())
+
+
+BACKENDS = {
+    "pure": PureBackend,
+    "stdlib": StdlibBackend,
+    "numpy": NumpyBackend,
+}
+
+active = StdlibBackend()
+
+
+def set_backend(name: str) -> None:
+    """
+    Select the backend used by all Vector operations in this process.
+    """
+    global active
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown backend {name!r}. Choose from: {', '.join(BACKENDS)}."
+        )
+    active = BACKENDS[name]()
+
+
+def get_backend():
+    """
+    Return the currently active backend.
+
+    >>> get_backend().name in BACKENDS
+    True
+    """
+    return active
+
+
+def _set_backend_from_environment() -> None:
+    """Select the backend named by `VECTOR_BACKEND`, stdlib if it is unusable."""
+    name = os.environ.get("VECTOR_BACKEND", "stdlib")
+    try:
+        set_backend(name)
+    except (ValueError, ImportError) as error:
+        warnings.warn(
+            f"VECTOR_BACKEND={name!r} cannot be used ({error}), "
+            "falling back to 'stdlib'.",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        set_backend("stdlib")
+
+
+_set_backend_from_environment()
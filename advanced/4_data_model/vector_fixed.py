@@ -0,0 +1,313 @@
+"""
+Specialized vector classes for two and three dimensions.
+
+The general `Vector` loops over its components with `zip` and list
+comprehensions, which costs more than the arithmetic itself when there
+are only two or three components. `Vector2` and `Vector3` are generated
+from a source template: every component is its own slot (`_c0`, `_c1`,
+...) and every operation is written out without any loop.
+
+Both classes are subclasses of `Vector`, so they keep its interface and
+its equality semantics (comparisons by magnitude) and can be passed to
+every function that expects a `Vector`. Operations between two vectors
+of the same specialized class stay specialized; mixed operations fall
+back to the general implementation of `Vector`. As for `Vector`,
+`components` is a read-only memoryview and a slice is a `VectorView`,
+both on an `array('d')` that is built from the slots once, on first use.
+
+`make_vector` picks the class by the number of components:
+
+    >>> make_vector([3, 4])
+    Vector2([3.0, 4.0])
+    >>> make_vector([1, 2, 2]).normalize()
+    Vector3([0.3333333333333333, 0.6666666666666666, 0.6666666666666666])
+    >>> make_vector([1, 2, 3, 4])
+    Vector([1.0, 2.0, 3.0, 4.0])
+    >>> v = make_vector([1, 2, 3])
+    >>> v.components.tolist(), type(v[1:]).__name__, v[1:]
+    ([1.0, 2.0, 3.0], 'VectorView', Vector([2.0, 3.0]))
+
+`benchmark_fixed.py` measures the speedup per operation.
+"""
+import math
+import numbers
+import os
+from array import array
+from typing import Iterable
+
+from vector import _DTYPE_NAMES, NORM2_REL_TOL, Vector
+
+_TEMPLATE = '''
+class {name}(Vector):
+    """
+    A `Vector` with exactly {dim} components stored in separate slots.
+
+    The `array('d')` that the methods inherited from `Vector` work on is
+    built from the slots on first use and then kept in the inherited
+    `_components` slot, like the hash in `_hash`.
+
+    Attributes:
+        {slot_list} (float): The components.
+    """
+
+    __slots__ = ({slot_tuple})
+
+    def __init__(self, components: Iterable[numbers.Real]) -> None:
+        components = tuple(components)
+        if len(components) != {dim}:
+            raise ValueError("{name} needs exactly {dim} components.")
+        if any(not isinstance(c, numbers.Real) for c in components):
+            raise TypeError("All components must be real numbers (int or float).")
+        {self_slots}, = map(float, components)
+
+    @classmethod
+    def _from_array(cls, components: array) -> "{name}":
+        if len(components) != {dim}:
+            raise ValueError("{name} needs exactly {dim} components.")
+        if components.typecode != "d":
+            dtype = DTYPE_NAMES[components.typecode]
+            raise ValueError(f"{name} stores float64 components, got {{dtype}}.")
+        {args}, = components
+        vector = _object_new(cls)
+        {assign_slots}
+        _storage.__set__(vector, components)
+        return vector
+
+    @property
+    def _components(self) -> array:
+        try:
+            return _storage.__get__(self)
+        except AttributeError:
+            components = array("d", ({self_slots},))
+            _storage.__set__(self, components)
+            return components
+
+    @property
+    def dtype(self) -> str:
+        return "float64"
+
+    @property
+    def components(self) -> memoryview:
+        return memoryview(self._components).toreadonly()
+
+    def __reduce__(self) -> tuple:
+        return {name}, (({self_slots},),)
+
+    def __repr__(self) -> str:
+        return f"{name}([{repr_fields}])"
+
+    def __len__(self) -> int:
+        return {dim}
+
+    def __iter__(self):
+        return iter(({self_slots},))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return Vector.__getitem__(self, index)
+        return ({self_slots},)[index]
+
+    def __bool__(self) -> bool:
+        return {nonzero}
+
+    def __hash__(self) -> int:
+        try:
+            return self._hash
+        except AttributeError:
+            self._hash = hash(({self_slots},))
+            return self._hash
+
+    def __eq__(self, other) -> bool:
+        if type(other) is {name}:
+            return isclose({self_norm2}, {other_norm2}, rel_tol=NORM2_REL_TOL)
+        return Vector.__eq__(self, other)
+
+    def __lt__(self, other) -> bool:
+        if type(other) is {name}:
+            return {self_norm2} < {other_norm2}
+        return Vector.__lt__(self, other)
+
+    def _squared_norm(self) -> float:
+        return {self_norm2}
+
+    def __abs__(self) -> float:
+        return sqrt({self_norm2})
+
+    def __neg__(self) -> "{name}":
+        return _new({neg})
+
+    def __pos__(self) -> "{name}":
+        return self
+
+    def __add__(self, other):
+        if type(other) is {name}:
+            return _new({add})
+        return Vector.__add__(self, other)
+
+    def __sub__(self, other):
+        if type(other) is {name}:
+            return _new({sub})
+        return Vector.__sub__(self, other)
+
+    def __mul__(self, other):
+        if type(other) is not float:
+            if type(other) is {name}:
+                return _new({mul_vector})
+            if not isinstance(other, numbers.Real):
+                return Vector.__mul__(self, other)
+            other = float(other)
+        return _new({mul_scalar})
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar):
+        if type(scalar) is not float:
+            if not isinstance(scalar, numbers.Real):
+                return NotImplemented
+            scalar = float(scalar)
+        if scalar == 0:
+            raise ValueError("Division by zero is not allowed.")
+        return _new({div_scalar})
+
+    def __matmul__(self, other):
+        if type(other) is {name}:
+            return {dot}
+        return Vector.__matmul__(self, other)
+
+    def squared_distance_to(self, other):
+        if type(other) is {name}:
+            {deltas}
+            return {delta_norm2}
+        return Vector.squared_distance_to(self, other)
+
+    def distance_to(self, other):
+        if type(other) is {name}:
+            {deltas}
+            return sqrt({delta_norm2})
+        return Vector.distance_to(self, other)
+
+    def cosine_similarity(self, other):
+        if type(other) is not {name}:
+            return Vector.cosine_similarity(self, other)
+        norm2_product = ({self_norm2}) * ({other_norm2})
+        if norm2_product == 0:
+            raise ValueError("Cannot calculate angle with a zero vector.")
+        cos_theta = ({dot}) / sqrt(norm2_product)
+        # Clamp to [-1, 1] against rounding errors, cheaper than max/min.
+        if cos_theta > 1.0:
+            return 1.0
+        if cos_theta < -1.0:
+            return -1.0
+        return cos_theta
+
+    def angle_to(self, other):
+        if type(other) is not {name}:
+            return Vector.angle_to(self, other)
+        return acos(self.cosine_similarity(other))
+
+    def normalize(self) -> "{name}":
+        magnitude = sqrt({self_norm2})
+        if magnitude == 0:
+            raise ValueError("Cannot normalize a zero vector.")
+        return _new({div_magnitude})
+
+
+def _new({args}) -> {name}:
+    vector = _object_new({name})
+    {assign_args}
+    return vector
+'''
+
+
+def _generate(name: str, dim: int) -> type:
+    """
+    Generate the source of a fixed-dimension class and execute it.
+
+    The template is filled with the operations written out for every
+    component, e.g. `self._c0 + other._c0, self._c1 + other._c1`.
+    """
+    indices = range(dim)
+
+    def each(pattern: str, separator: str = ", ") -> str:
+        return separator.join(pattern.format(i=i) for i in indices)
+
+    source = _TEMPLATE.format(
+        name=name,
+        dim=dim,
+        slot_list=each("_c{i}"),
+        slot_tuple=each('"_c{i}"') + ",",
+        self_slots=each("self._c{i}"),
+        repr_fields=each("{{self._c{i}}}"),
+        nonzero=each("self._c{i} != 0", " or "),
+        self_norm2=each("self._c{i} * self._c{i}", " + "),
+        other_norm2=each("other._c{i} * other._c{i}", " + "),
+        neg=each("-self._c{i}"),
+        add=each("self._c{i} + other._c{i}"),
+        sub=each("self._c{i} - other._c{i}"),
+        mul_vector=each("self._c{i} * other._c{i}"),
+        mul_scalar=each("self._c{i} * other"),
+        div_scalar=each("self._c{i} / scalar"),
+        div_magnitude=each("self._c{i} / magnitude"),
+        dot=each("self._c{i} * other._c{i}", " + "),
+        deltas=each("d{i} = self._c{i} - other._c{i}", "\n            "),
+        delta_norm2=each("d{i} * d{i}", " + "),
+        args=each("c{i}"),
+        assign_args=each("vector._c{i} = c{i}", "\n    "),
+        assign_slots=each("vector._c{i} = c{i}", "\n        "),
+    )
+    namespace = {
+        "Vector": Vector,
+        "Iterable": Iterable,
+        "array": array,
+        "sqrt": math.sqrt,
+        "acos": math.acos,
+        "isclose": math.isclose,
+        "NORM2_REL_TOL": NORM2_REL_TOL,
+        "DTYPE_NAMES": _DTYPE_NAMES,
+        "_storage": Vector._components,
+        "numbers": numbers,
+        "_object_new": object.__new__,
+    }
+    exec(compile(source, f"<{name}>", "exec"), namespace)
+    cls = namespace[name]
+    cls.__module__ = __name__
+    # Reachable from the class for vector_profile.py, which also replaces
+    # the global `_new` that the methods call.
+    cls._new = staticmethod(namespace["_new"])
+    return cls
+
+
+Vector2 = _generate("Vector2", 2)
+Vector3 = _generate("Vector3", 3)
+Vector2.x = property(lambda self: self._c0, doc="The first component.")
+Vector2.y = property(lambda self: self._c1, doc="The second component.")
+Vector3.x = property(lambda self: self._c0, doc="The first component.")
+Vector3.y = property(lambda self: self._c1, doc="The second component.")
+Vector3.z = property(lambda self: self._c2, doc="The third component.")
+
+FIXED_CLASSES = {2: Vector2, 3: Vector3}
+
+# Opt-in profiling, see vector_profile.py.
+if os.environ.get("VECTOR_PROFILE"):
+    import vector_profile
+
+    vector_profile.enable_from_environment(Vector2, Vector3)
+
+
+def make_vector(components: Iterable[numbers.Real]) -> Vector:
+    """
+    Create a `Vector2`, `Vector3` or general `Vector` depending on the length.
+
+    >>> v = make_vector((1, 2))
+    >>> w = make_vector([3, 4])
+    >>> v + w, v @ w, abs(w), v == make_vector([2, 1])
+    (Vector2([4.0, 6.0]), 11.0, 5.0, True)
+    >>> w.x, w.y
+    (3.0, 4.0)
+    >>> v + Vector([1, 1])
+    Vector([2.0, 3.0])
+    >>> isinstance(v, Vector)
+    True
+    """
+    components = list(components)
+    return FIXED_CLASSES.get(len(components), Vector)(components)
@@ -0,0 +1,230 @@
+import heapq
+from typing import Iterable
+
+import numpy as np
+
+from vector import Vector
+
+
+class VectorIndex:
+    """
+    A KD-tree for nearest-neighbour queries over a collection of vectors.
+
+    `min(vectors, key=q.distance_to)` looks at every vector for every query.
+    A KD-tree splits the space recursively at the median of the axis with
+    the largest spread, so a query only has to visit the few cells close
+    to it. Distances are Euclidean, like `Vector.distance_to`.
+
+    The tree is built in O(n log n): every level selects its medians with
+    `np.argpartition` in linear time. Small cells (`leaf_size` vectors) are
+    stored contiguously and scanned with NumPy instead of splitting further.
+
+    Attributes:
+        _vectors (list): The indexed vectors in tree order.
+        _points (np.ndarray): Their components as an (n, d) float64 array.
+        _nodes (list): Inner nodes as (axis, split, left, right) tuples
+            and leaves as (start, stop) tuples of rows in `_points`.
+
+    Example usage:
+        >>> index = VectorIndex([Vector([0, 0]), Vector([1, 1]), Vector([5, 5])])
+        >>> index.nearest(Vector([0.9, 0.8]))
+        [(0.2236067977499789, Vector([1.0, 1.0]))]
+        >>> [v for _, v in index.within(Vector([0, 0]), 2)]
+        [Vector([0.0, 0.0]), Vector([1.0, 1.0])]
+
+    Notes:
+        - In higher dimensions almost every cell has to be visited. From
+          about d = 8 on, a NumPy scan over all vectors is faster than the
+          tree; `benchmark_index.py` shows the crossover on the current
+          machine. The tree stays faster than `min(..., key=q.distance_to)`.
+    """
+
+    def __init__(self, vectors: Iterable[Vector], leaf_size: int = 16) -> None:
+        """
+        Build the tree from any iterable of vectors of the same dimension.
+
+        >>> len(VectorIndex(Vector([i, i]) for i in range(100)))
+        100
+        >>> VectorIndex([])
+        Traceback (most recent call last):
+        ValueError: Cannot build an index from an empty iterable of vectors.
+        >>> VectorIndex([Vector([1, 2]), Vector([1])])
+        Traceback (most recent call last):
+        ValueError: All vectors must have the same dimensionality.
+        """
+        vectors = list(vectors)
+        if not vectors:
+            raise ValueError(
+                "Cannot build an index from an empty iterable of vectors."
+            )
+        if len({len(v) for v in vectors}) > 1:
+            raise ValueError("All vectors must have the same dimensionality.")
+        if leaf_size < 1:
+            raise ValueError("leaf_size must be at least 1.")
+
+        points = np.array(vectors, dtype=np.float64).reshape(len(vectors), -1)
+        order = np.arange(len(vectors))
+        self._leaf_size = leaf_size
+        self._nodes = []
+        self._build(points, order, 0, len(vectors))
+        self._points = points[order]
+        self._vectors = [vectors[i] for i in order]
+
+    def _build(
+        self, points: np.ndarray, order: np.ndarray, start: int, stop: int
+    ) -> int:
+        """Build the subtree for `order[start:stop]` and return its node id."""
+        node_id = len(self._nodes)
+        if stop - start <= self._leaf_size:
+            self._nodes.append((start, stop))
+            return node_id
+
+        cell = points[order[start:stop]]
+        axis = int(np.argmax(cell.max(axis=0) - cell.min(axis=0)))
+        middle = (stop - start) // 2
+        partition = np.argpartition(cell[:, axis], middle)
+        order[start:stop] = order[start:stop][partition]
+        split = float(points[order[start + middle], axis])
+
+        self._nodes.append(None)
+        left = self._build(points, order, start, start + middle)
+        right = self._build(points, order, start + middle, stop)
+        self._nodes[node_id] = (axis, split, left, right)
+        return node_id
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    @property
+    def dim(self) -> int:
+        """
+        Return the dimension of the indexed vectors.
+
+        >>> VectorIndex([Vector([1, 2, 3])]).dim
+        3
+        """
+        return self._points.shape[1]
+
+    def _query_point(self, query: Vector) -> np.ndarray:
+        """Return the query as an array after checking its dimension."""
+        if not isinstance(query, Vector):
+            raise TypeError("Queries must be Vector objects.")
+        if len(query) != self.dim:
+            raise ValueError(
+                "Vectors must have the same dimensionality for distance calculation."
+            )
+        return np.asarray(query)
+
+    def nearest(self, query: Vector, k: int = 1) -> list[tuple[float, Vector]]:
+        """
+        Return the k vectors closest to the query as (distance, vector) pairs.
+
+        The pairs are sorted by increasing distance. If the index holds
+        fewer than k vectors, all of them are returned.
+
+        >>> index = VectorIndex([Vector([i, 0]) for i in range(10)], leaf_size=2)
+        >>> [v[0] for _, v in index.nearest(Vector([4.2, 0]), k=3)]
+        [4.0, 5.0, 3.0]
+        >>> index.nearest(Vector([0, 0]), k=0)
+        Traceback (most recent call last):
+        ValueError: k must be at least 1.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        point = self._query_point(query)
+        # Max-heap of the best candidates as (-squared distance, row).
+        best: list[tuple[float, int]] = []
+        self._search_nearest(0, point, k, best)
+        neighbours = [self._vectors[row] for _, row in sorted(best, reverse=True)]
+        return [(query.distance_to(vector), vector) for vector in neighbours]
+
+    def _search_nearest(
+        self, node_id: int, point: np.ndarray, k: int, best: list
+    ) -> None:
+        node = self._nodes[node_id]
+        if len(node) == 2:
+            start, stop = node
+            difference = self._points[start:stop] - point
+            squared = np.einsum("ij,ij->i", difference, difference)
+            for row, distance in zip(range(start, stop), squared.tolist()):
+                if len(best) < k:
+                    heapq.heappush(best, (-distance, row))
+                elif distance < -best[0][0]:
+                    heapq.heapreplace(best, (-distance, row))
+            return
+
+        axis, split, left, right = node
+        offset = point[axis] - split
+        near, far = (left, right) if offset < 0 else (right, left)
+        self._search_nearest(near, point, k, best)
+        if len(best) < k or offset * offset < -best[0][0]:
+            self._search_nearest(far, point, k, best)
+
+    def within(self, query: Vector, radius: float) -> list[tuple[float, Vector]]:
+        """
+        Return all vectors with a distance of at most `radius` to the query.
+
+        The (distance, vector) pairs are sorted by increasing distance.
+
+        >>> index = VectorIndex([Vector([i, 0]) for i in range(10)], leaf_size=2)
+        >>> [(d, v[0]) for d, v in index.within(Vector([4, 0]), 1)]
+        [(0.0, 4.0), (1.0, 3.0), (1.0, 5.0)]
+        >>> index.within(Vector([4, 0]), -1)
+        Traceback (most recent call last):
+        ValueError: radius must not be negative.
+        """
+        if radius < 0:
+            raise ValueError("radius must not be negative.")
+        point = self._query_point(query)
+        found: list[tuple[float, int]] = []
+        self._search_within(0, point, radius * radius, found)
+        found.sort()
+        return [
+            (query.distance_to(self._vectors[row]), self._vectors[row])
+            for _, row in found
+        ]
+
+    def _search_within(
+        self, node_id: int, point: np.ndarray, squared_radius: float, found: list
+    ) -> None:
+        node = self._nodes[node_id]
+        if len(node) == 2:
+            start, stop = node
+            difference = self._points[start:stop] - point
+            squared = np.einsum("ij,ij->i", difference, difference)
+            for row in np.flatnonzero(squared <= squared_radius).tolist():
+                found.append((float(squared[row]), start + row))
+            return
+
+        axis, split, left, right = node
+        offset = point[axis] - split
+        if offset <= 0 or offset * offset <= squared_radius:
+            self._search_within(left, point, squared_radius, found)
+        if offset >= 0 or offset * offset <= squared_radius:
+            self._search_within(right, point, squared_radius, found)
+
+    def nearest_many(
+        self, queries: Iterable[Vector], k: int = 1
+    ) -> list[list[tuple[float, Vector]]]:
+        """
+        Run `nearest` for every query.
+
+        >>> index = VectorIndex([Vector([0, 0]), Vector([10, 10])])
+        >>> results = index.nearest_many([Vector([1, 1]), Vector([9, 9])])
+        >>> [result[0][1] for result in results]
+        [Vector([0.0, 0.0]), Vector([10.0, 10.0])]
+        """
+        return [self.nearest(query, k) for query in queries]
+
+    def within_many(
+        self, queries: Iterable[Vector], radius: float
+    ) -> list[list[tuple[float, Vector]]]:
+        """
+        Run `within` for every query.
+
+        >>> index = VectorIndex([Vector([0, 0]), Vector([10, 10])])
+        >>> results = index.within_many([Vector([1, 1]), Vector([5, 5])], 2)
+        >>> [len(result) for result in results]
+        [1, 0]
+        """
+        return [self.within(query, radius) for query in queries]
@@ -0,0 +1,368 @@
+"""
+Lazy vector expressions that are evaluated in a single pass.
+
+Every operator on a `Vector` allocates a new `Vector`, so an update like
+`a + b * 2 - c / 3` creates three temporary vectors before the result.
+Wrapping the operands with `lazy()` switches to lazy mode: operators only
+build a small expression tree, and the whole tree is evaluated in one
+loop over the components when a value is needed.
+
+    >>> from vector import Vector
+    >>> a, b, c = lazy(Vector([1, 2]), Vector([3, 4]), Vector([3, 6]))
+    >>> expression = a + b * 2 - c / 3
+    >>> expression.eval()
+    Vector([6.0, 8.0])
+    >>> abs(b - Vector([1, 2]))
+    2.8284271247461903
+
+Only operators with a lazy operand are deferred: in `lazy(a) + b * 2`
+the product `b * 2` is still computed eagerly by `Vector`, because
+Python evaluates it before the addition.
+
+An expression is evaluated by `eval()`, `abs()`, `@`, `bool()`,
+iteration, `repr()` and comparisons. The tree is translated into one loop
+with one assignment per node, which is compiled once per expression shape
+and kept in an LRU cache of `KERNEL_CACHE_SIZE` kernels, so the same update
+in a loop does not pay for code generation again. Trees deeper than
+`MAX_DEPTH` are evaluated while they are built, so long chains like
+`x = x + v * dt` in a loop stay cheap to compile.
+
+Like `Vector`, the result is stored as float32 only if every vector in
+the expression is float32; the arithmetic itself runs on Python floats.
+"""
+import numbers
+from array import array
+from functools import lru_cache, total_ordering
+from typing import Any, Callable, Iterator, Union
+
+from vector import Vector, _storage_typecode
+
+# Number of nested operators after which an expression is evaluated eagerly.
+MAX_DEPTH = 128
+
+# Number of compiled kernels kept for reuse, least recently used first out.
+KERNEL_CACHE_SIZE = 256
+
+
+@total_ordering
+class LazyVector:
+    """
+    A node in a lazy vector expression tree.
+
+    Leaves wrap a `Vector`, inner nodes store an operator and their
+    operands (other nodes or scalars). The dimension is checked while the
+    tree is built, so errors show up at the operator that causes them.
+
+    Attributes:
+        _op (str): "leaf", "neg" or one of the operators "+", "-", "*", "/".
+        _args (tuple): The wrapped vector or the operands of the operator.
+        _dim (int): The dimension of the resulting vector.
+        _depth (int): The number of nested operators, 0 for a leaf.
+        _value (Vector): The evaluated result, cached after the first use.
+    """
+
+    __slots__ = ("_op", "_args", "_dim", "_depth", "_value")
+
+    def __init__(self, op: str, args: tuple, dim: int) -> None:
+        self._op = op
+        self._args = args
+        self._dim = dim
+        self._depth = 1 + max(
+            (arg._depth for arg in args if isinstance(arg, LazyVector)), default=-1
+        )
+        self._value = None
+
+    def __len__(self) -> int:
+        """
+        Return the dimension without evaluating the expression.
+
+        >>> len(lazy(Vector([1, 2, 3])) * 2)
+        3
+        """
+        return self._dim
+
+    # Building the expression tree
+
+    def _operand(self, other: Any, operation: str) -> Union["LazyVector", None]:
+        """Wrap `other` as a node and check that the dimensions match."""
+        if isinstance(other, Vector):
+            other = lazy(other)
+        if not isinstance(other, LazyVector):
+            return None
+        if other._dim != self._dim:
+            raise ValueError(
+                f"Vectors must have the same dimensionality for {operation}."
+            )
+        return other
+
+    def __neg__(self) -> "LazyVector":
+        return _node("neg", (self,), self._dim)
+
+    def __pos__(self) -> "LazyVector":
+        return self
+
+    def __add__(self, other: Union[Vector, "LazyVector"]) -> "LazyVector":
+        """
+        >>> (lazy(Vector([1, 2])) + Vector([3, 4])).eval()
+        Vector([4.0, 6.0])
+        >>> (Vector([1, 2]) + lazy(Vector([3, 4]))).eval()
+        Vector([4.0, 6.0])
+        >>> lazy(Vector([1, 2])) + Vector([1, 2, 3])
+        Traceback (most recent call last):
+        ValueError: Vectors must have the same dimensionality for addition.
+        """
+        other = self._operand(other, "addition")
+        if other is None:
+            return NotImplemented
+        return _node("+", (self, other), self._dim)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union[Vector, "LazyVector"]) -> "LazyVector":
+        """
+        >>> (lazy(Vector([4, 5])) - Vector([1, 2])).eval()
+        Vector([3.0, 3.0])
+        """
+        other = self._operand(other, "subtraction")
+        if other is None:
+            return NotImplemented
+        return _node("-", (self, other), self._dim)
+
+    def __rsub__(self, other: Vector) -> "LazyVector":
+        """
+        >>> (Vector([4, 5]) - lazy(Vector([1, 2]))).eval()
+        Vector([3.0, 3.0])
+        """
+        other = self._operand(other, "subtraction")
+        if other is None:
+            return NotImplemented
+        return _node("-", (other, self), self._dim)
+
+    def __mul__(self, other: Union[numbers.Real, Vector, "LazyVector"]) -> "LazyVector":
+        """
+        >>> (lazy(Vector([1, 2])) * 2).eval()
+        Vector([2.0, 4.0])
+        >>> (2 * lazy(Vector([1, 2])) * Vector([3, 4])).eval()
+        Vector([6.0, 16.0])
+        """
+        if isinstance(other, numbers.Real):
+            return _node("*", (self, float(other)), self._dim)
+        other = self._operand(other, "element-wise multiplication")
+        if other is None:
+            return NotImplemented
+        return _node("*", (self, other), self._dim)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: numbers.Real) -> "LazyVector":
+        """
+        >>> (lazy(Vector([2, 4])) / 2).eval()
+        Vector([1.0, 2.0])
+        >>> lazy(Vector([2, 4])) / 0
+        Traceback (most recent call last):
+        ValueError: Division by zero is not allowed.
+        """
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        if scalar == 0:
+            raise ValueError("Division by zero is not allowed.")
+        return _node("/", (self, float(scalar)), self._dim)
+
+    # Evaluation
+
+    def _compile(self, leaves: list, scalars: list, lines: list, names: dict) -> str:
+        """
+        Append the assignments for this node to `lines`, return its name.
+
+        Leaves and scalars are collected in order and referenced as
+        `c0, c1, ...` and `s0, s1, ...`, every operator node becomes one
+        temporary `t0, t1, ...`. Two trees of the same shape therefore
+        produce the same source and share one compiled kernel. A vector or
+        node used twice in the tree is read or computed only once.
+        """
+        key = id(self._args[0]) if self._op == "leaf" else id(self)
+        name = names.get(key)
+        if name is not None:
+            return name
+        if self._op == "leaf":
+            leaves.append(self._args[0])
+            name = f"c{len(leaves) - 1}"
+        elif self._op == "neg":
+            operand = self._args[0]._compile(leaves, scalars, lines, names)
+            name = f"t{len(lines)}"
+            lines.append(f"{name} = -{operand}")
+        else:
+            left, right = self._args
+            left_name = left._compile(leaves, scalars, lines, names)
+            if isinstance(right, LazyVector):
+                right_name = right._compile(leaves, scalars, lines, names)
+            else:
+                scalars.append(right)
+                right_name = f"s{len(scalars) - 1}"
+            name = f"t{len(lines)}"
+            lines.append(f"{name} = {left_name} {self._op} {right_name}")
+        names[key] = name
+        return name
+
+    def eval(self) -> Vector:
+        """
+        Evaluate the expression in a single pass over the components.
+
+        >>> a = Vector([1, 2, 3])
+        >>> (lazy(a) * 2 + a - a / 2).eval()
+        Vector([2.5, 5.0, 7.5])
+        >>> (lazy(Vector([1, 2], dtype="float32")) * 2).eval().dtype
+        'float32'
+        >>> (lazy(Vector([1, 2], dtype="float32")) + Vector([1, 2])).eval().dtype
+        'float64'
+        """
+        if self._value is None:
+            if self._op == "leaf":
+                self._value = self._args[0]
+            else:
+                leaves, scalars, lines = [], [], []
+                self._compile(leaves, scalars, lines, {})
+                kernel = _build_kernel(tuple(lines), len(leaves), len(scalars))
+                components = [leaf._components for leaf in leaves]
+                single = all(_storage_typecode(c) == "f" for c in components)
+                self._value = Vector._from_array(
+                    array("f" if single else "d", kernel(*components, *scalars))
+                )
+        return self._value
+
+    def __repr__(self) -> str:
+        """
+        >>> lazy(Vector([1, 2])) * 3
+        LazyVector([3.0, 6.0])
+        """
+        return f"Lazy{self.eval()!r}"
+
+    def __iter__(self) -> Iterator[float]:
+        """
+        >>> list(lazy(Vector([1, 2])) + Vector([1, 1]))
+        [2.0, 3.0]
+        """
+        return iter(self.eval())
+
+    def __abs__(self) -> float:
+        return abs(self.eval())
+
+    def __bool__(self) -> bool:
+        """
+        >>> bool(lazy(Vector([1, 2])) - Vector([1, 2]))
+        False
+        """
+        return bool(self.eval())
+
+    def __matmul__(self, other: Union[Vector, "LazyVector"]) -> float:
+        """
+        >>> (lazy(Vector([1, 2])) * 2) @ Vector([1, 1])
+        6.0
+        """
+        if isinstance(other, LazyVector):
+            other = other.eval()
+        return self.eval() @ other
+
+    __rmatmul__ = __matmul__
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, LazyVector):
+            other = other.eval()
+        return self.eval() == other
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        >>> lazy(Vector([1, 2])) * 2 < Vector([3, 4])
+        True
+        >>> Vector([3, 4]) <= lazy(Vector([1, 2])) * 2
+        False
+        """
+        if isinstance(other, LazyVector):
+            other = other.eval()
+        if not isinstance(other, Vector):
+            return NotImplemented
+        return self.eval() < other
+
+    __hash__ = None
+
+
+def _node(op: str, args: tuple, dim: int) -> LazyVector:
+    """
+    Create an operator node, evaluated right away if the tree gets too deep.
+
+    >>> x, v = lazy(Vector([0, 0]), Vector([1, 2]))
+    >>> for _ in range(1000):
+    ...     x = x + v * 0.5
+    >>> x.eval(), x._depth < MAX_DEPTH
+    (Vector([500.0, 1000.0]), True)
+    """
+    node = LazyVector(op, args, dim)
+    if node._depth >= MAX_DEPTH:
+        return lazy(node.eval())
+    return node
+
+
+@lru_cache(maxsize=KERNEL_CACHE_SIZE)
+def _build_kernel(
+    lines: tuple[str, ...], leaf_count: int, scalar_count: int
+) -> Callable:
+    """
+    Compile a function that runs the assignments for every component.
+
+    The last assignment holds the result. Expressions of the same shape
+    reuse the kernel; the cache is bounded by `KERNEL_CACHE_SIZE`, so a
+    process building many distinct shapes does not grow without limit.
+
+    >>> kernel = _build_kernel(("t0 = c1 * s0", "t1 = c0 + t0"), 2, 1)
+    >>> kernel([1.0, 2.0], [3.0, 4.0], 10.0)
+    [31.0, 42.0]
+    >>> _build_kernel(("t0 = c1 * s0", "t1 = c0 + t0"), 2, 1) is kernel
+    True
+    """
+    inputs = [f"x{i}" for i in range(leaf_count)]
+    components = [f"c{i}" for i in range(leaf_count)]
+    scalars = [f"s{i}" for i in range(scalar_count)]
+    if leaf_count == 1:
+        loop = "for c0 in x0:"
+    else:
+        loop = f"for {', '.join(components)} in zip({', '.join(inputs)}):"
+    result = lines[-1].split(" = ", 1)[0]
+    body = "".join(f"        {line}\n" for line in lines)
+    source = (
+        f"def kernel({', '.join(inputs + scalars)}):\n"
+        "    result = []\n"
+        "    append = result.append\n"
+        f"    {loop}\n"
+        f"{body}"
+        f"        append({result})\n"
+        "    return result\n"
+    )
+    namespace = {}
+    exec(source, namespace)
+    return namespace["kernel"]
+
+
+def lazy(*vectors: Vector) -> Union[LazyVector, tuple[LazyVector, ...]]:
+    """
+    Wrap vectors so that operators on them build a lazy expression.
+
+    A single vector returns a single node, several vectors a tuple of nodes.
+
+    >>> lazy(Vector([1, 2]))
+    LazyVector([1.0, 2.0])
+    >>> a, b = lazy(Vector([1, 2]), Vector([3, 4]))
+    >>> (a + b).eval()
+    Vector([4.0, 6.0])
+    >>> lazy("not a vector")
+    Traceback (most recent call last):
+    TypeError: lazy() expects Vector arguments.
+    """
+    nodes = []
+    for vector in vectors:
+        if isinstance(vector, LazyVector):
+            nodes.append(vector)
+        elif isinstance(vector, Vector):
+            nodes.append(LazyVector("leaf", (vector,), len(vector)))
+        else:
+            raise TypeError("lazy() expects Vector arguments.")
+    return nodes[0] if len(nodes) == 1 else tuple(nodes)
@@ -0,0 +1,171 @@
+from typing import Iterable, Union
+
+import numpy as np
+
+from vector import Vector
+
+
+class AngularLSHIndex:
+    """
+    Approximate search for the vectors with the smallest `angle_to` a query.
+
+    Random-hyperplane locality-sensitive hashing: each of `tables` hash
+    tables draws `bits` random hyperplanes and stores every vector under
+    the bit pattern of the sides it lies on. Two vectors with angle θ
+    agree on one bit with probability 1 - θ/π, so vectors pointing in a
+    similar direction tend to end up in the same bucket.
+
+    A query only looks at the vectors in its buckets and ranks these
+    candidates by their exact `angle_to`. The trade-off between recall
+    and latency is tuned with:
+        * `tables`: more tables find more true neighbours (higher recall).
+        * `bits`: more bits give smaller buckets (lower latency).
+        * `probes`: per table, additionally visit the buckets obtained by
+          flipping the bits the query is least sure about (multi-probe).
+
+    `benchmark_lsh.py` compares recall and latency with exhaustive search.
+
+    Attributes:
+        _vectors (list): The indexed vectors.
+        _points (np.ndarray): Their components as an (n, d) float64 array.
+        _norms (np.ndarray): Their magnitudes.
+        _planes (np.ndarray): Hyperplane normals of shape (tables, bits, d).
+        _buckets (list): One dict per table mapping a hash to row numbers.
+
+    Example usage:
+        >>> vectors = [Vector([1, 0]), Vector([1, 0.1]), Vector([-1, 0])]
+        >>> index = AngularLSHIndex(vectors, tables=4, bits=2, seed=0)
+        >>> [v for _, v in index.query(Vector([1, 0.02]), k=2)]
+        [Vector([1.0, 0.0]), Vector([1.0, 0.1])]
+    """
+
+    def __init__(
+        self,
+        vectors: Iterable[Vector],
+        tables: int = 8,
+        bits: int = 12,
+        probes: int = 0,
+        seed: Union[int, None] = None,
+    ) -> None:
+        """
+        Hash all vectors into `tables` hash tables of `bits` hyperplanes each.
+
+        >>> AngularLSHIndex([Vector([1, 2]), Vector([0, 0])])
+        Traceback (most recent call last):
+        ValueError: Cannot calculate angle with a zero vector.
+        >>> AngularLSHIndex([Vector([1, 2])], bits=64)
+        Traceback (most recent call last):
+        ValueError: bits must be between 1 and 62.
+        """
+        vectors = list(vectors)
+        if not vectors:
+            raise ValueError(
+                "Cannot build an index from an empty iterable of vectors."
+            )
+        if len({len(v) for v in vectors}) > 1:
+            raise ValueError("All vectors must have the same dimensionality.")
+        if tables < 1:
+            raise ValueError("tables must be at least 1.")
+        if not 1 <= bits <= 62:
+            raise ValueError("bits must be between 1 and 62.")
+        if not 0 <= probes <= bits:
+            raise ValueError("probes must be between 0 and bits.")
+
+        self._vectors = vectors
+        self._points = np.array(vectors, dtype=np.float64).reshape(len(vectors), -1)
+        self._norms = np.linalg.norm(self._points, axis=1)
+        if np.any(self._norms == 0):
+            raise ValueError("Cannot calculate angle with a zero vector.")
+        self.probes = probes
+
+        rng = np.random.default_rng(seed)
+        self._planes = rng.standard_normal((tables, bits, self._points.shape[1]))
+        self._powers = 1 << np.arange(bits, dtype=np.int64)
+        self._buckets = []
+        for planes in self._planes:
+            codes = (self._points @ planes.T > 0) @ self._powers
+            order = np.argsort(codes, kind="stable")
+            keys, starts = np.unique(codes[order], return_index=True)
+            groups = np.split(order, starts[1:])
+            self._buckets.append(dict(zip(keys.tolist(), groups)))
+
+    def __len__(self) -> int:
+        return len(self._vectors)
+
+    def candidates(self, query: Vector) -> np.ndarray:
+        """
+        Return the row numbers of all vectors sharing a bucket with the query.
+
+        >>> vectors = [Vector([1, 0]), Vector([-1, 0])]
+        >>> index = AngularLSHIndex(vectors, tables=1, bits=4, seed=0)
+        >>> index.candidates(Vector([2, 0])).tolist()
+        [0]
+        """
+        point = self._query_point(query)
+        found = []
+        for planes, buckets in zip(self._planes, self._buckets):
+            projections = planes @ point
+            code = int((projections > 0) @ self._powers)
+            codes = [code]
+            # Multi-probe: flip the bits whose hyperplanes are closest to the query.
+            for bit in np.argsort(np.abs(projections))[: self.probes].tolist():
+                codes.append(code ^ (1 << bit))
+            found.extend(buckets[c] for c in codes if c in buckets)
+        if not found:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(found))
+
+    def query(self, query: Vector, k: int = 1) -> list[tuple[float, Vector]]:
+        """
+        Return up to k candidates with the smallest angle to the query.
+
+        The (angle, vector) pairs are sorted by increasing angle, which is
+        computed with `Vector.angle_to`. Fewer than k pairs are returned if
+        the buckets of the query hold fewer candidates.
+
+        >>> index = AngularLSHIndex([Vector([1, i]) for i in range(5)], seed=1)
+        >>> [(round(angle, 3), v) for angle, v in index.query(Vector([1, 0]), k=1)]
+        [(0.0, Vector([1.0, 0.0]))]
+        >>> index.query(Vector([0, 0]))
+        Traceback (most recent call last):
+        ValueError: Cannot calculate angle with a zero vector.
+        """
+        if k < 1:
+            raise ValueError("k must be at least 1.")
+        rows = self.candidates(query)
+        if len(rows) > k:
+            point = np.asarray(query)
+            cosines = (self._points[rows] @ point) / self._norms[rows]
+            rows = rows[np.argpartition(-cosines, k - 1)[:k]]
+        neighbours = [self._vectors[row] for row in rows.tolist()]
+        results = [(query.angle_to(vector), vector) for vector in neighbours]
+        results.sort(key=lambda pair: pair[0])
+        return results
+
+    def _query_point(self, query: Vector) -> np.ndarray:
+        """Return the query as an array after checking it."""
+        if not isinstance(query, Vector):
+            raise TypeError("Queries must be Vector objects.")
+        if len(query) != self._points.shape[1]:
+            raise ValueError(
+                "Vectors must have the same dimensionality for angle calculation."
+            )
+        if not query:
+            raise ValueError("Cannot calculate angle with a zero vector.")
+        return np.asarray(query)
+
+
+def exhaustive_angle_search(
+    vectors: list[Vector], query: Vector, k: int = 1
+) -> list[tuple[float, Vector]]:
+    """
+    Return the k vectors with the smallest angle to the query by checking all.
+
+    This is the exact reference that `AngularLSHIndex.query` approximates.
+
+    >>> exhaustive_angle_search([Vector([0, 1]), Vector([1, 1])], Vector([1, 0]))
+    [(0.7853981633974484, Vector([1.0, 1.0]))]
+    """
+    pairs = [(query.angle_to(v), v) for v in vectors]
+    pairs.sort(key=lambda pair: pair[0])
+    return pairs[:k]
@@ -0,0 +1,370 @@
+"""
+A matrix type for linear maps on vectors.
+
+`Vector @ Vector` is the dot product, so applying a linear map used to
+mean one `@` per row of the matrix, with every row a `Vector` of its
+own. A `Matrix` keeps all entries in one contiguous `array('d')`, row
+by row, and computes its products with the `matmul` kernel of the
+active backend (see `vector_backends.py`); the numpy backend is the
+fastest for large products.
+
+    >>> rotate = Matrix([[0, -1], [1, 0]])
+    >>> rotate @ Vector([1, 2])
+    Vector([-2.0, 1.0])
+    >>> rotate @ rotate
+    Matrix([[-1.0, 0.0], [0.0, -1.0]])
+    >>> rotate.apply([Vector([1, 0]), Vector([0, 1])])
+    [Vector([0.0, 1.0]), Vector([-1.0, 0.0])]
+"""
+import numbers
+from array import array
+from typing import Any, Iterable, Iterator, Union
+
+import vector_backends
+from vector import Vector
+
+
+class Matrix:
+    """
+    An immutable matrix of floats stored row by row in one `array('d')`.
+
+    Operators:
+        * `matrix @ vector`: the linear map applied to a `Vector`.
+        * `vector @ matrix`: the row vector times the matrix.
+        * `matrix @ other`: the matrix product.
+        * `matrix.T`: the transpose.
+        * `matrix.apply(vectors)`: the map applied to a whole batch with a
+          single matrix product.
+
+    Attributes:
+        _data (array): The entries, row by row (row-major order).
+        _rows (int): The number of rows.
+        _cols (int): The number of columns.
+
+    Example usage:
+        >>> m = Matrix([[1, 2, 3], [4, 5, 6]])
+        >>> m.shape, m[1], m[1, 2]
+        ((2, 3), Vector([4.0, 5.0, 6.0]), 6.0)
+        >>> m.T
+        Matrix([[1.0, 4.0], [2.0, 5.0], [3.0, 6.0]])
+        >>> Vector([1, 1]) @ m
+        Vector([5.0, 7.0, 9.0])
+    """
+
+    __slots__ = ("_data", "_rows", "_cols")
+
+    def __init__(self, rows: Iterable[Iterable[numbers.Real]] = ()) -> None:
+        """
+        Initialize a matrix from an iterable of rows, e.g. lists or vectors.
+
+        >>> Matrix([Vector([1, 2]), Vector([3, 4])]).shape
+        (2, 2)
+        >>> Matrix([[1, 2], [3]])
+        Traceback (most recent call last):
+        ValueError: All rows must have the same number of columns.
+        """
+        rows = [list(row) for row in rows]
+        cols = len(rows[0]) if rows else 0
+        if any(len(row) != cols for row in rows):
+            raise ValueError("All rows must have the same number of columns.")
+        entries = [entry for row in rows for entry in row]
+        if any(not isinstance(entry, numbers.Real) for entry in entries):
+            raise TypeError("All entries must be real numbers (int or float).")
+        self._data = array("d", map(float, entries))
+        self._rows = len(rows)
+        self._cols = cols
+
+    @classmethod
+    def _from_array(cls, data: array, rows: int, cols: int) -> "Matrix":
+        """Wrap a row-major `array('d')` without validating or copying it."""
+        matrix = cls.__new__(cls)
+        matrix._data = data
+        matrix._rows = rows
+        matrix._cols = cols
+        return matrix
+
+    @classmethod
+    def zeros(cls, rows: int, cols: int) -> "Matrix":
+        """
+        Create a matrix of the given shape filled with zeros.
+
+        >>> Matrix.zeros(2, 3)
+        Matrix([[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]])
+        """
+        return cls._from_array(array("d", bytes(8 * rows * cols)), rows, cols)
+
+    @classmethod
+    def identity(cls, size: int) -> "Matrix":
+        """
+        Create the identity matrix of the given size.
+
+        >>> Matrix.identity(2)
+        Matrix([[1.0, 0.0], [0.0, 1.0]])
+        """
+        matrix = cls.zeros(size, size)
+        matrix._data[:: size + 1] = array("d", [1.0]) * size
+        return matrix
+
+    @classmethod
+    def from_columns(cls, columns: Iterable[Iterable[numbers.Real]]) -> "Matrix":
+        """
+        Create a matrix whose columns are the given vectors.
+
+        >>> Matrix.from_columns([Vector([1, 2]), Vector([3, 4])])
+        Matrix([[1.0, 3.0], [2.0, 4.0]])
+        """
+        return cls(columns).T
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """The number of rows and columns."""
+        return self._rows, self._cols
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return self._rows
+
+    def _row(self, index: int) -> array:
+        return self._data[index * self._cols : (index + 1) * self._cols]
+
+    def __getitem__(self, index: Union[int, tuple[int, int]]) -> Union[Vector, float]:
+        """
+        Return a row as a `Vector`, or a single entry for `matrix[i, j]`.
+
+        >>> m = Matrix([[1, 2], [3, 4]])
+        >>> m[-1], m[0, 1]
+        (Vector([3.0, 4.0]), 2.0)
+        >>> m[2]
+        Traceback (most recent call last):
+        IndexError: Matrix index out of range.
+        """
+        if isinstance(index, tuple):
+            row, col = index
+            row = self._check_index(row, self._rows)
+            return self._data[row * self._cols + self._check_index(col, self._cols)]
+        return Vector._from_array(self._row(self._check_index(index, self._rows)))
+
+    @staticmethod
+    def _check_index(index: int, size: int) -> int:
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("Matrix index out of range.")
+        return index
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Iterate over the rows as vectors."""
+        return (Vector._from_array(self._row(i)) for i in range(self._rows))
+
+    def column(self, index: int) -> Vector:
+        """
+        Return a column as a `Vector`.
+
+        >>> Matrix([[1, 2], [3, 4]]).column(1)
+        Vector([2.0, 4.0])
+        """
+        index = self._check_index(index, self._cols)
+        return Vector._from_array(self._data[index :: self._cols])
+
+    def transpose(self) -> "Matrix":
+        """
+        Return the transposed matrix.
+
+        Each column is copied with one strided slice of the storage.
+
+        >>> Matrix([[1, 2]]).transpose()
+        Matrix([[1.0], [2.0]])
+        """
+        data = array("d")
+        for col in range(self._cols):
+            data.extend(self._data[col :: self._cols])
+        return Matrix._from_array(data, self._cols, self._rows)
+
+    @property
+    def T(self) -> "Matrix":
+        """The transposed matrix, like `ndarray.T`."""
+        return self.transpose()
+
+    def __repr__(self) -> str:
+        return f"Matrix({[list(self._row(i)) for i in range(self._rows)]})"
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Return True if both matrices have the same shape and entries.
+
+        Unlike `Vector`, matrices are compared entry by entry.
+
+        >>> Matrix([[1, 2]]) == Matrix([[1.0, 2.0]])
+        True
+        >>> Matrix([[1, 2]]) == Matrix([[2, 1]])
+        False
+        >>> Matrix([[0.0]]) == Matrix([[-0.0]])
+        True
+        """
+        if not isinstance(other, Matrix):
+            return NotImplemented
+        return self.shape == other.shape and self._data == other._data
+
+    def __hash__(self) -> int:
+        """
+        Hash the entries as floats, consistent with `__eq__`.
+
+        >>> hash(Matrix([[0.0]])) == hash(Matrix([[-0.0]]))
+        True
+        """
+        return hash((self.shape, tuple(self._data)))
+
+    def __array__(self, dtype=None, copy=None):
+        """
+        Convert the matrix to a 2-D NumPy array, read-only and without copy.
+
+        >>> import numpy as np
+        >>> np.asarray(Matrix([[1, 2], [3, 4]])).sum(axis=0)
+        array([4., 6.])
+        """
+        import numpy as np
+
+        result = np.frombuffer(self._data, dtype=np.float64)
+        result = result.reshape(self._rows, self._cols)
+        result.flags.writeable = False
+        if dtype is not None:
+            result = result.astype(dtype, copy=False)
+        return result.copy() if copy else result
+
+    def __matmul__(self, other: Union[Vector, "Matrix"]) -> Union[Vector, "Matrix"]:
+        """
+        Apply the matrix to a vector, or multiply it with another matrix.
+
+        >>> Matrix([[1, 2], [3, 4]]) @ Matrix([[1], [1]])
+        Matrix([[3.0], [7.0]])
+        >>> Matrix([[1, 2], [3, 4]]) @ Vector([1, 2, 3])
+        Traceback (most recent call last):
+        ValueError: Cannot multiply a 2 x 2 matrix with a vector of dimension 3.
+        """
+        if isinstance(other, Vector):
+            if len(other) != self._cols:
+                raise ValueError(
+                    f"Cannot multiply a {self._rows} x {self._cols} matrix "
+                    f"with a vector of dimension {len(other)}."
+                )
+            return Vector._from_array(
+                vector_backends.active.matmul(
+                    self._data, other._components, self._rows, self._cols, 1
+                )
+            )
+        if isinstance(other, Matrix):
+            if other._rows != self._cols:
+                raise ValueError(
+                    f"Cannot multiply a {self._rows} x {self._cols} matrix "
+                    f"with a {other._rows} x {other._cols} matrix."
+                )
+            data = vector_backends.active.matmul(
+                self._data, other._data, self._rows, self._cols, other._cols
+            )
+            return Matrix._from_array(data, self._rows, other._cols)
+        return NotImplemented
+
+    def __rmatmul__(self, other: Vector) -> Vector:
+        """
+        Multiply a row vector from the left, `vector @ matrix`.
+
+        >>> Vector([1, 2]) @ Matrix([[1, 0, 1], [0, 1, 1]])
+        Vector([1.0, 2.0, 3.0])
+        """
+        if not isinstance(other, Vector):
+            return NotImplemented
+        if len(other) != self._rows:
+            raise ValueError(
+                f"Cannot multiply a vector of dimension {len(other)} "
+                f"with a {self._rows} x {self._cols} matrix."
+            )
+        return Vector._from_array(
+            vector_backends.active.matmul(
+                other._components, self._data, 1, self._rows, self._cols
+            )
+        )
+
+    def apply(self, vectors: Any) -> Any:
+        """
+        Apply the matrix to every vector of a batch with one matrix product.
+
+        The vectors are stacked as the rows of a matrix V, and the results
+        are the rows of V @ M.T. A list (or any iterable) of `Vector` gives
+        a list of `Vector`; a `VectorArray` or a 2-D NumPy array gives a
+        `VectorArray`, computed in NumPy without converting any rows.
+
+        >>> from vector_array import VectorArray
+        >>> scale = Matrix([[2, 0], [0, 3]])
+        >>> scale.apply(VectorArray([[1, 1], [2, 2]]))
+        VectorArray([Vector([2.0, 3.0]), Vector([4.0, 6.0])])
+        >>> scale.apply([Vector([1, 2], dtype="float32")])
+        [Vector([2.0, 6.0])]
+        >>> scale.apply([Vector([1, 2, 3])])
+        Traceback (most recent call last):
+        ValueError: Cannot multiply a 2 x 2 matrix with a vector of dimension 3.
+        """
+        if hasattr(vectors, "__array__") and not isinstance(vectors, Vector):
+            import numpy as np
+
+            from vector_array import VectorArray
+
+            rows = np.asarray(vectors, dtype=np.float64)
+            if rows.ndim != 2 or rows.shape[1] != self._cols:
+                raise ValueError(
+                    f"Cannot multiply a {self._rows} x {self._cols} matrix "
+                    f"with vectors of shape {rows.shape}."
+                )
+            return VectorArray(rows @ np.asarray(self).T)
+
+        data = array("d")
+        count = 0
+        for vector in vectors:
+            if len(vector) != self._cols:
+                raise ValueError(
+                    f"Cannot multiply a {self._rows} x {self._cols} matrix "
+                    f"with a vector of dimension {len(vector)}."
+                )
+            components = vector._components if isinstance(vector, Vector) else vector
+            if getattr(components, "typecode", None) == "d":
+                data.extend(components)
+            else:
+                # float32 storage, views and plain sequences
+                data.extend(map(float, components))
+            count += 1
+        results = vector_backends.active.matmul(
+            data, self.transpose()._data, count, self._cols, self._rows
+        )
+        rows = self._rows
+        return [
+            Vector._from_array(results[i * rows : (i + 1) * rows]) for i in range(count)
+        ]
+
+
+if __name__ == "__main__":
+    import random
+    import time
+
+    dim, count = 64, 10_000
+    matrix = Matrix([[random.gauss(0, 1) for _ in range(dim)] for _ in range(dim)])
+    vectors = [Vector([random.random() for _ in range(dim)]) for _ in range(count)]
+
+    start = time.perf_counter()
+    one_at_a_time = [Vector([row @ v for row in matrix]) for v in vectors]
+    rows_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    per_vector = [matrix @ v for v in vectors]
+    matvec_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batched = matrix.apply(vectors)
+    batch_time = time.perf_counter() - start
+
+    print(f"{count} vectors, d={dim}, backend {vector_backends.active.name}")
+    print(f"one `row @ v` per row:  {rows_time:.3f} s")
+    print(f"`matrix @ v` per vector: {matvec_time:.3f} s")
+    print(f"`matrix.apply(vectors)`: {batch_time:.3f} s")
+    deviation = max(
+        abs(x - y) for a, b in zip(one_at_a_time, batched) for x, y in zip(a, b)
+    )
+    print(f"Max deviation: {deviation:.2e}")
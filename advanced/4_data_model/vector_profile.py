@@ -0,0 +1,294 @@
+"""
+Opt-in call counters and timers for the methods of `Vector`.
+
+When a job that uses many vectors gets slow, a profiler like cProfile
+shows a flat list of thousands of functions. `profile()` records only
+the methods of the vector classes: how often each one is called, how
+much time it takes in total and how many vectors it creates.
+
+    >>> from vector import Vector
+    >>> with profile() as stats:
+    ...     total = sum((Vector([i, i]) for i in range(3)), Vector([0, 0]))
+    >>> stats["Vector.__add__"].calls, stats["Vector.__add__"].allocations
+    (3, 3)
+    >>> stats["Vector.__init__"].calls
+    4
+
+Slices (`VectorView`) and the generated `Vector2`/`Vector3` are counted too:
+
+    >>> from vector_fixed import Vector2
+    >>> with profile() as stats:
+    ...     window = Vector([1, 2, 3])[1:]
+    ...     moved = Vector2([1, 2]) + Vector2([3, 4])
+    >>> stats["VectorView._from_buffer"].allocations, stats["Vector2._new"].calls
+    (1, 1)
+    >>> print(stats.report(sort_by="calls", limit=2))  # doctest: +SKIP
+    method                       calls    total ms   us/call   vectors
+    Vector.__init__                  4       0.012      3.00         4
+    Vector.__add__                   3       0.008      2.67         3
+
+Profiling can also be switched on for a whole program without changing
+its code: with the environment variable `VECTOR_PROFILE` set, `vector.py`
+enables it on import and prints the report to stderr at exit. The value
+selects the sort order, "time" (also for any other value like "1"),
+"calls" or "allocations":
+
+    VECTOR_PROFILE=calls python my_job.py
+
+While profiling is disabled, the classes are untouched and there is no
+overhead at all: `enable()` replaces the methods with timing wrappers
+and `disable()` puts the original functions back.
+
+Notes:
+    - Times are cumulative: the time of `__add__` includes the time of
+      `_from_array` it calls, like "cumtime" in cProfile.
+    - Allocations count the vectors created during a method, again
+      including nested calls. Every vector is created by one of the
+      `CONSTRUCTORS`: `__init__`, `_from_array` (`from_array` for
+      `MutableVector`), `VectorView._from_buffer` for slices and the
+      `_new` function of the generated `Vector2` and `Vector3`.
+    - `vector_fixed.py` adds `Vector2` and `Vector3` to a profile started
+      by `VECTOR_PROFILE`, and `profile()` includes them by default once
+      `vector_fixed` is imported.
+    - The counters are not thread-safe; profile one thread at a time.
+"""
+import atexit
+import functools
+import os
+import sys
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, NamedTuple, Union
+
+PROFILE_ENV = "VECTOR_PROFILE"
+SORT_KEYS = ("time", "calls", "allocations", "name")
+# The methods through which all vectors are created. `__new__` itself is
+# not replaced: once set on a class, it cannot be removed cleanly again.
+CONSTRUCTORS = ("__init__", "_from_array", "from_array", "_from_buffer", "_new")
+
+
+class MethodStats(NamedTuple):
+    """The recorded numbers of one method."""
+
+    name: str
+    calls: int
+    time: float
+    allocations: int
+
+    @property
+    def time_per_call(self) -> float:
+        """The mean time of one call in seconds."""
+        return self.time / self.calls if self.calls else 0.0
+
+
+class VectorProfile:
+    """
+    The counters filled by the wrappers while profiling is enabled.
+
+    Attributes:
+        _entries (dict): Method name -> [calls, nanoseconds, allocations].
+        _allocations (int): Number of vectors created so far.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, list[int]] = {}
+        self._allocations = 0
+
+    def _entry(self, name: str) -> list[int]:
+        return self._entries.setdefault(name, [0, 0, 0])
+
+    def __getitem__(self, name: str) -> MethodStats:
+        """Return the numbers of one method, e.g. `stats["Vector.__abs__"]`."""
+        calls, nanoseconds, allocations = self._entries.get(name, (0, 0, 0))
+        return MethodStats(name, calls, nanoseconds / 1e9, allocations)
+
+    def rows(self, sort_by: str = "time") -> list[MethodStats]:
+        """
+        Return the numbers of all called methods, largest first.
+
+        >>> VectorProfile().rows(sort_by="memory")
+        Traceback (most recent call last):
+        ValueError: sort_by must be one of: time, calls, allocations, name.
+        """
+        if sort_by not in SORT_KEYS:
+            raise ValueError(f"sort_by must be one of: {', '.join(SORT_KEYS)}.")
+        rows = [self[name] for name, entry in self._entries.items() if entry[0]]
+        if sort_by == "name":
+            return sorted(rows)
+        return sorted(rows, key=lambda row: getattr(row, sort_by), reverse=True)
+
+    def report(self, sort_by: str = "time", limit: Union[int, None] = None) -> str:
+        """Return a table of the called methods, sorted by the given column."""
+        lines = [
+            f"{'method':<28}{'calls':>6}{'total ms':>12}{'us/call':>10}{'vectors':>10}"
+        ]
+        for row in self.rows(sort_by)[:limit]:
+            lines.append(
+                f"{row.name:<28}{row.calls:>6}{row.time * 1e3:>12.3f}"
+                f"{row.time_per_call * 1e6:>10.2f}{row.allocations:>10}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Set all counters back to zero."""
+        self._entries.clear()
+        self._allocations = 0
+
+
+# The profile being recorded and the class attributes (or module globals,
+# given as their dict) replaced for it.
+_active: Union[VectorProfile, None] = None
+_replaced: list[tuple[Union[type, dict], str, Any]] = []
+
+
+def _timed(
+    function: Any, entry: list[int], profile: VectorProfile, allocates: bool
+) -> Any:
+    """Wrap a function to add its calls, time and allocations to `entry`."""
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        allocations = profile._allocations
+        profile._allocations += allocates
+        start = time.perf_counter_ns()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            entry[1] += time.perf_counter_ns() - start
+            entry[0] += 1
+            entry[2] += profile._allocations - allocations
+
+    return wrapper
+
+
+def _instrumented(
+    attribute: Any, cls: type, name: str, profile: VectorProfile
+) -> Any:
+    """Return the wrapped class attribute, None if it is not a method."""
+    entry = profile._entry(f"{cls.__name__}.{name}")
+    allocates = name in CONSTRUCTORS
+    if isinstance(attribute, (classmethod, staticmethod)):
+        function = _timed(attribute.__func__, entry, profile, allocates)
+        return type(attribute)(function)
+    if isinstance(attribute, property):
+        if attribute.fget is None:
+            return None
+        return property(
+            _timed(attribute.fget, entry, profile, allocates),
+            attribute.fset,
+            attribute.fdel,
+            attribute.__doc__,
+        )
+    if callable(attribute) and hasattr(attribute, "__code__"):
+        return _timed(attribute, entry, profile, allocates)
+    return None
+
+
+def _default_classes() -> tuple[type, ...]:
+    from vector import MutableVector, Vector, VectorView
+
+    fixed = sys.modules.get("vector_fixed")
+    if fixed is None:
+        return Vector, VectorView, MutableVector
+    return Vector, VectorView, MutableVector, fixed.Vector2, fixed.Vector3
+
+
+def _instrument(classes: tuple[type, ...], profile: VectorProfile) -> None:
+    """
+    Replace the methods of the classes by wrappers recording into `profile`.
+
+    A static constructor that the methods of its class call as a module
+    global (`_new` of the generated classes in `vector_fixed.py`) is
+    replaced in the module namespace as well.
+    """
+    for cls in classes:
+        for name, attribute in list(vars(cls).items()):
+            wrapped = _instrumented(attribute, cls, name, profile)
+            if wrapped is None:
+                continue
+            _replaced.append((cls, name, attribute))
+            setattr(cls, name, wrapped)
+            if isinstance(attribute, staticmethod) and name in CONSTRUCTORS:
+                namespace = attribute.__func__.__globals__
+                if namespace.get(name) is attribute.__func__:
+                    _replaced.append((namespace, name, attribute.__func__))
+                    namespace[name] = wrapped.__func__
+
+
+def enable(*classes: type) -> VectorProfile:
+    """
+    Start profiling the given classes, by default all vector classes.
+
+    Returns the `VectorProfile` that collects the numbers until `disable()`.
+
+    >>> stats = enable()
+    >>> enable()
+    Traceback (most recent call last):
+    RuntimeError: Vector profiling is already enabled.
+    >>> disable() is stats
+    True
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("Vector profiling is already enabled.")
+    profile = VectorProfile()
+    _instrument(classes or _default_classes(), profile)
+    _active = profile
+    return profile
+
+
+def disable() -> Union[VectorProfile, None]:
+    """
+    Stop profiling and restore the original methods.
+
+    Returns the finished `VectorProfile`, None if profiling was not enabled.
+    """
+    global _active
+    while _replaced:
+        target, name, attribute = _replaced.pop()
+        if isinstance(target, dict):
+            target[name] = attribute
+        else:
+            setattr(target, name, attribute)
+    profile, _active = _active, None
+    return profile
+
+
+@contextmanager
+def profile(*classes: type) -> Iterator[VectorProfile]:
+    """
+    Profile the given classes (default: all vector classes) in a block.
+
+    >>> from vector import Vector
+    >>> add = Vector.__add__
+    >>> with profile():
+    ...     Vector.__add__ is add
+    False
+    >>> Vector.__add__ is add
+    True
+    """
+    stats = enable(*classes)
+    try:
+        yield stats
+    finally:
+        disable()
+
+
+def enable_from_environment(*classes: type, environ: Any = None) -> None:
+    """
+    Enable profiling if `VECTOR_PROFILE` is set and report at exit.
+
+    Called by `vector.py` on import with its own classes. Modules imported
+    later (`vector_fixed.py`) call it again; their classes are then added
+    to the running profile.
+    """
+    sort_by = (environ if environ is not None else os.environ).get(PROFILE_ENV)
+    if not sort_by:
+        return
+    if _active is not None:
+        _instrument(classes, _active)
+        return
+    if sort_by not in SORT_KEYS:
+        sort_by = "time"
+    stats = enable(*classes)
+    atexit.register(lambda: print(stats.report(sort_by), file=sys.stderr))
@@ -0,0 +1,211 @@
+from bisect import bisect_left, bisect_right
+from itertools import chain, islice
+from typing import Iterable, Iterator
+
+from vector import Vector
+
+
+class MagnitudeSortedVectors:
+    """
+    A collection of vectors kept sorted by magnitude.
+
+    `Vector` defines a total order by magnitude, so `sorted(vectors)` works,
+    but answering "all vectors with a norm between a and b" or "the k
+    largest vectors" on a plain list needs a full scan or a full sort
+    after every change. This container keeps the vectors sorted by their
+    cached squared norm and answers both questions with `bisect`.
+
+    Internally the vectors are stored in a list of sorted buckets of at
+    most `2 * load` entries (the layout used by the `sortedcontainers`
+    package). Finding the bucket is a binary search over the bucket
+    maxima, and inserting into a bucket only moves a bounded number of
+    entries, so `add` and `remove` are O(log n) amortized.
+
+    Attributes:
+        _keys (list): Per bucket, the sorted squared norms.
+        _vectors (list): Per bucket, the vectors in the same order.
+        _maxes (list): The largest squared norm of every bucket.
+
+    Example usage:
+        >>> vectors = MagnitudeSortedVectors(
+        ...     [Vector([3, 4]), Vector([1, 0]), Vector([0, 2])]
+        ... )
+        >>> vectors.range(1.5, 5)
+        [Vector([0.0, 2.0]), Vector([3.0, 4.0])]
+        >>> vectors.k_largest(1)
+        [Vector([3.0, 4.0])]
+        >>> vectors.add(Vector([0, 0, 3]))
+        >>> vectors.k_smallest(3)
+        [Vector([1.0, 0.0]), Vector([0.0, 2.0]), Vector([0.0, 0.0, 3.0])]
+
+    Notes:
+        - Vectors of different dimensions can be mixed, like with `<`.
+        - Bounds are compared as squared magnitudes, so a vector whose
+          magnitude equals a bound up to rounding may fall on either side.
+    """
+
+    def __init__(self, vectors: Iterable[Vector] = (), load: int = 500) -> None:
+        """
+        Bulk load the vectors with a single sort.
+
+        >>> len(MagnitudeSortedVectors(Vector([i]) for i in range(2000)))
+        2000
+        """
+        if load < 1:
+            raise ValueError("load must be at least 1.")
+        self._load = load
+        pairs = sorted(
+            ((self._key(v), v) for v in vectors), key=lambda pair: pair[0]
+        )
+        chunks = [pairs[i : i + load] for i in range(0, len(pairs), load)]
+        self._keys = [[key for key, _ in chunk] for chunk in chunks]
+        self._vectors = [[v for _, v in chunk] for chunk in chunks]
+        self._maxes = [keys[-1] for keys in self._keys]
+        self._len = len(pairs)
+
+    @staticmethod
+    def _key(vector: Vector) -> float:
+        if not isinstance(vector, Vector):
+            raise TypeError("Only Vector objects can be stored.")
+        return vector._squared_norm()
+
+    def __len__(self) -> int:
+        return self._len
+
+    def __iter__(self) -> Iterator[Vector]:
+        """Iterate over the vectors from the smallest to the largest magnitude."""
+        return chain.from_iterable(self._vectors)
+
+    def __reversed__(self) -> Iterator[Vector]:
+        """Iterate over the vectors from the largest to the smallest magnitude."""
+        return chain.from_iterable(map(reversed, reversed(self._vectors)))
+
+    def __repr__(self) -> str:
+        return f"MagnitudeSortedVectors([{', '.join(repr(v) for v in self)}])"
+
+    def __contains__(self, vector: Vector) -> bool:
+        """
+        Check if a vector with exactly these components is stored.
+
+        >>> vectors = MagnitudeSortedVectors([Vector([3, 4])])
+        >>> Vector([3, 4]) in vectors, Vector([4, 3]) in vectors
+        (True, False)
+        """
+        return self._find(vector) is not None
+
+    def add(self, vector: Vector) -> None:
+        """
+        Insert a vector at its position in the magnitude order.
+
+        >>> vectors = MagnitudeSortedVectors(load=2)
+        >>> for x in [5, 1, 4, 2, 3]:
+        ...     vectors.add(Vector([x]))
+        >>> [v[0] for v in vectors]
+        [1.0, 2.0, 3.0, 4.0, 5.0]
+        """
+        key = self._key(vector)
+        if not self._maxes:
+            self._keys.append([key])
+            self._vectors.append([vector])
+            self._maxes.append(key)
+            self._len = 1
+            return
+
+        position = bisect_right(self._maxes, key)
+        if position == len(self._maxes):
+            position -= 1
+        keys, bucket = self._keys[position], self._vectors[position]
+        index = bisect_right(keys, key)
+        keys.insert(index, key)
+        bucket.insert(index, vector)
+        self._maxes[position] = keys[-1]
+        self._len += 1
+
+        if len(keys) > 2 * self._load:
+            self._keys[position + 1 : position + 1] = [keys[self._load :]]
+            self._vectors[position + 1 : position + 1] = [bucket[self._load :]]
+            del keys[self._load :], bucket[self._load :]
+            self._maxes.insert(position, keys[-1])
+
+    def _find(self, vector: Vector):
+        """Return (bucket, index) of a vector with the same components or None."""
+        key = self._key(vector)
+        components = vector.components
+        position = bisect_left(self._maxes, key)
+        while position < len(self._maxes):
+            keys, bucket = self._keys[position], self._vectors[position]
+            index = bisect_left(keys, key)
+            while index < len(keys) and keys[index] == key:
+                candidate = bucket[index]
+                if candidate is vector or candidate.components == components:
+                    return position, index
+                index += 1
+            if index < len(keys):
+                return None
+            position += 1
+        return None
+
+    def remove(self, vector: Vector) -> None:
+        """
+        Remove a vector with exactly these components.
+
+        >>> vectors = MagnitudeSortedVectors([Vector([3, 4]), Vector([4, 3])])
+        >>> vectors.remove(Vector([4, 3]))
+        >>> list(vectors)
+        [Vector([3.0, 4.0])]
+        >>> vectors.remove(Vector([0, 5]))
+        Traceback (most recent call last):
+        ValueError: Vector([0.0, 5.0]) is not in the collection.
+        """
+        found = self._find(vector)
+        if found is None:
+            raise ValueError(f"{vector!r} is not in the collection.")
+        position, index = found
+        keys, bucket = self._keys[position], self._vectors[position]
+        del keys[index], bucket[index]
+        self._len -= 1
+        if keys:
+            self._maxes[position] = keys[-1]
+        else:
+            del self._keys[position], self._vectors[position], self._maxes[position]
+
+    def range(self, lo: float, hi: float) -> list[Vector]:
+        """
+        Return all vectors with lo <= magnitude <= hi, sorted by magnitude.
+
+        >>> vectors = MagnitudeSortedVectors(Vector([x]) for x in range(10))
+        >>> vectors.range(2.5, 5)
+        [Vector([3.0]), Vector([4.0]), Vector([5.0])]
+        >>> vectors.range(20, 30)
+        []
+        """
+        if hi < lo or hi < 0:
+            return []
+        lo_key, hi_key = max(lo, 0) ** 2, hi**2
+        result = []
+        position = bisect_left(self._maxes, lo_key)
+        for keys, bucket in zip(self._keys[position:], self._vectors[position:]):
+            start = bisect_left(keys, lo_key)
+            stop = bisect_right(keys, hi_key)
+            result.extend(bucket[start:stop])
+            if stop < len(keys):
+                break
+        return result
+
+    def k_smallest(self, k: int) -> list[Vector]:
+        """
+        Return the k vectors with the smallest magnitude, smallest first.
+
+        >>> MagnitudeSortedVectors(Vector([x]) for x in [3, 1, 2]).k_smallest(2)
+        [Vector([1.0]), Vector([2.0])]
+        """
+        return list(islice(self, k))
+
+    def k_largest(self, k: int) -> list[Vector]:
+        """
+        Return the k vectors with the largest magnitude, largest first.
+
+        >>> MagnitudeSortedVectors(Vector([x]) for x in [3, 1, 2]).k_largest(2)
+        [Vector([3.0]), Vector([2.0])]
+        """
+        return list(islice(reversed(self), k))
@@ -0,0 +1,504 @@
+import math
+import numbers
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from functools import total_ordering
+from typing import Any, Iterable, Iterator, Union
+
+import vector_backends
+from vector import NORM2_REL_TOL, Vector
+
+
+@total_ordering
+class SparseVector:
+    """
+    A vector in which only the non-zero components are stored.
+
+    Feature vectors with a million components of which only a hundred are
+    non-zero cannot be stored as a dense `Vector`. A `SparseVector` keeps
+    the indices of the non-zero components sorted in an `array('q')` and
+    their values in a parallel `array('d')`, so memory and the operations
+    below cost O(nnz), the number of non-zeros, instead of O(d):
+
+        `@`, `+`, `-`, `*`, `/`, `abs()`, `distance_to`,
+        `squared_distance_to`, `cosine_similarity` and `angle_to`.
+
+    The operators and methods also accept a dense `Vector` on either side
+    (`Vector.distance_to` and friends hand a sparse operand over to this
+    class) and give the same results as the methods of `Vector`, up to
+    rounding:
+        * `@`, elementwise `*` and `angle_to` with a dense vector still run
+          in O(nnz); the squared magnitude of the dense vector is cached by
+          `Vector` after its first use.
+        * `distance_to` with a dense vector reads all d components, summed
+          in C by the backend, to avoid cancellation.
+        * `+` and `-` with a dense vector return a dense `Vector`.
+
+    Attributes:
+        _dim (int): The dimension of the vector.
+        _indices (array): The sorted indices of the non-zero components.
+        _values (array): The values of these components.
+
+    Example usage:
+        >>> a = SparseVector(1_000_000, {3: 1.0, 999_999: 2.0})
+        >>> b = SparseVector(1_000_000, {3: 4.0, 10: 1.0})
+        >>> a @ b
+        4.0
+        >>> a + b
+        SparseVector(1000000, {3: 5.0, 10: 1.0, 999999: 2.0})
+        >>> abs(a)
+        2.23606797749979
+        >>> SparseVector(3, {1: 2.0}) @ Vector([1, 2, 3])
+        4.0
+
+    Notes:
+        - Like `Vector`, a `SparseVector` is immutable.
+        - Comparisons (==, <, ...) compare magnitudes, like `Vector`.
+        - Zeros are never stored, so `nnz` counts the actual non-zeros.
+    """
+
+    __slots__ = ("_dim", "_indices", "_values", "_norm2")
+
+    def __init__(self, dim: int, entries: Any = ()) -> None:
+        """
+        Create a vector of dimension dim from index -> value pairs.
+
+        The entries can be a mapping or an iterable of (index, value)
+        pairs, in any order. Zero values are dropped.
+
+        >>> SparseVector(5, [(4, 1), (0, 2.5), (2, 0)])
+        SparseVector(5, {0: 2.5, 4: 1.0})
+        >>> SparseVector(5, {5: 1.0})
+        Traceback (most recent call last):
+        IndexError: Index 5 is out of range for dimension 5.
+        >>> SparseVector(5, [(1, 1.0), (1, 2.0)])
+        Traceback (most recent call last):
+        ValueError: Duplicate index 1.
+        """
+        if isinstance(entries, Mapping):
+            entries = entries.items()
+        pairs = sorted(entries, key=lambda pair: pair[0])
+        for position, (index, value) in enumerate(pairs):
+            if not isinstance(index, numbers.Integral):
+                raise TypeError("Indices must be integers.")
+            if not 0 <= index < dim:
+                raise IndexError(
+                    f"Index {index} is out of range for dimension {dim}."
+                )
+            if position and pairs[position - 1][0] == index:
+                raise ValueError(f"Duplicate index {index}.")
+            if not isinstance(value, numbers.Real):
+                raise TypeError(
+                    "All components must be real numbers (int or float)."
+                )
+        pairs = [(index, value) for index, value in pairs if value != 0]
+        self._dim = int(dim)
+        self._indices = array("q", [index for index, _ in pairs])
+        self._values = array("d", [float(value) for _, value in pairs])
+
+    @classmethod
+    def _from_arrays(
+        cls, dim: int, indices: array, values: array
+    ) -> "SparseVector":
+        """Wrap sorted indices and non-zero values without validation."""
+        vector = cls.__new__(cls)
+        vector._dim = dim
+        vector._indices = indices
+        vector._values = values
+        return vector
+
+    @classmethod
+    def from_dense(cls, vector: Iterable[numbers.Real]) -> "SparseVector":
+        """
+        Create a sparse vector from the non-zero components of a dense one.
+
+        >>> SparseVector.from_dense(Vector([0, 3, 0, 4]))
+        SparseVector(4, {1: 3.0, 3: 4.0})
+        """
+        components = list(vector)
+        return cls(len(components), enumerate(components))
+
+    def to_dense(self) -> Vector:
+        """
+        Return the vector as a dense `Vector`.
+
+        >>> SparseVector(3, {1: 2.0}).to_dense()
+        Vector([0.0, 2.0, 0.0])
+        """
+        components = array("d", bytes(8 * self._dim))
+        for index, value in zip(self._indices, self._values):
+            components[index] = value
+        return Vector._from_array(components)
+
+    @property
+    def nnz(self) -> int:
+        """The number of non-zero components."""
+        return len(self._values)
+
+    def items(self) -> Iterator[tuple[int, float]]:
+        """
+        Iterate over the (index, value) pairs of the non-zero components.
+
+        >>> list(SparseVector(4, {2: 1.0, 0: 5.0}).items())
+        [(0, 5.0), (2, 1.0)]
+        """
+        return zip(self._indices, self._values)
+
+    def __repr__(self) -> str:
+        entries = ", ".join(f"{index}: {value}" for index, value in self.items())
+        return f"SparseVector({self._dim}, {{{entries}}})"
+
+    def __len__(self) -> int:
+        return self._dim
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate over all d components, including the zeros."""
+        return iter(self.to_dense())
+
+    def __getitem__(self, index: int) -> float:
+        """
+        Return the component at an index in O(log nnz).
+
+        >>> v = SparseVector(4, {2: 1.5})
+        >>> v[2], v[0], v[-2]
+        (1.5, 0.0, 1.5)
+        """
+        if index < 0:
+            index += self._dim
+        if not 0 <= index < self._dim:
+            raise IndexError("Vector index out of range.")
+        position = bisect_left(self._indices, index)
+        if position < len(self._indices) and self._indices[position] == index:
+            return self._values[position]
+        return 0.0
+
+    def __bool__(self) -> bool:
+        return bool(self._values)
+
+    def __hash__(self) -> int:
+        return hash((self._dim, tuple(self._indices), tuple(self._values)))
+
+    # Comparisons by magnitude, as for Vector
+
+    def _squared_norm(self) -> float:
+        """Return the squared magnitude, computed once and then cached."""
+        try:
+            return self._norm2
+        except AttributeError:
+            self._norm2 = vector_backends.active.squared_norm(self._values)
+            return self._norm2
+
+    def __eq__(self, other: Any) -> bool:
+        """
+        Check if two vectors have the same magnitude, like `Vector.__eq__`.
+
+        >>> SparseVector(2, {0: 1.0}) == Vector([1.0, 0.0])
+        True
+        """
+        if self is other:
+            return True
+        if not isinstance(other, (SparseVector, Vector)):
+            return NotImplemented
+        return math.isclose(
+            self._squared_norm(), other._squared_norm(), rel_tol=NORM2_REL_TOL
+        )
+
+    def __lt__(self, other: Any) -> bool:
+        """
+        Compare vectors based on their magnitude.
+
+        >>> SparseVector(2, {0: 1.0}) < Vector([3.0, 4.0])
+        True
+        """
+        if not isinstance(other, (SparseVector, Vector)):
+            return NotImplemented
+        return self._squared_norm() < other._squared_norm()
+
+    def __abs__(self) -> float:
+        return math.sqrt(self._squared_norm())
+
+    # Arithmetic
+
+    def _check(self, other: Union["SparseVector", Vector], operation: str) -> None:
+        if len(self) != len(other):
+            raise ValueError(
+                f"Vectors must have the same dimensionality for {operation}."
+            )
+
+    def _merge(self, other: "SparseVector", sign: float) -> "SparseVector":
+        """Return self + sign * other by merging the sorted index arrays."""
+        a_indices, a_values = self._indices, self._values
+        b_indices, b_values = other._indices, other._values
+        indices, values = array("q"), array("d")
+        i = j = 0
+        while i < len(a_indices) and j < len(b_indices):
+            if a_indices[i] < b_indices[j]:
+                indices.append(a_indices[i])
+                values.append(a_values[i])
+                i += 1
+            elif a_indices[i] > b_indices[j]:
+                indices.append(b_indices[j])
+                values.append(sign * b_values[j])
+                j += 1
+            else:
+                value = a_values[i] + sign * b_values[j]
+                if value != 0:
+                    indices.append(a_indices[i])
+                    values.append(value)
+                i += 1
+                j += 1
+        indices.extend(a_indices[i:])
+        values.extend(a_values[i:])
+        indices.extend(b_indices[j:])
+        values.extend([sign * v for v in b_values[j:]])
+        return SparseVector._from_arrays(self._dim, indices, values)
+
+    def _scatter(self, other: Vector, sign: float) -> Vector:
+        """Return sign * other + self as a dense vector."""
+        components = array("d", other._components)
+        if sign < 0:
+            components = array("d", [-c for c in components])
+        for index, value in self.items():
+            components[index] += value
+        return Vector._from_array(components)
+
+    def __add__(self, other: Union["SparseVector", Vector]) -> Any:
+        """
+        Add two vectors component-wise.
+
+        >>> SparseVector(3, {0: 1.0, 1: 2.0}) + SparseVector(3, {1: -2.0})
+        SparseVector(3, {0: 1.0})
+        >>> SparseVector(3, {0: 1.0}) + Vector([1, 1, 1])
+        Vector([2.0, 1.0, 1.0])
+        """
+        if isinstance(other, SparseVector):
+            self._check(other, "addition")
+            return self._merge(other, 1.0)
+        if isinstance(other, Vector):
+            self._check(other, "addition")
+            return self._scatter(other, 1.0)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __sub__(self, other: Union["SparseVector", Vector]) -> Any:
+        """
+        Subtract two vectors component-wise.
+
+        >>> SparseVector(2, {0: 1.0}) - SparseVector(2, {1: 1.0})
+        SparseVector(2, {0: 1.0, 1: -1.0})
+        >>> Vector([5, 5]) - SparseVector(2, {1: 1.0})
+        Vector([5.0, 4.0])
+        """
+        if isinstance(other, SparseVector):
+            self._check(other, "subtraction")
+            return self._merge(other, -1.0)
+        if isinstance(other, Vector):
+            self._check(other, "subtraction")
+            return self._scatter(other, -1.0)
+        return NotImplemented
+
+    def __rsub__(self, other: Vector) -> Any:
+        if not isinstance(other, Vector):
+            return NotImplemented
+        self._check(other, "subtraction")
+        return (-self)._scatter(other, 1.0)
+
+    def __neg__(self) -> "SparseVector":
+        return SparseVector._from_arrays(
+            self._dim, self._indices, array("d", [-v for v in self._values])
+        )
+
+    def __pos__(self) -> "SparseVector":
+        return self
+
+    def _dense_values(self, other: Vector) -> list[float]:
+        """Return the components of a dense vector at the non-zero indices."""
+        components = other._components
+        return [components[index] for index in self._indices]
+
+    def __mul__(self, other: Union[numbers.Real, "SparseVector", Vector]) -> Any:
+        """
+        Multiply by a scalar, or component-wise by another vector.
+
+        >>> SparseVector(3, {0: 1.0, 2: 2.0}) * 3
+        SparseVector(3, {0: 3.0, 2: 6.0})
+        >>> SparseVector(3, {0: 1.0, 2: 2.0}) * SparseVector(3, {2: 5.0})
+        SparseVector(3, {2: 10.0})
+        >>> Vector([4, 5, 6]) * SparseVector(3, {1: 2.0})
+        SparseVector(3, {1: 10.0})
+        """
+        if isinstance(other, numbers.Real):
+            other = float(other)
+            return self._filtered(
+                self._indices, [value * other for value in self._values]
+            )
+        if isinstance(other, SparseVector):
+            self._check(other, "element-wise multiplication")
+            indices, own, theirs = self._intersection(other)
+            return self._filtered(indices, [a * b for a, b in zip(own, theirs)])
+        if isinstance(other, Vector):
+            self._check(other, "element-wise multiplication")
+            return self._filtered(
+                self._indices,
+                [a * b for a, b in zip(self._values, self._dense_values(other))],
+            )
+        return NotImplemented
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, scalar: numbers.Real) -> "SparseVector":
+        """
+        Divide the vector by a scalar.
+
+        >>> SparseVector(3, {1: 3.0}) / 2
+        SparseVector(3, {1: 1.5})
+        """
+        if not isinstance(scalar, numbers.Real):
+            return NotImplemented
+        if scalar == 0:
+            raise ValueError("Division by zero is not allowed.")
+        scalar = float(scalar)
+        return self._filtered(
+            self._indices, [value / scalar for value in self._values]
+        )
+
+    def _filtered(
+        self, indices: Iterable[int], values: list[float]
+    ) -> "SparseVector":
+        """Build a result and drop the components that became zero."""
+        pairs = [(i, v) for i, v in zip(indices, values) if v != 0]
+        return SparseVector._from_arrays(
+            self._dim,
+            array("q", [i for i, _ in pairs]),
+            array("d", [v for _, v in pairs]),
+        )
+
+    def _intersection(self, other: "SparseVector") -> tuple[list, list, list]:
+        """Return the common indices and the values of both vectors there."""
+        small, large = (self, other) if self.nnz <= other.nnz else (other, self)
+        lookup = dict(large.items())
+        indices = [i for i in small._indices if i in lookup]
+        small_values = dict(small.items())
+        ours = [small_values[i] for i in indices]
+        theirs = [lookup[i] for i in indices]
+        return (indices, ours, theirs) if small is self else (indices, theirs, ours)
+
+    def __matmul__(self, other: Union["SparseVector", Vector]) -> float:
+        """
+        Calculate the dot product with a sparse or dense vector in O(nnz).
+
+        >>> SparseVector(3, {0: 2.0, 2: 1.0}) @ SparseVector(3, {2: 3.0})
+        3.0
+        >>> Vector([1, 2, 3]) @ SparseVector(3, {2: 1.0})
+        3.0
+        """
+        if isinstance(other, SparseVector):
+            self._check(other, "dot product")
+            _, own, theirs = self._intersection(other)
+            return vector_backends.active.dot(own, theirs)
+        if isinstance(other, Vector):
+            self._check(other, "dot product")
+            dense_values = self._dense_values(other)
+            return vector_backends.active.dot(self._values, dense_values)
+        return NotImplemented
+
+    __rmatmul__ = __matmul__
+
+    # Distances and angles
+
+    def squared_distance_to(self, other: Union["SparseVector", Vector]) -> float:
+        """
+        Calculate the squared Euclidean distance to another vector.
+
+        For a sparse other vector only the union of the non-zeros is
+        visited. For a dense one, (value - dense)² is summed at the
+        non-zero indices of this vector and dense² over the stretches in
+        between, which the backend sums in C. Nothing is subtracted, so
+        there is no cancellation, but the cost is O(d).
+
+        >>> a = SparseVector(3, {0: 1.0})
+        >>> a.squared_distance_to(SparseVector(3, {1: 1.0}))
+        2.0
+        >>> a.squared_distance_to(Vector([1, 2, 2]))
+        8.0
+        >>> SparseVector(2, {0: 1e8, 1: 1}).distance_to(Vector([1e8, 3]))
+        2.0
+        """
+        if not isinstance(other, (SparseVector, Vector)):
+            return NotImplemented
+        self._check(other, "distance calculation")
+        if isinstance(other, SparseVector):
+            return (self - other)._squared_norm()
+        backend = vector_backends.active
+        dense = memoryview(other._components)
+        total, start = 0.0, 0
+        for index, value in zip(self._indices, self._values):
+            if start < index:
+                total += backend.squared_norm(dense[start:index])
+            total += (value - dense[index]) ** 2
+            start = index + 1
+        if start < self._dim:
+            total += backend.squared_norm(dense[start:])
+        return total
+
+    def distance_to(self, other: Union["SparseVector", Vector]) -> float:
+        """
+        Calculate the Euclidean distance to another vector.
+
+        >>> SparseVector(2, {0: 3.0}).distance_to(SparseVector(2, {1: 4.0}))
+        5.0
+        >>> Vector([1, 2, 2]).distance_to(SparseVector(3, {0: 1.0}))
+        2.8284271247461903
+        """
+        squared = self.squared_distance_to(other)
+        if squared is NotImplemented:
+            return NotImplemented
+        return math.sqrt(squared)
+
+    def cosine_similarity(self, other: Union["SparseVector", Vector]) -> float:
+        """
+        Calculate the cosine of the angle between this and another vector.
+
+        >>> SparseVector(2, {0: 1.0}).cosine_similarity(Vector([1, 1]))
+        0.7071067811865475
+        >>> SparseVector(2).cosine_similarity(Vector([1, 1]))
+        Traceback (most recent call last):
+        ValueError: Cannot calculate angle with a zero vector.
+        """
+        if not isinstance(other, (SparseVector, Vector)):
+            return NotImplemented
+        self._check(other, "angle calculation")
+        norm2_product = self._squared_norm() * other._squared_norm()
+        if norm2_product == 0:
+            raise ValueError("Cannot calculate angle with a zero vector.")
+        cos_theta = (self @ other) / math.sqrt(norm2_product)
+        # Clamp the value to avoid floating point errors
+        return max(-1.0, min(1.0, cos_theta))
+
+    def angle_to(self, other: Union["SparseVector", Vector]) -> float:
+        """
+        Calculate the angle (in radians) between this and another vector.
+
+        >>> SparseVector(2, {0: 1.0}).angle_to(SparseVector(2, {1: 5.0}))
+        1.5707963267948966
+        >>> Vector([0, 2]).angle_to(SparseVector(2, {0: 1.0}))
+        1.5707963267948966
+        """
+        cos_theta = self.cosine_similarity(other)
+        if cos_theta is NotImplemented:
+            return NotImplemented
+        return math.acos(cos_theta)
+
+    def normalize(self) -> "SparseVector":
+        """
+        Return the unit vector in the same direction.
+
+        >>> SparseVector(4, {0: 3.0, 3: 4.0}).normalize()
+        SparseVector(4, {0: 0.6, 3: 0.8})
+        """
+        magnitude = abs(self)
+        if magnitude == 0:
+            raise ValueError("Cannot normalize a zero vector.")
+        return self / magnitude
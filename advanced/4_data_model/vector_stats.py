@@ -0,0 +1,312 @@
+"""
+Single-pass statistics of vector streams that do not fit into memory.
+
+`Vector.mean` needs the whole iterable and knows nothing about the
+spread of the vectors. `VectorStats` is an accumulator: vectors are
+added one at a time or in batches, and the count, mean, variance,
+covariance and bounding box are updated in place with Welford's
+algorithm. Its memory depends on the dimension d only, never on the
+number of vectors, and accumulators filled in different workers can be
+merged into one with the formula of Chan et al.
+
+    >>> stats = VectorStats()
+    >>> stats.add(Vector([1, 2]))
+    >>> stats.update([Vector([3, 4]), Vector([5, 0])])
+    >>> stats.count, stats.mean
+    (3, Vector([3.0, 2.0]))
+    >>> stats.variance()
+    Vector([2.6666666666666665, 2.6666666666666665])
+    >>> stats.min, stats.max
+    (Vector([1.0, 0.0]), Vector([5.0, 4.0]))
+"""
+from itertools import batched
+from typing import Any, Iterable, Union
+
+import numpy as np
+
+from vector import Vector
+from vector_pairwise import as_array
+
+
+class VectorStats:
+    """
+    Running count, mean, (co)variance and bounds of a stream of vectors.
+
+    Every update is numerically stable: instead of sums of squares, which
+    cancel catastrophically for vectors far from the origin, the sum of
+    squared deviations from the current mean (`_m2`) is updated.
+
+    The full d x d covariance costs O(d²) memory and time per vector.
+    With `covariance=False` only its diagonal (the variance) is tracked,
+    which keeps everything O(d) for high-dimensional vectors.
+
+    Attributes:
+        count (int): The number of vectors added so far.
+        _mean (np.ndarray): The running mean, shape (d,).
+        _m2 (np.ndarray): The sum of outer products of the deviations from
+            the mean, shape (d, d), or its diagonal of shape (d,).
+        _min, _max (np.ndarray): The component-wise bounds, shape (d,).
+
+    Example usage:
+        >>> left, right = VectorStats(), VectorStats()
+        >>> left.update([[0, 0], [2, 2]])
+        >>> right.update([[4, 4]])
+        >>> merged = left + right
+        >>> merged.mean, merged.count
+        (Vector([2.0, 2.0]), 3)
+        >>> merged.covariance(ddof=1)
+        array([[4., 4.],
+               [4., 4.]])
+    """
+
+    def __init__(self, dim: Union[int, None] = None, covariance: bool = True) -> None:
+        """
+        Create an empty accumulator.
+
+        The dimension is taken from the first vector if it is not given.
+
+        >>> VectorStats(dim=3).mean
+        Traceback (most recent call last):
+        ValueError: No vectors have been added.
+        """
+        self.count = 0
+        self._covariance = covariance
+        self._mean = self._m2 = self._min = self._max = None
+        if dim is not None:
+            self._reset(dim)
+
+    def _reset(self, dim: int) -> None:
+        self._mean = np.zeros(dim)
+        self._m2 = np.zeros((dim, dim) if self._covariance else dim)
+        self._min = np.full(dim, np.inf)
+        self._max = np.full(dim, -np.inf)
+
+    @property
+    def dim(self) -> Union[int, None]:
+        """The dimension of the vectors, None before the first vector."""
+        return None if self._mean is None else len(self._mean)
+
+    def _check_dim(self, dim: int) -> None:
+        if self._mean is None:
+            self._reset(dim)
+        elif dim != len(self._mean):
+            raise ValueError("All vectors must have the same dimensionality.")
+
+    def add(self, vector: Any) -> None:
+        """
+        Add a single vector with one Welford update.
+
+        >>> stats = VectorStats()
+        >>> for v in [Vector([1e9 + 4]), Vector([1e9 + 7]), Vector([1e9 + 13])]:
+        ...     stats.add(v)
+        >>> stats.variance(ddof=1)
+        Vector([21.0])
+        >>> stats.add(Vector([1, 2]))
+        Traceback (most recent call last):
+        ValueError: All vectors must have the same dimensionality.
+        """
+        x = np.asarray(vector, dtype=np.float64)
+        if x.ndim != 1:
+            raise ValueError("add() expects a single vector; use update() for batches.")
+        self._check_dim(len(x))
+        self.count += 1
+        delta = x - self._mean
+        self._mean += delta / self.count
+        if self._covariance:
+            self._m2 += np.outer(delta, x - self._mean)
+        else:
+            self._m2 += delta * (x - self._mean)
+        np.minimum(self._min, x, out=self._min)
+        np.maximum(self._max, x, out=self._max)
+
+    def update(self, vectors: Any, chunk_size: int = 4096) -> None:
+        """
+        Add a batch of vectors.
+
+        Accepts a `VectorArray`, a 2-D array-like or any iterable of
+        vectors; iterables are consumed in chunks of `chunk_size`, so a
+        generator is never materialized as a whole. The statistics of each
+        chunk are computed with NumPy and merged into the accumulator.
+
+        >>> stats = VectorStats(covariance=False)
+        >>> stats.update(Vector([i, -i]) for i in range(10_001))
+        >>> stats.count, stats.mean, stats.max
+        (10001, Vector([5000.0, -5000.0]), Vector([10000.0, 0.0]))
+        """
+        if hasattr(vectors, "__array__"):
+            chunks = [vectors]
+        else:
+            chunks = batched(vectors, chunk_size)
+        for chunk in chunks:
+            rows = as_array(chunk)
+            if len(rows):
+                self._merge_batch(rows)
+
+    def _merge_batch(self, rows: np.ndarray) -> None:
+        count = len(rows)
+        mean = rows.mean(axis=0)
+        centered = rows - mean
+        if self._covariance:
+            m2 = centered.T @ centered
+        else:
+            m2 = np.einsum("ij,ij->j", centered, centered)
+        self._merge(count, mean, m2, rows.min(axis=0), rows.max(axis=0))
+
+    def _merge(
+        self,
+        count: int,
+        mean: np.ndarray,
+        m2: np.ndarray,
+        minimum: np.ndarray,
+        maximum: np.ndarray,
+    ) -> None:
+        """Combine the moments of another set of vectors (Chan et al.)."""
+        self._check_dim(len(mean))
+        total = self.count + count
+        delta = mean - self._mean
+        weight = self.count * count / total
+        self._mean += delta * (count / total)
+        if self._covariance:
+            self._m2 += m2 + np.outer(delta, delta) * weight
+        else:
+            self._m2 += m2 + delta * delta * weight
+        np.minimum(self._min, minimum, out=self._min)
+        np.maximum(self._max, maximum, out=self._max)
+        self.count = total
+
+    def merge(self, other: "VectorStats") -> None:
+        """
+        Add the vectors summarized by another accumulator, e.g. of a worker.
+
+        An accumulator without covariance can only be merged into one
+        without covariance.
+
+        >>> stats = VectorStats(covariance=False)
+        >>> stats.merge(VectorStats())
+        >>> stats.count
+        0
+        >>> VectorStats().merge(stats)
+        Traceback (most recent call last):
+        ValueError: Cannot merge statistics without covariance into one with it.
+        """
+        if not isinstance(other, VectorStats):
+            raise TypeError("merge() expects a VectorStats.")
+        if self._covariance and not other._covariance:
+            raise ValueError(
+                "Cannot merge statistics without covariance into one with it."
+            )
+        if other.count == 0:
+            return
+        m2 = other._m2
+        if other._covariance and not self._covariance:
+            m2 = np.diagonal(m2)
+        self._merge(other.count, other._mean, m2, other._min, other._max)
+
+    def copy(self) -> "VectorStats":
+        """Return an independent accumulator with the same state."""
+        result = VectorStats(covariance=self._covariance)
+        result.count = self.count
+        if self._mean is not None:
+            result._mean = self._mean.copy()
+            result._m2 = self._m2.copy()
+            result._min = self._min.copy()
+            result._max = self._max.copy()
+        return result
+
+    def __add__(self, other: "VectorStats") -> "VectorStats":
+        """Return the statistics of the vectors of both accumulators."""
+        if not isinstance(other, VectorStats):
+            return NotImplemented
+        result = self.copy()
+        result.merge(other)
+        return result
+
+    def __repr__(self) -> str:
+        return f"VectorStats(count={self.count}, dim={self.dim})"
+
+    def _require(self, minimum: int = 1) -> None:
+        if self.count == 0:
+            raise ValueError("No vectors have been added.")
+        if self.count < minimum:
+            raise ValueError(f"At least {minimum} vectors are needed.")
+
+    @property
+    def mean(self) -> Vector:
+        """The component-wise mean (centroid) of all vectors."""
+        self._require()
+        return Vector.from_numpy(self._mean)
+
+    def variance(self, ddof: int = 0) -> Vector:
+        """
+        Return the variance of every component.
+
+        With ddof=0 (default) the population variance, with ddof=1 the
+        unbiased sample variance.
+
+        >>> stats = VectorStats()
+        >>> stats.add(Vector([1, 2]))
+        >>> stats.variance(ddof=1)
+        Traceback (most recent call last):
+        ValueError: At least 2 vectors are needed.
+        """
+        self._require(ddof + 1)
+        m2 = np.diagonal(self._m2) if self._covariance else self._m2
+        return Vector.from_numpy(m2 / (self.count - ddof))
+
+    def std(self, ddof: int = 0) -> Vector:
+        """Return the standard deviation of every component."""
+        self._require(ddof + 1)
+        m2 = np.diagonal(self._m2) if self._covariance else self._m2
+        return Vector.from_numpy(np.sqrt(m2 / (self.count - ddof)))
+
+    def covariance(self, ddof: int = 0) -> np.ndarray:
+        """
+        Return the d x d covariance matrix as a new NumPy array.
+
+        >>> VectorStats(dim=2, covariance=False).covariance()
+        Traceback (most recent call last):
+        ValueError: Covariance is not tracked; create VectorStats(covariance=True).
+        """
+        if not self._covariance:
+            raise ValueError(
+                "Covariance is not tracked; create VectorStats(covariance=True)."
+            )
+        self._require(ddof + 1)
+        return self._m2 / (self.count - ddof)
+
+    @property
+    def min(self) -> Vector:
+        """The component-wise minimum, the lower corner of the bounding box."""
+        self._require()
+        return Vector.from_numpy(self._min)
+
+    @property
+    def max(self) -> Vector:
+        """The component-wise maximum, the upper corner of the bounding box."""
+        self._require()
+        return Vector.from_numpy(self._max)
+
+    @property
+    def bounds(self) -> tuple[Vector, Vector]:
+        """The bounding box of all vectors as (min, max)."""
+        return self.min, self.max
+
+
+if __name__ == "__main__":
+    import time
+
+    rng = np.random.default_rng(42)
+
+    def stream(count: int, dim: int) -> Iterable[Vector]:
+        for _ in range(count // 1000):
+            for row in rng.normal(1e6, 2.0, size=(1000, dim)):
+                yield Vector.from_numpy(row)
+
+    start = time.perf_counter()
+    stats = VectorStats()
+    stats.update(stream(200_000, 16))
+    print(f"{stats.count} vectors, d=16, in {time.perf_counter() - start:.2f} s")
+    print(f"mean  ~ {np.round(np.asarray(stats.mean)[:3], 3)} ...")
+    print(f"std   ~ {np.round(np.asarray(stats.std())[:3], 4)} ...")
+    off_diagonal = np.triu(stats.covariance(), 1)
+    print(f"max off-diagonal covariance: {np.max(np.abs(off_diagonal)):.4f}")
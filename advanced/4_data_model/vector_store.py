@@ -0,0 +1,416 @@
+"""
+A binary file format for vectors and a memory-mapped store to read it.
+
+Writing vectors as `repr()` text or pickles is slow, and loading them
+back means parsing every single number. The format used here can be
+opened without reading it at all:
+
+    offset  size      content
+    0       4         magic bytes b"VECS"
+    4       4         dtype of the components, b"<f8\\0" (little-endian
+                      double) or b"<f4\\0" (little-endian single precision)
+    8       8         dimension d (unsigned 64-bit, little-endian)
+    16      8         number of vectors n (unsigned 64-bit, little-endian)
+    24      s * d * n the components, one vector after another, with the
+                      item size s = 8 (float64) or 4 (float32)
+
+`VectorStore` maps the file into memory with `mmap`. Opening it only
+reads the 24-byte header, whatever the size of the file; the operating
+system pages in the components of a vector when it is accessed. The
+vectors are `VectorView`s on the mapping, so reading them copies nothing.
+
+    >>> import os, tempfile
+    >>> from vector import Vector
+    >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+    >>> write_vectors(path, [Vector([1, 2, 3]), Vector([4, 5, 6])])
+    2
+    >>> with VectorStore(path) as store:
+    ...     store[1], len(store), store.dim
+    (Vector([4.0, 5.0, 6.0]), 2, 3)
+"""
+import io
+import mmap
+import os
+import struct
+import sys
+import warnings
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Union
+
+from vector import Vector, VectorView, _storage_typecode, _typecode
+
+MAGIC = b"VECS"
+# The dtypes in the header and the `array` typecodes they are read into.
+DTYPES = {b"<f8": "d", b"<f4": "f"}
+_HEADER = struct.Struct("<4s4sQQ")
+_COUNT_OFFSET = 16
+# The file always stores little-endian values; `array` uses native order.
+_SWAP = sys.byteorder != "little"
+
+
+def _pack(vector: Any, dim: int, typecode: str = "d") -> bytes:
+    """Return the components of a vector as little-endian values."""
+    if isinstance(vector, Vector):
+        if len(vector) != dim:
+            raise ValueError("All vectors must have the same dimensionality.")
+        if not _SWAP and _storage_typecode(vector._components) == typecode:
+            return bytes(vector)
+        components = array(typecode, vector._components)
+    else:
+        components = array(typecode, Vector(vector)._components)
+        if len(components) != dim:
+            raise ValueError("All vectors must have the same dimensionality.")
+    if _SWAP:
+        components.byteswap()
+    return components.tobytes()
+
+
+def write_vectors(
+    path: Union[str, Path],
+    vectors: Iterable[Any],
+    dim: Union[int, None] = None,
+    dtype: str = "float64",
+) -> int:
+    """
+    Write vectors to a new file in the binary format and return their number.
+
+    The vectors are streamed to the file, so the iterable may be larger
+    than the available memory. Without vectors the dimension must be given.
+    With dtype "float32" the components are rounded to single precision
+    and the file takes half the space.
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+    >>> write_vectors(path, [[1, 2], [3, 4, 5]])
+    Traceback (most recent call last):
+    ValueError: All vectors must have the same dimensionality.
+    """
+    iterator = iter(vectors)
+    first = next(iterator, None)
+    if first is None:
+        if dim is None:
+            raise ValueError("The dimension of an empty file must be given.")
+    elif dim is None:
+        dim = len(first)
+
+    typecode = _typecode(dtype)
+    header_dtype = b"<f4" if typecode == "f" else b"<f8"
+    count = 0
+    with open(path, "wb") as file:
+        file.write(_HEADER.pack(MAGIC, header_dtype, dim, 0))
+        if first is not None:
+            file.write(_pack(first, dim, typecode))
+            count = 1
+            for vector in iterator:
+                file.write(_pack(vector, dim, typecode))
+                count += 1
+        file.seek(_COUNT_OFFSET)
+        file.write(struct.pack("<Q", count))
+    return count
+
+
+class VectorStore:
+    """
+    A sequence of vectors backed by a memory-mapped file.
+
+    Nothing is copied on access: `store[i]` returns a `VectorView` on the
+    d components in the mapping, `store[i:j]` a lazy `StoreSlice` that
+    creates the views only when they are accessed, and `to_numpy()` the
+    whole file as an (n, d) array. With `mode="r+"` vectors can be appended.
+
+    Views and arrays keep the mapping alive. `close()` warns with a
+    `ResourceWarning` if some are still referenced; the mapping is then
+    released together with the last of them. Use `Vector.copy()` on a
+    view to keep a vector independently of the file.
+
+    Attributes:
+        path (Path): The file backing the store.
+        dim (int): The dimension of all vectors in the file.
+        dtype (str): The storage type from the header, "float64" or "float32".
+        _mmap (mmap.mmap): The mapping of the whole file.
+        _count (int): The number of vectors in the file.
+
+    Example usage:
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+        >>> store = VectorStore.create(path, dim=2)
+        >>> store.extend([Vector([1, 2]), Vector([3, 4]), Vector([5, 6])])
+        >>> store[-1], list(store[:2])
+        (Vector([5.0, 6.0]), [Vector([1.0, 2.0]), Vector([3.0, 4.0])])
+        >>> store.to_numpy()
+        array([[1., 2.],
+               [3., 4.],
+               [5., 6.]])
+        >>> store.close()
+    """
+
+    def __init__(self, path: Union[str, Path], mode: str = "r") -> None:
+        """
+        Open an existing file; mode is "r" (read-only) or "r+" (appendable).
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "notes.txt")
+        >>> with open(path, "wb") as file:
+        ...     _ = file.write(b"not a vector file at all")
+        >>> VectorStore(path)
+        Traceback (most recent call last):
+        ValueError: Not a vector file: missing magic bytes.
+        """
+        if mode not in ("r", "r+"):
+            raise ValueError("mode must be 'r' or 'r+'.")
+        self.path = Path(path)
+        self._writable = mode == "r+"
+        self._file = open(self.path, mode + "b")
+        try:
+            header = self._file.read(_HEADER.size)
+            if len(header) < _HEADER.size or header[:4] != MAGIC:
+                raise ValueError("Not a vector file: missing magic bytes.")
+            _, dtype, self.dim, self._count = _HEADER.unpack(header)
+            dtype = dtype.rstrip(b"\0")
+            if dtype not in DTYPES:
+                raise ValueError(f"Unsupported dtype {dtype.decode()!r}.")
+            self._header_dtype = dtype.decode()
+            self._typecode = DTYPES[dtype]
+            self.dtype = "float32" if self._typecode == "f" else "float64"
+            if os.fstat(self._file.fileno()).st_size < self._offset(self._count):
+                raise ValueError("Vector file is truncated.")
+            self._map()
+        except BaseException:
+            self._file.close()
+            raise
+
+    @classmethod
+    def create(
+        cls, path: Union[str, Path], dim: int, dtype: str = "float64"
+    ) -> "VectorStore":
+        """Create an empty file for vectors of the given dimension and open it."""
+        write_vectors(path, (), dim=dim, dtype=dtype)
+        return cls(path, mode="r+")
+
+    def _map(self) -> None:
+        access = mmap.ACCESS_WRITE if self._writable else mmap.ACCESS_READ
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=access)
+
+    def _offset(self, index: int) -> int:
+        itemsize = 4 if self._typecode == "f" else 8
+        return _HEADER.size + itemsize * self.dim * index
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __repr__(self) -> str:
+        return f"VectorStore({str(self.path)!r}, dim={self.dim}, count={self._count})"
+
+    def _read(self, index: int) -> Vector:
+        """Return a view on the vector at a valid index."""
+        with memoryview(self._mmap) as view:
+            components = view[self._offset(index) : self._offset(index + 1)]
+        if _SWAP:
+            # Big-endian machines need a byte-swapped copy.
+            components = array(self._typecode, components)
+            components.byteswap()
+            return Vector._from_array(components)
+        return VectorView._from_buffer(components.cast(self._typecode), self)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vector, "StoreSlice"]:
+        """
+        Return a view on the vector at an index, or a `StoreSlice`.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+        >>> _ = write_vectors(path, [Vector([i, -i]) for i in range(5)])
+        >>> store = VectorStore(path)
+        >>> type(store[1]).__name__, store[1].base is store
+        ('VectorView', True)
+        >>> list(store[::2])
+        [Vector([0.0, 0.0]), Vector([2.0, -2.0]), Vector([4.0, -4.0])]
+        >>> store[5]
+        Traceback (most recent call last):
+        IndexError: VectorStore index out of range.
+        >>> store.close()
+        """
+        if isinstance(index, slice):
+            return StoreSlice(self, range(self._count)[index])
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("VectorStore index out of range.")
+        return self._read(index)
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (self._read(i) for i in range(self._count))
+
+    def append(self, vector: Any) -> None:
+        """Append a vector to the end of the file."""
+        self.extend([vector])
+
+    def extend(self, vectors: Iterable[Any]) -> None:
+        """
+        Append vectors to the end of the file and map the grown file.
+
+        NumPy arrays returned by earlier `to_numpy()` calls stay valid and
+        keep showing the vectors that existed when they were created.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+        >>> _ = write_vectors(path, [Vector([1, 2])])
+        >>> store = VectorStore(path)
+        >>> store.append(Vector([3, 4]))
+        Traceback (most recent call last):
+        io.UnsupportedOperation: VectorStore was opened read-only.
+        >>> store.close()
+        """
+        if not self._writable:
+            raise io.UnsupportedOperation("VectorStore was opened read-only.")
+        packed = [_pack(vector, self.dim, self._typecode) for vector in vectors]
+        if not packed:
+            return
+        count = self._count + len(packed)
+        self._file.seek(self._offset(self._count))
+        self._file.write(b"".join(packed))
+        self._file.seek(_COUNT_OFFSET)
+        self._file.write(struct.pack("<Q", count))
+        self._file.flush()
+        self._count = count
+        self._release()
+        self._map()
+
+    def to_numpy(self) -> Any:
+        """
+        Return all vectors as a read-only (n, d) array without copying.
+
+        The array has the dtype of the file, float64 or float32.
+
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+        >>> _ = write_vectors(path, [Vector([1, 2]), Vector([3, 4])])
+        >>> with VectorStore(path) as store:
+        ...     points = store.to_numpy()
+        ...     points.flags.writeable, points.sum(axis=0)
+        (False, array([4., 6.]))
+        """
+        import numpy as np
+
+        points = np.frombuffer(
+            self._mmap,
+            dtype=self._header_dtype,
+            count=self.dim * self._count,
+            offset=_HEADER.size,
+        )
+        points.flags.writeable = False
+        return points.reshape(self._count, self.dim)
+
+    def _release(self) -> bool:
+        """
+        Drop the mapping; it stays alive while views or arrays still use it.
+
+        Returns False if the mapping could not be closed for that reason.
+        """
+        try:
+            self._mmap.close()
+        except BufferError:
+            return False
+        return True
+
+    def close(self) -> None:
+        """
+        Close the mapping and the file.
+
+        Warns if vectors or arrays from the store are still referenced:
+        the mapping then stays open until the last of them is released.
+        """
+        released = self._release()
+        self._file.close()
+        if not released:
+            warnings.warn(
+                f"{self!r} closed while vectors or arrays still use its mapping; "
+                "it is unmapped when they are released.",
+                ResourceWarning,
+                stacklevel=2,
+            )
+
+    def __enter__(self) -> "VectorStore":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class StoreSlice(Sequence):
+    """
+    A lazy slice of a `VectorStore`.
+
+    Holds only the store and a `range` of indices; the views are created
+    one at a time on access or iteration, so `store[:10**9]` costs O(1).
+
+    >>> import os, tempfile
+    >>> path = os.path.join(tempfile.mkdtemp(), "vectors.vecs")
+    >>> _ = write_vectors(path, [Vector([i, i]) for i in range(10)])
+    >>> store = VectorStore(path)
+    >>> part = store[2:8:2]
+    >>> part, len(part), part[-1]  # doctest: +ELLIPSIS
+    (VectorStore(...)[2:8:2], 3, Vector([6.0, 6.0]))
+    >>> list(part[1:])
+    [Vector([4.0, 4.0]), Vector([6.0, 6.0])]
+    >>> del part
+    >>> store.close()
+    """
+
+    def __init__(self, store: VectorStore, indices: range) -> None:
+        self._store = store
+        self._indices = indices
+
+    def __len__(self) -> int:
+        return len(self._indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Vector, "StoreSlice"]:
+        if isinstance(index, slice):
+            return StoreSlice(self._store, self._indices[index])
+        try:
+            return self._store._read(self._indices[index])
+        except IndexError:
+            raise IndexError("StoreSlice index out of range.") from None
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (self._store._read(i) for i in self._indices)
+
+    def __repr__(self) -> str:
+        indices = self._indices
+        return f"{self._store!r}[{indices.start}:{indices.stop}:{indices.step}]"
+
+
+if __name__ == "__main__":
+    import pickle
+    import random
+    import tempfile
+    import time
+
+    directory = Path(tempfile.mkdtemp())
+    vectors = [Vector([random.random() for _ in range(64)]) for _ in range(100_000)]
+
+    start = time.perf_counter()
+    with open(directory / "vectors.pickle", "wb") as file:
+        pickle.dump(vectors, file)
+    pickle_write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    write_vectors(directory / "vectors.vecs", vectors)
+    store_write = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with open(directory / "vectors.pickle", "rb") as file:
+        pickle.load(file)
+    pickle_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with VectorStore(directory / "vectors.vecs") as store:
+        opened = time.perf_counter() - start
+        store[len(store) // 2]
+        first_access = time.perf_counter() - start
+
+    print(f"{len(vectors)} vectors with d=64")
+    print(f"pickle:      write {pickle_write:.3f} s, load {pickle_load:.3f} s")
+    print(f"VectorStore: write {store_write:.3f} s, open {opened * 1e3:.3f} ms,")
+    print(f"             open + first vector {first_access * 1e3:.3f} ms")
@@ -0,0 +1,260 @@
+import math
+from collections.abc import MutableMapping
+from itertools import product
+from typing import Any, Iterable, Iterator, Union
+
+from vector import Vector
+
+
+class _ToleranceGrid:
+    """
+    Shared storage of `ToleranceSet` and `ToleranceDict`.
+
+    `Vector.__eq__` compares magnitudes with `math.isclose`, while
+    `__hash__` uses the exact components, so a set cannot find a vector
+    that differs from a stored one by noise. Here every key is stored in
+    the cell `floor(component / epsilon)` of a grid with cell size
+    epsilon. All vectors within `distance_to` epsilon of a query lie in
+    the same or a neighbouring cell, so a lookup only compares against
+    the keys of at most 3**d cells instead of all n keys.
+
+    Once 3**d exceeds the number of occupied cells, the occupied cells are
+    scanned instead, so high-dimensional lookups never get worse than a
+    linear scan.
+
+    Epsilon is an absolute distance, because the grid needs one cell size
+    for all keys. It does not grow with the magnitude of the vectors like
+    the relative tolerance of `Vector.__eq__`, so for large vectors the
+    two disagree (see `ToleranceSet`). Choose epsilon for the scale of the
+    data.
+
+    Attributes:
+        epsilon (float): Largest `distance_to` at which two vectors match,
+            an absolute distance.
+        _cells (dict): Maps a cell to a list of [key, value] pairs.
+    """
+
+    def __init__(self, epsilon: float) -> None:
+        if not epsilon > 0:
+            raise ValueError("epsilon must be positive.")
+        self.epsilon = float(epsilon)
+        self._cells: dict[tuple, list[list]] = {}
+        self._len = 0
+
+    def _cell(self, vector: Vector) -> tuple:
+        return tuple(math.floor(c / self.epsilon) for c in vector)
+
+    def _neighbour_cells(self, vector: Vector) -> Iterable[tuple]:
+        """Return the cells that can hold keys within epsilon of the vector."""
+        eps = self.epsilon
+        ranges = [
+            range(math.floor((c - eps) / eps), math.floor((c + eps) / eps) + 1)
+            for c in vector
+        ]
+        if math.prod(map(len, ranges)) > len(self._cells):
+            return [
+                cell
+                for cell in self._cells
+                if len(cell) == len(ranges)
+                and all(i in r for i, r in zip(cell, ranges))
+            ]
+        return product(*ranges)
+
+    def _find(self, vector: Vector) -> Union[list, None]:
+        """Return the closest stored [key, value] pair within epsilon or None."""
+        if not isinstance(vector, Vector):
+            raise TypeError("Keys must be Vector objects.")
+        best, best_distance = None, self.epsilon
+        for cell in self._neighbour_cells(vector):
+            for entry in self._cells.get(cell, ()):
+                distance = vector.distance_to(entry[0])
+                if distance <= best_distance:
+                    best, best_distance = entry, distance
+        return best
+
+    def _insert(self, vector: Vector, value: Any) -> None:
+        self._cells.setdefault(self._cell(vector), []).append([vector, value])
+        self._len += 1
+
+    def _delete(self, entry: list) -> None:
+        cell = self._cell(entry[0])
+        entries = self._cells[cell]
+        # Compare by identity: list.remove would use the magnitude-based ==.
+        del entries[next(i for i, e in enumerate(entries) if e is entry)]
+        if not entries:
+            del self._cells[cell]
+        self._len -= 1
+
+    def _entries(self) -> Iterator[list]:
+        for entries in self._cells.values():
+            yield from entries
+
+    def __len__(self) -> int:
+        return self._len
+
+
+class ToleranceSet(_ToleranceGrid):
+    """
+    A set of vectors that treats vectors within epsilon as the same element.
+
+    Adding a vector that lies within `distance_to` epsilon of a stored
+    vector keeps the stored one, so the set deduplicates noisy vectors in
+    O(n) expected time instead of comparing all pairs. Closeness is not
+    transitive: which vectors survive depends on the insertion order.
+
+    Example usage:
+        >>> readings = [Vector([1.0, 2.0]), Vector([1.0004, 2.0]), Vector([5, 5])]
+        >>> unique = ToleranceSet(readings, epsilon=1e-3)
+        >>> len(unique)
+        2
+        >>> Vector([0.9999, 2.0001]) in unique
+        True
+        >>> unique.find(Vector([1.0003, 2.0]))
+        Vector([1.0, 2.0])
+
+    Epsilon is absolute, `==` is relative to the magnitude:
+        >>> big, shifted = Vector([1e12, 0]), Vector([1e12 + 1, 0])
+        >>> big == shifted, shifted in ToleranceSet([big])
+        (True, False)
+        >>> shifted in ToleranceSet([big], epsilon=1e12 * 1e-9)
+        True
+    """
+
+    def __init__(
+        self, vectors: Iterable[Vector] = (), epsilon: float = 1e-9
+    ) -> None:
+        """
+        Create the set and add the given vectors.
+
+        >>> ToleranceSet(epsilon=0)
+        Traceback (most recent call last):
+        ValueError: epsilon must be positive.
+        """
+        super().__init__(epsilon)
+        for vector in vectors:
+            self.add(vector)
+
+    def __repr__(self) -> str:
+        vectors = ", ".join(repr(v) for v in self)
+        return f"ToleranceSet([{vectors}], epsilon={self.epsilon!r})"
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (entry[0] for entry in self._entries())
+
+    def __contains__(self, vector: Vector) -> bool:
+        return self._find(vector) is not None
+
+    def find(self, vector: Vector) -> Union[Vector, None]:
+        """
+        Return the stored vector closest to the given one, or None.
+
+        >>> ToleranceSet([Vector([1, 1])], epsilon=0.5).find(Vector([2, 2])) is None
+        True
+        """
+        entry = self._find(vector)
+        return None if entry is None else entry[0]
+
+    def add(self, vector: Vector) -> None:
+        """
+        Add the vector unless a vector within epsilon is already stored.
+
+        >>> s = ToleranceSet(epsilon=0.1)
+        >>> for v in [Vector([0, 0]), Vector([0.05, 0]), Vector([0, 0, 0])]:
+        ...     s.add(v)
+        >>> s
+        ToleranceSet([Vector([0.0, 0.0]), Vector([0.0, 0.0, 0.0])], epsilon=0.1)
+        """
+        if self._find(vector) is None:
+            self._insert(vector, None)
+
+    def discard(self, vector: Vector) -> None:
+        """Remove the stored vector closest to the given one, if there is one."""
+        entry = self._find(vector)
+        if entry is not None:
+            self._delete(entry)
+
+    def remove(self, vector: Vector) -> None:
+        """
+        Remove the stored vector closest to the given one.
+
+        >>> s = ToleranceSet([Vector([1, 0])], epsilon=0.1)
+        >>> s.remove(Vector([1.01, 0]))
+        >>> s.remove(Vector([1, 0]))
+        Traceback (most recent call last):
+        KeyError: Vector([1.0, 0.0])
+        """
+        entry = self._find(vector)
+        if entry is None:
+            raise KeyError(vector)
+        self._delete(entry)
+
+
+class ToleranceDict(_ToleranceGrid, MutableMapping):
+    """
+    A dict with vector keys that matches keys within epsilon.
+
+    A lookup returns the value of the stored key closest to the given
+    vector, as long as it lies within `distance_to` epsilon (an absolute
+    distance, see `_ToleranceGrid`). Assigning to a vector close to an
+    existing key overwrites the value of that key.
+
+    Example usage:
+        >>> counts = ToleranceDict(epsilon=0.01)
+        >>> for reading in [Vector([1, 2]), Vector([1.001, 2]), Vector([3, 4])]:
+        ...     counts[reading] = counts.get(reading, 0) + 1
+        >>> counts
+        ToleranceDict({Vector([1.0, 2.0]): 2, Vector([3.0, 4.0]): 1}, epsilon=0.01)
+        >>> counts[Vector([2.999, 4.0])]
+        1
+    """
+
+    def __init__(self, items: Any = (), epsilon: float = 1e-9) -> None:
+        """Create the dict and insert the given mapping or (key, value) pairs."""
+        super().__init__(epsilon)
+        self.update(items)
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key!r}: {value!r}" for key, value in self.items())
+        return f"ToleranceDict({{{items}}}, epsilon={self.epsilon!r})"
+
+    def __iter__(self) -> Iterator[Vector]:
+        return (entry[0] for entry in self._entries())
+
+    def __getitem__(self, vector: Vector) -> Any:
+        """
+        Return the value of the closest key within epsilon.
+
+        >>> ToleranceDict({Vector([0]): "a"}, epsilon=0.1)[Vector([0.5])]
+        Traceback (most recent call last):
+        KeyError: Vector([0.5])
+        """
+        entry = self._find(vector)
+        if entry is None:
+            raise KeyError(vector)
+        return entry[1]
+
+    def __setitem__(self, vector: Vector, value: Any) -> None:
+        entry = self._find(vector)
+        if entry is None:
+            self._insert(vector, value)
+        else:
+            entry[1] = value
+
+    def __delitem__(self, vector: Vector) -> None:
+        """
+        Delete the closest key within epsilon.
+
+        >>> d = ToleranceDict({Vector([0]): "a"}, epsilon=0.1)
+        >>> del d[Vector([0.05])]
+        >>> len(d)
+        0
+        """
+        entry = self._find(vector)
+        if entry is None:
+            raise KeyError(vector)
+        self._delete(entry)
+
+    def find(self, vector: Vector) -> Union[Vector, None]:
+        """Return the stored key closest to the given vector, or None."""
+        entry = self._find(vector)
+        return None if entry is None else entry[0]
@@ -160,6 +160,28 @@ class Vector(tuple):
         """
         raise TypeError("Vector objects are immutable and cannot be modified.")
 
+    def __array__(self, dtype=None, copy=None):
+        """
+        Convert the vector to a NumPy ndarray.
+        The components are copied, because a tuple cannot share its memory,
+        so `copy=False` raises a ValueError as required by NumPy 2.
+
+        >>> import numpy as np
+        >>> np.asarray(Vector([1.0, 2.0, 3.0]))
+        array([1., 2., 3.])
+        >>> np.array(Vector([1.0, 2.0]), copy=False)
+        Traceback (most recent call last):
+        ValueError: A Vector cannot be converted to an array without a copy.
+        """
+        import numpy as np
+
+        if copy is False:
+            raise ValueError(
+                "A Vector cannot be converted to an array without a copy."
+            )
+
+        return np.array(tuple(self), dtype=np.float64 if dtype is None else dtype)
+
     # container protocol methods
     # def __len__(self) -> int:
     #     """
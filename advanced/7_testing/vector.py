@@ -152,6 +152,28 @@ class Vector:
         """
         raise TypeError("Vector objects are immutable and cannot be modified.")
 
+    def __array__(self, dtype=None, copy=None):
+        """
+        Convert the vector to a NumPy ndarray.
+        The components are copied, because a tuple cannot share its memory,
+        so `copy=False` raises a ValueError as required by NumPy 2.
+
+        >>> import numpy as np
+        >>> np.asarray(Vector([1.0, 2.0, 3.0]))
+        array([1., 2., 3.])
+        >>> np.array(Vector([1.0, 2.0]), copy=False)
+        Traceback (most recent call last):
+        ValueError: A Vector cannot be converted to an array without a copy.
+        """
+        import numpy as np
+
+        if copy is False:
+            raise ValueError(
+                "A Vector cannot be converted to an array without a copy."
+            )
+
+        return np.array(self._components, dtype=np.float64 if dtype is None else dtype)
+
     # container protocol methods
     def __len__(self) -> int:
         """
@@ -256,10 +278,32 @@ class Vector:
         True
         >>> v2 < v1
         False
+        >>> sorted([Vector([3.0, 4.0]), Vector([1.0]), Vector([0.0, 2.0])])
+        [Vector([1.0]), Vector([0.0, 2.0]), Vector([3.0, 4.0])]
         """
         if not isinstance(other, Vector):
             return NotImplemented
-        return abs(self) < abs(other)
+        return self._squared_norm() < other._squared_norm()
+
+    def _squared_norm(self) -> float:
+        """
+        Return the squared magnitude, computed once and then cached.
+
+        Vectors are immutable, so the cached value can never become stale.
+        Comparing squared magnitudes orders vectors like their magnitudes,
+        without taking any square root.
+
+        >>> v = Vector([3.0, 4.0])
+        >>> v._squared_norm()
+        25.0
+        >>> v._norm2
+        25.0
+        """
+        try:
+            return self._norm2
+        except AttributeError:
+            self._norm2 = sum(c * c for c in self._components)
+            return self._norm2
 
     def __hash__(self) -> int:
         """
@@ -301,7 +345,7 @@ class Vector:
         >>> abs(Vector([1.0, 2.0, 2.0]))
         3.0
         """
-        return math.sqrt(sum(c**2 for c in self))
+        return math.sqrt(self._squared_norm())
 
     def __add__(self, other: "Vector") -> "Vector":
         """